@@ -10,11 +10,39 @@ def create_app():
     # 설정 로드
     app.config.from_object('backend.config.Config')
     
+    # JSON 인코딩 (orjson이 설치되어 있으면 사용)
+    from backend.utils.json_provider import init_json_provider
+    init_json_provider(app)
+    
+    # 응답 압축 (brotli / gzip)
+    from backend.utils.compression import init_compression
+    init_compression(app)
+    
     # 확장 초기화
     db.init_app(app)
     cors.init_app(app)
     executor.init_app(app)
     
+    # 감사 로그 비동기 기록기 초기화
+    from backend.services.audit_writer import audit_writer
+    audit_writer.init_app(app)
+    
+    # 주식 목록 캐시 커밋 후 무효화 등록
+    from backend.services.stock_cache import stock_cache
+    stock_cache.init_app(app)
+    
+    # 거래 데이터 조회 결과 캐시 초기화
+    from backend.services.result_cache import result_cache
+    result_cache.init_app(app)
+    
+    # 엔드포인트 리소스 클래스(statement_timeout, 동시 실행 제한) 초기화
+    from backend.utils.workload import workload
+    workload.init_app(app)
+    
+    # backend 로거의 경고/샘플링된 정보 로그를 system_log에 저장
+    from backend.utils.db_logging import setup_database_logging
+    setup_database_logging(app)
+    
     # 블루프린트 등록
     from backend.views.user import user_bp
     from backend.views.sample import sample_bp
@@ -35,6 +63,25 @@ def create_app():
     # 데이터베이스 테이블 생성
     with app.app_context():
         db.create_all()
+        
+        # 히스토리 월별 파티션 미리 생성 (파티션 테이블로 변환된 경우에만)
+        from backend.services.history_partition import HistoryPartitionService
+        try:
+            for table in HistoryPartitionService.TABLES:
+                HistoryPartitionService.ensure_partitions(table)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.warning(f"히스토리 파티션 생성 실패: {e}")
+        
+        # 집계 테이블 도입 전 히스토리가 통계에 빠지지 않도록 비어 있으면 한 번 생성
+        from backend.services.history_rollup import HistoryRollupService
+        try:
+            HistoryRollupService.backfill_if_empty()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.warning(f"히스토리 집계 생성 실패: {e}")
     
     return app
 
@@ -29,6 +29,26 @@ class Config:
         }
     }
     
+    # 엔드포인트 리소스 클래스 (utils/workload.py): 무거운 조회가 연결 풀을 독점하지 않도록 클래스별로
+    # statement_timeout, 동시 실행 수, 대기열 길이를 제한하고 초과 시 503 + Retry-After로 바로 응답
+    # (동시 실행 수 합계가 pool_size + max_overflow보다 작아야 수집기 쓰기에 쓸 연결이 남음)
+    RESOURCE_CLASSES = {
+        'interactive': {                 # 단일 종목 조회 (인덱스로 바로 찾는 짧은 쿼리)
+            'statement_timeout_ms': 5000,
+            'max_concurrent': 6,
+            'max_queue': 20,
+            'queue_timeout': 2,
+            'retry_after': 1,
+        },
+        'heavy': {                       # 전체 목록, 날짜 범위, 다중 종목, 검색
+            'statement_timeout_ms': 30000,
+            'max_concurrent': 3,
+            'max_queue': 6,
+            'queue_timeout': 5,
+            'retry_after': 5,
+        },
+    }
+    
     # 장시간 배치 처리를 위한 설정
     BATCH_PROCESSING = {
         'max_workers': 2,                # 최대 워커 수 (메모리 절약)
@@ -37,7 +57,96 @@ class Config:
         'max_memory_usage': 80,          # 최대 메모리 사용률 (%)
         'auto_restart_on_failure': True, # 실패 시 자동 재시작
     }
-    
+
+    # DB 장애/지연 시 수집 데이터를 임시 기록하는 로컬 스풀 설정
+    TRADING_SPOOL = {
+        'directory': os.environ.get(
+            'TRADING_SPOOL_DIR',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spool')
+        ),
+        'segment_max_bytes': 8 * 1024 * 1024,  # 세그먼트 파일 최대 크기 (8MB)
+        'fsync': True,                   # 레코드마다 디스크 동기화
+        'degraded_cooldown': 60,         # 장애 감지 후 DB 저장을 건너뛸 시간 (초)
+        'orphan_after': 3600,            # 이 시간(초) 동안 바뀌지 않은 기록 중 / 재생 중 세그먼트는 버려진 것으로 보고 재생
+        'slow_query_threshold': 5.0,     # 연결 확인이 이 시간(초)보다 느리면 장애로 간주
+        'replay_interval': 30,           # DB 복구 확인 및 재생 간격 (초)
+    }
+
+    # 감사 로그(DataHistory/SystemLog) 비동기 일괄 기록 설정
+    AUDIT_WRITER = {
+        'enabled': os.environ.get('AUDIT_WRITER_ENABLED', 'true').lower() == 'true',
+        'max_queue_size': 10000,         # 메모리 큐 최대 크기
+        'batch_size': 500,               # 한 번에 INSERT할 최대 행 수
+        'flush_interval_ms': 500,        # 최대 플러시 간격 (밀리초)
+        'overflow_policy': 'drop',       # 큐가 가득 찼을 때 정책 (drop: 버림, block: 대기)
+        'block_timeout': 1.0,            # block 정책에서 최대 대기 시간 (초)
+    }
+
+    # 오래된 히스토리 콜드 스토리지 아카이브 설정
+    HISTORY_ARCHIVE = {
+        'directory': os.environ.get(
+            'HISTORY_ARCHIVE_DIR',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archive')
+        ),
+        'archive_after_days': int(os.environ.get('HISTORY_ARCHIVE_AFTER_DAYS', '90')),  # 이 일수가 지난 행을 아카이브
+        'compress_level': 6,             # gzip 압축 레벨 (1-9)
+    }
+
+    # 주식 목록(stock_list) 프로세스 내 캐시 설정
+    STOCK_CACHE = {
+        'enabled': os.environ.get('STOCK_CACHE_ENABLED', 'true').lower() == 'true',
+        'ttl': 300,                      # 스냅샷 최대 유지 시간 (초)
+        'version_check_interval': 5,     # 다른 프로세스의 변경(data_version) 확인 간격 (초)
+    }
+
+    # 거래 데이터 조회 결과 캐시 설정 (memory: 워커별 LRU, redis: 워커 간 공유 - redis 패키지 필요, none: 사용 안 함)
+    RESULT_CACHE = {
+        'backend': os.environ.get('RESULT_CACHE_BACKEND', 'memory'),
+        'url': os.environ.get('RESULT_CACHE_URL', 'redis://127.0.0.1:6379/0'),
+        'default_ttl': 300,              # 결과 유지 시간 (초, 변경 시에는 data_version 버전으로 즉시 무효화)
+        'max_entries': 512,              # memory 저장소 최대 항목 수
+        'max_bytes': 64 * 1024 * 1024,   # memory 저장소 최대 전체 크기 (바이트)
+        'max_rows': 5000,                # 이보다 행이 많은 결과는 저장하지 않음 (시장 전체 조회 등)
+        'max_entry_bytes': 1024 * 1024,  # 직렬화 결과가 이보다 크면 저장하지 않음
+        'key_prefix': 'stock_analysis:', # 공유 저장소 키 접두사
+        'socket_timeout': 0.5,           # redis 연결/응답 제한 시간 (초, 실패 시 캐시 없이 조회)
+    }
+
+    # 동일 조회 합치기(single-flight) 설정: 같은 인자의 동시 조회는 DB 쿼리 하나의 결과를 함께 사용
+    SINGLE_FLIGHT = {
+        'enabled': os.environ.get('SINGLE_FLIGHT_ENABLED', 'true').lower() == 'true',
+        'wait_timeout': 30,              # 대기자가 리더의 결과를 기다리는 최대 시간 (초, 초과 시 직접 조회)
+    }
+
+    # jsonify 응답 JSON 인코더 (auto: orjson이 설치되어 있으면 사용, orjson, json: 표준 json 모듈)
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'auto')
+
+    # 응답 압축 설정 (Accept-Encoding 협상, brotli는 brotli 패키지가 설치된 경우에만 사용)
+    COMPRESSION = {
+        'enabled': os.environ.get('COMPRESSION_ENABLED', 'true').lower() == 'true',
+        'min_size': 1024,                # 이 크기(바이트) 미만 응답은 압축하지 않음
+        'gzip_level': 6,                 # gzip 압축 레벨 (1-9)
+        'brotli': True,                  # brotli 사용 여부
+        'brotli_quality': 4,             # brotli 품질 (0-11, 높을수록 느림)
+        'cache_max_bytes': 32 * 1024 * 1024,  # 압축 결과 캐시 최대 크기 (32MB)
+    }
+
+    # /history/stats, /history/summary 응답 캐시 유지 시간 (초, 0이면 캐시 안 함)
+    HISTORY_STATS_CACHE_TTL = 10
+
+    # backend 로거 -> system_log 저장 설정 (WARNING 이상 전체 + INFO 샘플링)
+    DB_LOGGING = {
+        'enabled': os.environ.get('DB_LOGGING_ENABLED', 'true').lower() == 'true',
+        'queue_size': 10000,             # 로그 레코드 큐 최대 크기 (가득 차면 버림)
+        'info_sample_rate': float(os.environ.get('DB_LOGGING_INFO_SAMPLE_RATE', '0.01')),  # INFO 저장 비율
+        'default_rate_limit': 60,        # 카테고리별 분당 최대 저장 건수
+        'rate_limits': {                 # 카테고리별 개별 제한
+            'COLLECTOR': 120,
+            'API': 60,
+            'DATABASE': 60,
+        },
+    }
+
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     # 테스트 모드 설정
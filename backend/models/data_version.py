@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 버전 카운터 모델
+테이블 / 종목 단위로 데이터가 바뀔 때마다 증가하는 버전 번호 (조건부 응답 ETag 생성용)
+"""
+from backend.extensions import db
+from datetime import datetime
+from typing import Dict, Any
+
+
+class DataVersion(db.Model):
+    """
+    데이터 버전 모델
+
+    Attributes:
+        table_name (str): 테이블명 (stock_list, stock_investor_trading)
+        scope_key (str): 범위 키 ('*': 테이블 전체, 그 외: 주식 코드)
+        version (int): 버전 번호 (변경 시마다 1 증가)
+        updated_at (datetime): 갱신 시간
+    """
+    __tablename__ = 'data_version'
+
+    table_name = db.Column(db.String(50), primary_key=True, comment='테이블명')
+    scope_key = db.Column(db.String(20), primary_key=True, comment="범위 키 ('*' 또는 주식 코드)")
+    version = db.Column(db.BigInteger, nullable=False, default=0, comment='버전 번호')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, comment='갱신 시간')
+
+    def __repr__(self) -> str:
+        """객체 문자열 표현"""
+        return f'<DataVersion {self.table_name}:{self.scope_key} v{self.version}>'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        DataVersion 객체를 딕셔너리로 변환 (API 응답용)
+
+        Returns:
+            Dict[str, Any]: 데이터 버전 정보 딕셔너리
+        """
+        return {
+            'table_name': self.table_name,
+            'scope_key': self.scope_key,
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
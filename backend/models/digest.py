@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+종목-월 단위 거래 데이터 다이제스트 모델
+저장된 거래 데이터가 원본과 일치하는지 저렴하게 비교하기 위한 요약 정보
+"""
+from backend.extensions import db
+from datetime import datetime
+from typing import Dict, Any
+
+
+class StockMonthDigest(db.Model):
+    """
+    종목-월 다이제스트 모델
+
+    Attributes:
+        id (int): 고유 ID
+        stock_code (str): 주식 코드
+        year_month (str): 연월 (YYYY-MM)
+        row_count (int): 해당 월의 저장된 거래일 수
+        digest (str): 해당 월 거래 데이터의 MD5 해시
+        updated_at (datetime): 갱신 시간
+    """
+    __tablename__ = 'stock_month_digest'
+    __table_args__ = (
+        db.UniqueConstraint('stock_code', 'year_month', name='uk_stock_month_digest_stock_month'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True, comment='다이제스트 고유 ID')
+    stock_code = db.Column(db.String(20), nullable=False, comment='주식 코드')
+    year_month = db.Column(db.String(7), nullable=False, comment='연월 (YYYY-MM)')
+    row_count = db.Column(db.Integer, nullable=False, default=0, comment='거래일 수')
+    digest = db.Column(db.String(32), nullable=False, comment='거래 데이터 MD5 해시')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, comment='갱신 시간')
+
+    def __repr__(self) -> str:
+        """객체 문자열 표현"""
+        return f'<StockMonthDigest {self.stock_code} {self.year_month}>'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        StockMonthDigest 객체를 딕셔너리로 변환 (API 응답용)
+
+        Returns:
+            Dict[str, Any]: 다이제스트 정보 딕셔너리
+        """
+        return {
+            'id': self.id,
+            'stock_code': self.stock_code,
+            'year_month': self.year_month,
+            'row_count': self.row_count,
+            'digest': self.digest,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -10,8 +10,14 @@ import json
 class DataHistory(db.Model):
     """데이터 변경 히스토리 모델"""
     __tablename__ = 'data_history'
+    __table_args__ = (
+        db.Index('idx_data_history_created_at', 'created_at'),
+        db.Index('idx_data_history_table_created', 'table_name', 'created_at'),
+        db.Index('idx_data_history_created_id', 'created_at', 'id'),
+    )
     
-    id = db.Column(db.Integer, primary_key=True)
+    # 월별 파티션 테이블의 기본 키는 파티션 키(created_at)를 포함해야 함
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     table_name = db.Column(db.String(50), nullable=False, comment='테이블명')
     record_id = db.Column(db.Integer, nullable=True, comment='레코드 ID')
     action = db.Column(db.String(20), nullable=False, comment='작업 유형 (CREATE, READ, UPDATE, DELETE)')
@@ -22,7 +28,7 @@ class DataHistory(db.Model):
     user_id = db.Column(db.Integer, nullable=True, comment='사용자 ID')
     ip_address = db.Column(db.String(45), nullable=True, comment='IP 주소')
     user_agent = db.Column(db.Text, nullable=True, comment='사용자 에이전트')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, comment='생성 시간')
+    created_at = db.Column(db.DateTime, primary_key=True, default=datetime.utcnow, comment='생성 시간')
     
     def __repr__(self):
         return f'<DataHistory {self.id}: {self.action} on {self.table_name}>'
@@ -47,15 +53,22 @@ class DataHistory(db.Model):
 class SystemLog(db.Model):
     """시스템 로그 모델"""
     __tablename__ = 'system_log'
+    __table_args__ = (
+        db.Index('idx_system_log_created_at', 'created_at'),
+        db.Index('idx_system_log_category_created', 'category', 'created_at'),
+        db.Index('idx_system_log_level_created', 'level', 'created_at'),
+        db.Index('idx_system_log_created_id', 'created_at', 'id'),
+    )
     
-    id = db.Column(db.Integer, primary_key=True)
+    # 월별 파티션 테이블의 기본 키는 파티션 키(created_at)를 포함해야 함
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     level = db.Column(db.String(20), nullable=False, comment='로그 레벨 (INFO, WARNING, ERROR)')
     category = db.Column(db.String(50), nullable=False, comment='카테고리 (API, DATABASE, COLLECTOR, etc.)')
     message = db.Column(db.Text, nullable=False, comment='로그 메시지')
     details = db.Column(db.Text, nullable=True, comment='상세 정보 (JSON)')
     user_id = db.Column(db.Integer, nullable=True, comment='사용자 ID')
     ip_address = db.Column(db.String(45), nullable=True, comment='IP 주소')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, comment='생성 시간')
+    created_at = db.Column(db.DateTime, primary_key=True, default=datetime.utcnow, comment='생성 시간')
     
     def __repr__(self):
         return f'<SystemLog {self.id}: {self.level} - {self.message}>'
@@ -71,4 +84,72 @@ class SystemLog(db.Model):
             'user_id': self.user_id,
             'ip_address': self.ip_address,
             'created_at': self.created_at.isoformat() if self.created_at else None
-        } 
\ No newline at end of file
+        }
+
+class HistoryRollup(db.Model):
+    """
+    히스토리 시간별 집계 모델
+    감사 로그 기록기가 DataHistory/SystemLog 저장과 같은 트랜잭션에서 증가시킵니다.
+    데이터 히스토리는 level이 빈 문자열, 시스템 로그는 table_name='system_log', action='LOG'입니다.
+    """
+    __tablename__ = 'history_rollup'
+    __table_args__ = (
+        db.UniqueConstraint('hour', 'table_name', 'action', 'level', name='uk_history_rollup_key'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    hour = db.Column(db.DateTime, nullable=False, comment='집계 시간 (UTC, 시 단위 절삭)')
+    table_name = db.Column(db.String(50), nullable=False, default='', comment='테이블명')
+    action = db.Column(db.String(20), nullable=False, default='', comment='작업 유형')
+    level = db.Column(db.String(20), nullable=False, default='', comment='로그 레벨')
+    event_count = db.Column(db.BigInteger, nullable=False, default=0, comment='건수')
+    
+    def __repr__(self):
+        return f'<HistoryRollup {self.hour} {self.table_name} {self.action} {self.level}: {self.event_count}>'
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'hour': self.hour.isoformat() if self.hour else None,
+            'table_name': self.table_name,
+            'action': self.action,
+            'level': self.level,
+            'event_count': self.event_count
+        }
+
+class HistoryArchive(db.Model):
+    """
+    히스토리 아카이브 매니페스트 모델
+    콜드 스토리지로 옮긴 DataHistory/SystemLog 행의 압축 파일 목록입니다.
+    """
+    __tablename__ = 'history_archive'
+    __table_args__ = (
+        db.Index('idx_history_archive_table_range', 'table_name', 'min_created_at', 'max_created_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(50), nullable=False, comment='원본 테이블명 (data_history, system_log)')
+    year_month = db.Column(db.String(7), nullable=False, comment='데이터 연월 (YYYY-MM)')
+    file_name = db.Column(db.String(255), nullable=False, unique=True, comment='아카이브 파일명')
+    row_count = db.Column(db.Integer, nullable=False, comment='행 수')
+    min_created_at = db.Column(db.DateTime, nullable=False, comment='가장 오래된 행의 생성 시간')
+    max_created_at = db.Column(db.DateTime, nullable=False, comment='가장 최근 행의 생성 시간')
+    size_bytes = db.Column(db.BigInteger, nullable=False, default=0, comment='파일 크기 (바이트)')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, comment='아카이브 생성 시간')
+    
+    def __repr__(self):
+        return f'<HistoryArchive {self.table_name} {self.year_month}: {self.file_name}>'
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'table_name': self.table_name,
+            'year_month': self.year_month,
+            'file_name': self.file_name,
+            'row_count': self.row_count,
+            'min_created_at': self.min_created_at.isoformat() if self.min_created_at else None,
+            'max_created_at': self.max_created_at.isoformat() if self.max_created_at else None,
+            'size_bytes': self.size_bytes,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -36,6 +36,9 @@ def apply_basic_indexes(conn):
         "CREATE INDEX IF NOT EXISTS idx_trading_date_range ON stock_investor_trading(trade_date);",
         "CREATE INDEX IF NOT EXISTS idx_trading_date_close_price ON stock_investor_trading(trade_date, close_price);",
         
+        # 키셋 페이지네이션 정렬 키 (trade_date, stock_code, id)
+        "CREATE INDEX IF NOT EXISTS idx_trading_date_stock_id ON stock_investor_trading(trade_date, stock_code, id);",
+        
         # 종목별 날짜 범위 조회 최적화
         "CREATE INDEX IF NOT EXISTS idx_trading_stock_date_range ON stock_investor_trading(stock_code, trade_date);",
         "CREATE INDEX IF NOT EXISTS idx_trading_stock_date_close ON stock_investor_trading(stock_code, trade_date, close_price);",
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+투자자별 매매동향 파일 일괄 적재 스크립트
+KRX/벤더 CSV·Parquet 덤프를 읽어 stock_investor_trading 테이블에 저장
+
+사용 예:
+    python backend/scripts/import_investor_flow.py /data/krx/2019 /data/krx/2020 --workers 4
+    python backend/scripts/import_investor_flow.py dump.parquet --dry-run
+"""
+import sys
+import os
+import argparse
+import logging
+from datetime import datetime
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.app import create_app
+from backend.services.investor_flow_importer import InvestorFlowImporter
+
+
+def setup_logging():
+    """로깅 설정"""
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler(f'investor_flow_import_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+        ]
+    )
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='투자자별 매매동향 파일 일괄 적재')
+    parser.add_argument('paths', nargs='+', help='CSV/Parquet 파일 또는 디렉터리 경로')
+    parser.add_argument('--workers', type=int, default=2, help='파싱 워커 프로세스 수 (기본값: 2)')
+    parser.add_argument('--skip-accum', action='store_true', help='적재 후 누적값 재계산 생략')
+    parser.add_argument('--dry-run', action='store_true', help='파싱만 수행하고 DB에 저장하지 않음')
+    return parser.parse_args()
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_args()
+
+    print("="*60)
+    print("투자자별 매매동향 파일 적재 시작")
+    print("="*60)
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    try:
+        app = create_app()
+
+        with app.app_context():
+            results = InvestorFlowImporter.import_paths(
+                args.paths,
+                workers=args.workers,
+                recalculate_accum=not args.skip_accum,
+                dry_run=args.dry_run
+            )
+
+            print("\n" + "="*60)
+            print("파일 적재 결과" + (" (dry-run)" if args.dry_run else ""))
+            print("="*60)
+            print(f"전체 파일 수: {results['total_files']}")
+            print(f"처리된 파일: {results['processed_files']}")
+            print(f"파싱된 행: {results['parsed_rows']}")
+            print(f"건너뛴 행: {results['skipped_rows']}")
+            print(f"저장된 행: {results['inserted_rows']}")
+            print(f"영향받은 종목: {len(results['affected_stocks'])}")
+
+            if results['failed_files']:
+                print(f"\n실패 파일 ({len(results['failed_files'])}개):")
+                for i, failed in enumerate(results['failed_files'], 1):
+                    print(f"  {i:2d}. {failed}")
+
+            if results['accum_failed']:
+                print(f"\n누적값 재계산 실패 종목: {', '.join(results['accum_failed'])}")
+
+            print("="*60)
+            logger.info("파일 적재 프로세스 완료")
+
+            if results['failed_files']:
+                sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"파일 적재 중 치명적 오류: {e}")
+        print(f"\n❌ 치명적 오류 발생: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
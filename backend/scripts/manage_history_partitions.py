@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+히스토리 테이블 파티션 관리 스크립트
+data_history / system_log 테이블을 월별 파티션으로 변환하고, 보존 기간 적용 및 아카이브를 수행합니다.
+
+사용 예:
+    python backend/scripts/manage_history_partitions.py convert
+    python backend/scripts/manage_history_partitions.py ensure --months-ahead 3
+    python backend/scripts/manage_history_partitions.py retention --days 90
+    python backend/scripts/manage_history_partitions.py archive --days 90
+    python backend/scripts/manage_history_partitions.py list
+"""
+import sys
+import os
+import argparse
+import logging
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.app import create_app
+from backend.extensions import db
+from backend.services.history_partition import HistoryPartitionService
+from backend.services.history_archive import HistoryArchiveService
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='히스토리 테이블 파티션 관리')
+    parser.add_argument('command', choices=['convert', 'ensure', 'retention', 'archive', 'list'], help='실행할 작업')
+    parser.add_argument('--table', choices=list(HistoryPartitionService.TABLES), help='대상 테이블 (기본값: 전체)')
+    parser.add_argument('--months-ahead', type=int, default=HistoryPartitionService.MONTHS_AHEAD,
+                        help=f'미리 만들 미래 파티션 수 (기본값: {HistoryPartitionService.MONTHS_AHEAD})')
+    parser.add_argument('--days', type=int, default=90, help='retention/archive: 보존 일수 (기본값: 90)')
+    return parser.parse_args()
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logger = logging.getLogger(__name__)
+
+    tables = [args.table] if args.table else list(HistoryPartitionService.TABLES)
+
+    try:
+        app = create_app()
+
+        with app.app_context():
+            for table in tables:
+                if args.command == 'convert':
+                    result = HistoryPartitionService.convert_to_partitioned(table, args.months_ahead)
+                    if result['converted']:
+                        print(f"{table}: 파티션 {result['partitions']}개 생성, {result['moved_rows']}건 이동")
+                    else:
+                        print(f"{table}: 이미 파티션 테이블입니다")
+
+                elif args.command == 'ensure':
+                    count = HistoryPartitionService.ensure_partitions(table, args.months_ahead)
+                    db.session.commit()
+                    print(f"{table}: 파티션 {count}개 확인" if count else f"{table}: 파티션 테이블이 아닙니다")
+
+                elif args.command == 'retention':
+                    cutoff = datetime.utcnow() - timedelta(days=args.days)
+                    result = HistoryPartitionService.apply_retention(table, cutoff)
+                    db.session.commit()
+                    print(f"{table}: 파티션 {len(result['dropped_partitions'])}개 제거, 약 {result['deleted_rows']}건 삭제")
+
+                elif args.command == 'archive':
+                    cutoff = datetime.utcnow() - timedelta(days=args.days)
+                    result = HistoryArchiveService.archive(table, cutoff)
+                    print(f"{table}: 아카이브 파일 {len(result['archives'])}개, {result['archived_rows']}건 이동")
+
+                else:
+                    for partition in HistoryPartitionService.list_partitions(table):
+                        print(f"{partition['name']:30s} {partition['year_month'] or '-':8s} {partition['estimated_rows']:>12,d}")
+
+    except Exception as e:
+        logger.error(f"파티션 관리 중 오류: {e}")
+        print(f"\n❌ 오류 발생: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 감사 로그 기록기
+HistoryService가 남기는 DataHistory / SystemLog 행을 메모리 큐에 모았다가
+백그라운드 스레드에서 다중 행 INSERT로 일괄 저장합니다.
+
+호출자의 세션과 트랜잭션에 감사 로그가 섞이지 않으며, CRUD 호출이나 수집 종목마다
+발생하던 추가 커밋이 사라집니다.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.extensions import db
+from backend.services.history_rollup import HistoryRollupService
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriter:
+    """
+    버퍼링된 감사 로그 기록기
+
+    큐가 가득 찼을 때의 정책:
+        drop: 새 항목을 버리고 dropped 카운터를 증가 (호출자는 대기하지 않음)
+        block: 최대 block_timeout 초 동안 대기한 뒤에도 가득 차 있으면 버림
+    """
+
+    OVERFLOW_POLICIES = ('drop', 'block')
+
+    def __init__(self):
+        self.app = None
+        self.enabled = False
+        self.max_queue_size = 10000
+        self.batch_size = 500
+        self.flush_interval = 0.5
+        self.overflow_policy = 'drop'
+        self.block_timeout = 1.0
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {'enqueued': 0, 'written': 0, 'dropped': 0, 'failed': 0, 'batches': 0}
+
+    def init_app(self, app) -> None:
+        """
+        Flask 앱 설정(AUDIT_WRITER)으로 기록기 초기화
+
+        Args:
+            app: Flask 애플리케이션 객체
+        """
+        settings = app.config.get('AUDIT_WRITER', {})
+        self.app = app
+        self.enabled = settings.get('enabled', True)
+        self.max_queue_size = settings.get('max_queue_size', self.max_queue_size)
+        self.batch_size = settings.get('batch_size', self.batch_size)
+        self.flush_interval = settings.get('flush_interval_ms', 500) / 1000.0
+        self.overflow_policy = settings.get('overflow_policy', self.overflow_policy)
+        self.block_timeout = settings.get('block_timeout', self.block_timeout)
+
+        if self.overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"지원하지 않는 감사 로그 큐 정책입니다: {self.overflow_policy} ({', '.join(self.OVERFLOW_POLICIES)})"
+            )
+
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        app.extensions['audit_writer'] = self
+        atexit.register(self.shutdown)
+
+    def _ensure_started(self) -> None:
+        """백그라운드 플러셔 스레드 지연 시작 (포크된 워커 프로세스에서도 동작하도록)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._thread.start()
+
+    def _count(self, name: str, amount: int = 1) -> int:
+        """통계 카운터 증가 (요청 스레드와 플러셔 스레드가 함께 갱신), 증가 후 값 반환"""
+        with self._stats_lock:
+            self._stats[name] += amount
+            return self._stats[name]
+
+    def submit(self, model, values: Dict[str, Any]) -> bool:
+        """
+        감사 로그 행을 큐에 추가
+
+        Args:
+            model: DataHistory 또는 SystemLog 모델 클래스
+            values (Dict[str, Any]): 컬럼 값
+
+        Returns:
+            bool: 큐에 추가되었는지 여부 (비활성화 상태이거나 가득 차서 버려지면 False)
+        """
+        if not self.enabled or self._queue is None:
+            return False
+
+        self._ensure_started()
+        try:
+            if self.overflow_policy == 'block':
+                self._queue.put((model, values), timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait((model, values))
+        except queue.Full:
+            dropped = self._count('dropped')
+            if dropped % 1000 == 1:
+                logger.warning(f"감사 로그 큐가 가득 차서 항목을 버렸습니다 (누적 {dropped}건)")
+            return False
+
+        self._count('enqueued')
+        return True
+
+    def _drain(self, first: Tuple) -> List[Tuple]:
+        """첫 항목 이후 flush_interval 동안 최대 batch_size개까지 모으기"""
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Tuple]) -> None:
+        """모델별로 묶어 다중 행 INSERT 후 시간별 집계와 함께 커밋"""
+        rows_by_model = defaultdict(list)
+        for model, values in batch:
+            rows_by_model[model].append(values)
+
+        with self.app.app_context():
+            try:
+                for model, rows in rows_by_model.items():
+                    db.session.execute(model.__table__.insert(), rows)
+                HistoryRollupService.increment(HistoryRollupService.count_batch(batch))
+                db.session.commit()
+                self._count('written', len(batch))
+                self._count('batches')
+            except Exception as e:
+                db.session.rollback()
+                self._count('failed', len(batch))
+                logger.error(f"감사 로그 일괄 저장 실패 ({len(batch)}건): {e}")
+
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            self._write(self._drain(first))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        큐에 쌓인 항목이 모두 저장될 때까지 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 제한 시간 안에 큐가 비었는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue is not None and not self._queue.empty():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """플러셔 스레드를 멈추고 남은 항목을 저장"""
+        self._stop.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 상태와 누적 통계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            'enabled': self.enabled,
+            'overflow_policy': self.overflow_policy,
+            'queue_size': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue_size': self.max_queue_size,
+            **stats
+        }
+
+
+audit_writer = AuditWriter()
@@ -14,11 +14,16 @@ from backend.extensions import db
 from backend.models.stock import StockList
 from backend.services.stock_service import StockService
 from backend.services.trading_service import TradingService
+from backend.services.digest_service import DigestService
+from backend.services.data_version import DataVersionService
+from backend.services.trading_spool import get_spool
+from backend.utils.cancellation import CancellationToken, OperationCancelled
 import re
 import psutil
 import gc
 from sqlalchemy.exc import OperationalError
 from sqlalchemy import text
+from flask import current_app
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -40,6 +45,11 @@ class DataCollectorService:
     # 기본 설정
     BASE_URL = "https://finance.naver.com/item/frgn.naver"
     REQUEST_DELAY = 1.0  # 요청 간 대기 시간 (초)
+    REQUEST_TIMEOUT = 10  # 페이지 요청 타임아웃 (초), 취소 지연의 상한
+    RESPONSE_CHUNK_SIZE = 16384  # 취소 확인 단위 (응답 본문 바이트)
+    REQUEST_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
     
     # 장시간 배치 처리를 위한 설정
     BATCH_SIZE = 50  # 한 번에 처리할 주식 수
@@ -145,194 +155,327 @@ class DataCollectorService:
             return False
     
     @staticmethod
-    def fetch_stock_data(stock_code: str, years: int = 3, max_pages: int = 10) -> Optional[pd.DataFrame]:
+    def _fetch_page_rows(
+        stock_code: str,
+        page: int,
+        headers: Dict[str, str],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Optional[List[Dict]]:
         """
-        특정 주식의 외국인/기관 거래 데이터를 크롤링 (페이지네이션 지원)
+        frgn.naver 한 페이지를 요청하여 거래 데이터 행 목록으로 파싱
         
         Args:
             stock_code (str): 주식 코드
-            years (int): 수집할 기간 (년 단위)
-            max_pages (int): 최대 페이지 수
+            page (int): 페이지 번호 (1부터 시작, 최신순)
+            headers (Dict[str, str]): 요청 헤더
+            cancel_token (Optional[CancellationToken]): 취소 토큰
             
         Returns:
-            Optional[pd.DataFrame]: 수집된 데이터 또는 None
+            Optional[List[Dict]]: 페이지에서 추출한 데이터 행 목록
+                (데이터가 없으면 빈 목록, 테이블을 찾을 수 없으면 None)
+            
+        Raises:
+            requests.RequestException: HTTP 요청 실패 시
+            OperationCancelled: 요청 또는 파싱 중 취소된 경우
         """
-        logger.debug(f"데이터 수집 시작: {stock_code}")
+        # 페이지별 URL 구성
+        url = f"{DataCollectorService.BASE_URL}?code={stock_code}&page={page}"
+        logger.debug(f"페이지 {page} 요청: {stock_code}")
         
-        all_data_list = []
-        cutoff_date = datetime.now() - timedelta(days=years * 365)
+        if cancel_token is None:
+            response = requests.get(url, headers=headers, timeout=DataCollectorService.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            content = response.content
+        else:
+            content = DataCollectorService._fetch_cancellable(url, headers, cancel_token)
         
-        # 대용량 수집 시 경고
-        if max_pages >= 30:
-            logger.warning(f"대용량 수집 모드: {stock_code} - {max_pages}페이지, 예상 시간 {max_pages * 2}초")
+        # HTML 파싱
+        soup = BeautifulSoup(content, 'html.parser')
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        # 모든 테이블 검사하여 데이터 테이블 찾기
+        all_tables = soup.find_all('table')
+        logger.debug(f"페이지 {page}: {len(all_tables)}개 테이블")
         
-        for page in range(1, max_pages + 1):
+        data_table = None
+        
+        # 각 테이블을 검사하여 날짜 데이터가 있는 테이블 찾기
+        for i, table in enumerate(all_tables):
+            rows = table.find_all('tr')
+            logger.debug(f"페이지 {page} 테이블 {i}: {len(rows)}행")
+            
+            # 충분한 행이 있는 테이블만 검사
+            if len(rows) < 5:
+                continue
+            
+            # 첫 번째 행에서 날짜 패턴 찾기
+            for row in rows[:10]:  # 처음 10개 행만 검사
+                cols = row.find_all(['td', 'th'])
+                if len(cols) > 0:
+                    first_col_text = cols[0].get_text(strip=True)
+                    # 날짜 패턴 확인 (YYYY.MM.DD 형식)
+                    if re.match(r'\d{4}\.\d{2}\.\d{2}', first_col_text):
+                        data_table = table
+                        logger.debug(f"페이지 {page}: 데이터 테이블 발견")
+                        break
+            
+            if data_table:
+                break
+        
+        if not data_table:
+            logger.debug(f"페이지 {page}: 데이터 테이블 없음, 가장 큰 테이블 사용")
+            # 가장 큰 테이블 사용
+            if all_tables:
+                data_table = max(all_tables, key=lambda t: len(t.find_all('tr')))
+            else:
+                logger.warning(f"페이지 {page}: 테이블을 찾을 수 없음")
+                return None
+        
+        # 데이터 추출
+        rows = data_table.find_all('tr')
+        logger.debug(f"페이지 {page}: {len(rows)}행 처리")
+        
+        page_data_list = []
+        
+        # 모든 행을 검사하여 데이터 추출
+        for i, row in enumerate(rows):
+            cols = row.find_all(['td', 'th'])
+            
+            if len(cols) == 0:
+                continue
+            
             try:
-                # 페이지별 URL 구성
-                url = f"https://finance.naver.com/item/frgn.naver?code={stock_code}&page={page}"
-                logger.debug(f"페이지 {page} 요청: {stock_code}")
-                
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
+                # 첫 번째 컬럼에서 날짜 찾기
+                date_str = cols[0].get_text(strip=True)
                 
-                # HTML 파싱
-                soup = BeautifulSoup(response.content, 'html.parser')
+                if not date_str or '날짜' in date_str or '구분' in date_str:
+                    continue
                 
-                # 모든 테이블 검사하여 데이터 테이블 찾기
-                all_tables = soup.find_all('table')
-                logger.debug(f"페이지 {page}: {len(all_tables)}개 테이블")
+                logger.debug(f"페이지 {page} 행 {i} 처리 중: '{date_str}' (컬럼 수: {len(cols)})")
                 
-                data_table = None
+                # 날짜 파싱 시도
+                trade_date = None
+                date_formats = ['%Y.%m.%d', '%Y-%m-%d', '%Y/%m/%d', '%m.%d', '%m/%d']
                 
-                # 각 테이블을 검사하여 날짜 데이터가 있는 테이블 찾기
-                for i, table in enumerate(all_tables):
-                    rows = table.find_all('tr')
-                    logger.debug(f"페이지 {page} 테이블 {i}: {len(rows)}행")
-                    
-                    # 충분한 행이 있는 테이블만 검사
-                    if len(rows) < 5:
-                        continue
-                    
-                    # 첫 번째 행에서 날짜 패턴 찾기
-                    for row in rows[:10]:  # 처음 10개 행만 검사
-                        cols = row.find_all(['td', 'th'])
-                        if len(cols) > 0:
-                            first_col_text = cols[0].get_text(strip=True)
-                            # 날짜 패턴 확인 (YYYY.MM.DD 형식)
-                            if re.match(r'\d{4}\.\d{2}\.\d{2}', first_col_text):
-                                data_table = table
-                                logger.debug(f"페이지 {page}: 데이터 테이블 발견")
-                                break
-                    
-                    if data_table:
+                for fmt in date_formats:
+                    try:
+                        if fmt in ['%m.%d', '%m/%d']:
+                            # 년도가 없는 경우 현재 년도 사용
+                            current_year = datetime.now().year
+                            if fmt == '%m.%d':
+                                trade_date = datetime.strptime(f"{current_year}.{date_str}", '%Y.%m.%d')
+                            else:
+                                trade_date = datetime.strptime(f"{current_year}/{date_str}", '%Y/%m/%d')
+                        else:
+                            trade_date = datetime.strptime(date_str, fmt)
                         break
-                
-                if not data_table:
-                    logger.debug(f"페이지 {page}: 데이터 테이블 없음, 가장 큰 테이블 사용")
-                    # 가장 큰 테이블 사용
-                    if all_tables:
-                        data_table = max(all_tables, key=lambda t: len(t.find_all('tr')))
-                    else:
-                        logger.warning(f"페이지 {page}: 테이블을 찾을 수 없음")
+                    except:
                         continue
                 
-                # 데이터 추출
-                rows = data_table.find_all('tr')
-                logger.debug(f"페이지 {page}: {len(rows)}행 처리")
+                if not trade_date:
+                    logger.debug(f"페이지 {page}: 날짜 파싱 실패: {date_str}")
+                    continue
                 
-                page_data_list = []
-                found_data_in_page = False
+                # 컬럼 수 체크 (최소 6개 이상이어야 함 - cols[5]까지 접근하므로)
+                if len(cols) < 6:
+                    logger.debug(f"페이지 {page}: 컬럼 수 부족: {len(cols)}")
+                    continue
                 
-                # 모든 행을 검사하여 데이터 추출
-                for i, row in enumerate(rows):
-                    cols = row.find_all(['td', 'th'])
+                # 데이터 추출 (실제 네이버 금융 테이블 구조에 맞게 수정)
+                try:
+                    # 종가 (보통 2번째 컬럼)
+                    close_price_text = cols[1].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
+                    close_price = int(close_price_text) if close_price_text and close_price_text.isdigit() else 0
                     
-                    if len(cols) == 0:
-                        continue
+                    # 실제 네이버 금융 구조에 맞게 수정:
+                    # cols[5]: 기관 순매수
+                    # cols[6]: 외국인 순매수
+                    # 누적 데이터는 크롤링에서 수집되지 않음 (나중에 계산으로 처리)
                     
-                    try:
-                        # 첫 번째 컬럼에서 날짜 찾기
-                        date_str = cols[0].get_text(strip=True)
-                        
-                        if not date_str or '날짜' in date_str or '구분' in date_str:
-                            continue
-                        
-                        logger.debug(f"페이지 {page} 행 {i} 처리 중: '{date_str}' (컬럼 수: {len(cols)})")
-                        
-                        # 날짜 파싱 시도
-                        trade_date = None
-                        date_formats = ['%Y.%m.%d', '%Y-%m-%d', '%Y/%m/%d', '%m.%d', '%m/%d']
-                        
-                        for fmt in date_formats:
-                            try:
-                                if fmt in ['%m.%d', '%m/%d']:
-                                    # 년도가 없는 경우 현재 년도 사용
-                                    current_year = datetime.now().year
-                                    if fmt == '%m.%d':
-                                        trade_date = datetime.strptime(f"{current_year}.{date_str}", '%Y.%m.%d')
-                                    else:
-                                        trade_date = datetime.strptime(f"{current_year}/{date_str}", '%Y/%m/%d')
-                                else:
-                                    trade_date = datetime.strptime(date_str, fmt)
-                                break
-                            except:
-                                continue
-                        
-                        if not trade_date:
-                            logger.debug(f"페이지 {page}: 날짜 파싱 실패: {date_str}")
-                            continue
-                        
-                        # 기간 체크
-                        if trade_date < cutoff_date:
-                            logger.info(f"페이지 {page}: 기간 초과 데이터 발견, 수집 중단: {trade_date.strftime('%Y-%m-%d')}")
-                            # 기간을 초과한 데이터가 나오면 더 이상 페이지를 확인할 필요 없음
-                            return pd.DataFrame(all_data_list) if all_data_list else None
-                        
-                        # 컬럼 수 체크 (최소 6개 이상이어야 함 - cols[5]까지 접근하므로)
-                        if len(cols) < 6:
-                            logger.debug(f"페이지 {page}: 컬럼 수 부족: {len(cols)}")
-                            continue
-                        
-                        # 데이터 추출 (실제 네이버 금융 테이블 구조에 맞게 수정)
-                        try:
-                            # 종가 (보통 2번째 컬럼)
-                            close_price_text = cols[1].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
-                            close_price = int(close_price_text) if close_price_text and close_price_text.isdigit() else 0
-                            
-                            # 실제 네이버 금융 구조에 맞게 수정:
-                            # cols[5]: 기관 순매수
-                            # cols[6]: 외국인 순매수
-                            # 누적 데이터는 크롤링에서 수집되지 않음 (나중에 계산으로 처리)
-                            
-                            # 기관 순매수 (6번째 컬럼)
-                            institution_net_text = cols[5].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
-                            institution_net = int(institution_net_text) if institution_net_text and institution_net_text.lstrip('-').isdigit() else 0
-
-                            # 외국인 순매수 (7번째 컬럼)  
-                            foreigner_net_text = cols[6].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
-                            foreigner_net = int(foreigner_net_text) if foreigner_net_text and foreigner_net_text.lstrip('-').isdigit() else 0
+                    # 기관 순매수 (6번째 컬럼)
+                    institution_net_text = cols[5].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
+                    institution_net = int(institution_net_text) if institution_net_text and institution_net_text.lstrip('-').isdigit() else 0
 
-                            # 누적 데이터는 크롤링에서 수집하지 않음 (기본값 0으로 설정)
-                            # 나중에 별도 계산 로직으로 채워넣을 예정
-                            institution_accum = 0
-                            foreigner_accum = 0
+                    # 외국인 순매수 (7번째 컬럼)  
+                    foreigner_net_text = cols[6].get_text(strip=True).replace(',', '').replace('+', '').replace('--', '0')
+                    foreigner_net = int(foreigner_net_text) if foreigner_net_text and foreigner_net_text.lstrip('-').isdigit() else 0
 
-                            data_row = {
-                                'trade_date': trade_date.date(),
-                                'close_price': close_price,
-                                'institution_net_buy': institution_net,
-                                'foreigner_net_buy': foreigner_net,
-                                'institution_accum': institution_accum,  # 크롤링에서는 0으로 설정
-                                'foreigner_accum': foreigner_accum        # 크롤링에서는 0으로 설정
-                            }
-                            
-                            page_data_list.append(data_row)
-                            found_data_in_page = True
-                            logger.debug(f"페이지 {page}: 데이터 추출 성공 - {trade_date.strftime('%Y-%m-%d')}")
-                            
-                        except (ValueError, IndexError) as e:
-                            logger.debug(f"페이지 {page}: 데이터 파싱 오류 - {e}")
-                            continue
-                            
-                    except Exception as e:
-                        logger.debug(f"페이지 {page} 행 {i} 처리 오류: {e}")
-                        continue
+                    data_row = {
+                        'trade_date': trade_date.date(),
+                        'close_price': close_price,
+                        'institution_net_buy': institution_net,
+                        'foreigner_net_buy': foreigner_net,
+                        'institution_accum': 0,  # 크롤링에서는 0으로 설정 (나중에 계산)
+                        'foreigner_accum': 0     # 크롤링에서는 0으로 설정 (나중에 계산)
+                    }
+                    
+                    page_data_list.append(data_row)
+                    logger.debug(f"페이지 {page}: 데이터 추출 성공 - {trade_date.strftime('%Y-%m-%d')}")
+                    
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"페이지 {page}: 데이터 파싱 오류 - {e}")
+                    continue
+                    
+            except Exception as e:
+                logger.debug(f"페이지 {page} 행 {i} 처리 오류: {e}")
+                continue
+        
+        return page_data_list
+    
+    @staticmethod
+    def _fetch_cancellable(url: str, headers: Dict[str, str], cancel_token: CancellationToken) -> bytes:
+        """
+        취소 가능한 HTTP GET 요청 (본문을 나눠 읽으며 취소 여부 확인)
+        
+        취소되면 응답 연결을 닫아 수신을 중단하므로, 취소 지연은 최대 한 번의 요청 타임아웃입니다.
+        
+        Args:
+            url (str): 요청 URL
+            headers (Dict[str, str]): 요청 헤더
+            cancel_token (CancellationToken): 취소 토큰
+            
+        Returns:
+            bytes: 응답 본문
+            
+        Raises:
+            requests.RequestException: HTTP 요청 실패 시
+            OperationCancelled: 요청 중 취소된 경우
+        """
+        cancel_token.raise_if_cancelled()
+        chunks = []
+        try:
+            response = requests.get(
+                url, headers=headers, timeout=DataCollectorService.REQUEST_TIMEOUT, stream=True
+            )
+            try:
+                with cancel_token.on_cancel(response.close):
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=DataCollectorService.RESPONSE_CHUNK_SIZE):
+                        cancel_token.raise_if_cancelled()
+                        chunks.append(chunk)
+            finally:
+                response.close()
+        except requests.RequestException:
+            # 취소로 연결이 닫혀 발생한 오류는 취소로 처리
+            cancel_token.raise_if_cancelled()
+            raise
+        except (AttributeError, ValueError):
+            # 다른 스레드에서 응답을 닫으면 urllib3 내부에서 발생할 수 있음
+            cancel_token.raise_if_cancelled()
+            raise
+        
+        cancel_token.raise_if_cancelled()
+        return b''.join(chunks)
+    
+    @staticmethod
+    def fetch_stock_data(
+        stock_code: str,
+        years: int = 3,
+        max_pages: int = 10,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        특정 주식의 외국인/기관 거래 데이터를 크롤링 (페이지네이션 지원)
+        
+        Args:
+            stock_code (str): 주식 코드
+            years (int): 수집할 기간 (년 단위)
+            max_pages (int): 최대 페이지 수
+            cancel_token (Optional[CancellationToken]): 취소 토큰
+            
+        Returns:
+            Optional[pd.DataFrame]: 수집된 데이터 또는 None
+            
+        Raises:
+            OperationCancelled: 취소된 경우 (partial에 취소 전까지 파싱된 DataFrame 포함)
+        """
+        logger.debug(f"데이터 수집 시작: {stock_code}")
+        
+        all_data_list = []
+        cutoff_date = (datetime.now() - timedelta(days=years * 365)).date()
+        
+        # 대용량 수집 시 경고
+        if max_pages >= 30:
+            logger.warning(f"대용량 수집 모드: {stock_code} - {max_pages}페이지, 예상 시간 {max_pages * 2}초")
+        
+        for page in range(1, max_pages + 1):
+            try:
+                page_data_list = DataCollectorService._fetch_page_rows(
+                    stock_code, page, DataCollectorService.REQUEST_HEADERS, cancel_token
+                )
+                
+                # 테이블이 없는 페이지(일시적인 오류 페이지 등)는 건너뜀
+                if page_data_list is None:
+                    continue
                 
-                # 페이지에서 데이터를 찾았으면 전체 리스트에 추가
+                # 페이지에서 데이터를 찾지 못하면 더 이상 페이지를 확인하지 않음
+                if not page_data_list:
+                    logger.info(f"페이지 {page}에서 데이터가 없으므로 수집 중단")
+                    break
+                
+                # 기간 체크
+                in_range = [row for row in page_data_list if row['trade_date'] >= cutoff_date]
+                all_data_list.extend(in_range)
+                logger.info(f"페이지 {page}: {len(in_range)}건의 데이터 추출 완료")
+                
+                if len(in_range) < len(page_data_list):
+                    # 기간을 초과한 데이터가 나오면 더 이상 페이지를 확인할 필요 없음
+                    logger.info(f"페이지 {page}: 기간 초과 데이터 발견, 수집 중단")
+                    break
+                
+            except OperationCancelled as e:
+                logger.info(f"수집 취소: {stock_code}, 페이지 {page} (파싱된 데이터 {len(all_data_list)}건)")
+                e.partial = DataCollectorService._to_dataframe(stock_code, all_data_list) if all_data_list else None
+                raise
+            except requests.RequestException as e:
+                logger.error(f"페이지 {page} 요청 오류: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"페이지 {page} 처리 오류: {e}")
+                continue
+        
+        return DataCollectorService._to_dataframe(stock_code, all_data_list)
+    
+    @staticmethod
+    def fetch_stock_pages(
+        stock_code: str,
+        pages: List[int],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        지정한 페이지 번호만 크롤링 (누락 구간 보충용)
+        
+        Args:
+            stock_code (str): 주식 코드
+            pages (List[int]): 수집할 페이지 번호 목록
+            cancel_token (Optional[CancellationToken]): 취소 토큰
+            
+        Returns:
+            Optional[pd.DataFrame]: 수집된 데이터 또는 None
+            
+        Raises:
+            OperationCancelled: 취소된 경우 (partial에 취소 전까지 파싱된 DataFrame 포함)
+        """
+        all_data_list = []
+        
+        for page in sorted(set(pages)):
+            try:
+                page_data_list = DataCollectorService._fetch_page_rows(
+                    stock_code, page, DataCollectorService.REQUEST_HEADERS, cancel_token
+                )
                 if page_data_list:
                     all_data_list.extend(page_data_list)
                     logger.info(f"페이지 {page}: {len(page_data_list)}건의 데이터 추출 완료")
-                else:
-                    logger.info(f"페이지 {page}: 추출된 데이터가 없음")
-                    # 연속으로 데이터가 없으면 더 이상 페이지를 확인하지 않음
-                    if not found_data_in_page:
-                        logger.info(f"페이지 {page}에서 데이터가 없으므로 수집 중단")
-                        break
+                if cancel_token is None:
+                    time.sleep(DataCollectorService.REQUEST_DELAY)
+                elif cancel_token.wait(DataCollectorService.REQUEST_DELAY):
+                    cancel_token.raise_if_cancelled()
                 
+            except OperationCancelled as e:
+                logger.info(f"수집 취소: {stock_code}, 페이지 {page} (파싱된 데이터 {len(all_data_list)}건)")
+                e.partial = DataCollectorService._to_dataframe(stock_code, all_data_list) if all_data_list else None
+                raise
             except requests.RequestException as e:
                 logger.error(f"페이지 {page} 요청 오류: {e}")
                 continue
@@ -340,6 +483,11 @@ class DataCollectorService:
                 logger.error(f"페이지 {page} 처리 오류: {e}")
                 continue
         
+        return DataCollectorService._to_dataframe(stock_code, all_data_list)
+    
+    @staticmethod
+    def _to_dataframe(stock_code: str, all_data_list: List[Dict]) -> Optional[pd.DataFrame]:
+        """수집된 행 목록을 중복 제거·최신순 정렬된 DataFrame으로 변환"""
         if not all_data_list:
             logger.warning(f"전체 페이지에서 추출된 데이터가 없음: {stock_code}")
             return None
@@ -358,23 +506,90 @@ class DataCollectorService:
         return df
     
     @staticmethod
-    def save_trading_data(stock_code: str, stock_name: str, df: pd.DataFrame) -> bool:
+    def _should_discard(cancel_token: Optional[CancellationToken]) -> bool:
+        """취소 요청이 있고 정책이 폐기(discard)인지 여부"""
+        return cancel_token is not None and cancel_token.is_cancelled and not cancel_token.should_flush
+    
+    @staticmethod
+    def spool_trading_data(stock_code: str, stock_name: str, df: pd.DataFrame, reason: str = '') -> bool:
+        """
+        DB 대신 로컬 스풀에 거래 데이터를 기록하고 백그라운드 재생 스레드를 시작
+        
+        Args:
+            stock_code (str): 주식 코드
+            stock_name (str): 주식 이름
+            df (pd.DataFrame): 거래 데이터
+            reason (str): 스풀 기록 사유 (로그용)
+            
+        Returns:
+            bool: 기록 성공 여부
+        """
+        try:
+            spool = get_spool()
+            if reason:
+                spool.mark_degraded(reason)
+            
+            rows = df[['trade_date', 'close_price', 'institution_net_buy', 'foreigner_net_buy']].to_dict('records')
+            spool.append(stock_code, stock_name, rows)
+            spool.start_replayer(
+                current_app._get_current_object(),
+                interval=current_app.config['TRADING_SPOOL']['replay_interval']
+            )
+            return True
+        except Exception as e:
+            logger.error(f"로컬 스풀 기록 실패: {stock_code}, {e}")
+            return False
+    
+    @staticmethod
+    def save_trading_data(
+        stock_code: str,
+        stock_name: str,
+        df: pd.DataFrame,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> bool:
         """
         거래 데이터를 데이터베이스에 저장 (효율적인 배치 처리)
         
+        DB가 중단되었거나 응답이 느리면 재시도 대기 없이 로컬 스풀에 기록하고,
+        DB가 복구되면 백그라운드 재생 스레드가 일괄 저장합니다.
+        취소 토큰의 정책이 discard이면 취소 요청 시 커밋하지 않고 OperationCancelled로 중단합니다.
+        (의도적으로 폐기한 종목이 저장 실패로 집계되지 않도록 False를 반환하지 않음)
+        
         Args:
             stock_code (str): 주식 코드
             stock_name (str): 주식 이름
             df (pd.DataFrame): 거래 데이터
+            cancel_token (Optional[CancellationToken]): 취소 토큰
             
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장(또는 스풀 기록) 성공 여부
+            
+        Raises:
+            OperationCancelled: 폐기(discard) 정책으로 취소되어 저장하지 않은 경우
         """
+        spool = get_spool()
+        if spool.is_degraded():
+            return DataCollectorService.spool_trading_data(stock_code, stock_name, df)
+        
         try:
+            # 연결 상태 및 응답 시간 확인 (느리면 이번 저장부터 스풀로 전환)
+            slow_threshold = current_app.config['TRADING_SPOOL']['slow_query_threshold']
+            ping_started = time.monotonic()
+            db.session.execute(text("SELECT 1"))
+            ping_elapsed = time.monotonic() - ping_started
+            if ping_elapsed > slow_threshold:
+                return DataCollectorService.spool_trading_data(
+                    stock_code, stock_name, df, f"연결 확인 {ping_elapsed:.1f}초 소요"
+                )
+            
             # 1단계: 새로운 데이터만 미리 필터링
             new_data_list = []
             
             for _, row in df.iterrows():
+                if DataCollectorService._should_discard(cancel_token):
+                    logger.info(f"취소 요청으로 저장 중단 (폐기 정책): {stock_code}")
+                    raise OperationCancelled(f"취소 요청으로 저장하지 않음 (폐기 정책): {stock_code}")
+                
                 # trade_date를 문자열로 변환
                 trade_date_str = row['trade_date'].strftime('%Y-%m-%d') if hasattr(row['trade_date'], 'strftime') else str(row['trade_date'])
                 
@@ -415,6 +630,10 @@ class DataCollectorService:
                 logger.info(f"저장할 새 데이터가 없음: {stock_code}")
                 return True  # 성공으로 처리 (이미 모든 데이터가 존재)
 
+            if DataCollectorService._should_discard(cancel_token):
+                logger.info(f"취소 요청으로 저장 중단 (폐기 정책): {stock_code}")
+                raise OperationCancelled(f"취소 요청으로 저장하지 않음 (폐기 정책): {stock_code}")
+            
             # 3단계: 한 종목의 모든 데이터를 한 번에 저장
             max_retries = 3
             retry_delay = 1
@@ -435,6 +654,7 @@ class DataCollectorService:
                     # 모든 데이터를 세션에 추가
                     for trading_data in new_data_list:
                         db.session.add(trading_data)
+                    DataVersionService.bump(DataVersionService.TRADING, [stock_code])
                     
                     # 한 번에 커밋
                     db.session.commit()
@@ -448,10 +668,8 @@ class DataCollectorService:
                     db.session.remove()
                     
                     if "server closed the connection" in str(e).lower() or "connection" in str(e).lower():
-                        logger.warning(f"데이터베이스 연결 끊김, {retry_delay}초 후 재시도 ({attempt + 1}/{max_retries}): {stock_code}")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
+                        # 재시도 대기 없이 로컬 스풀에 기록하고 다음 종목으로 진행
+                        return DataCollectorService.spool_trading_data(stock_code, stock_name, df, str(e))
                     else:
                         logger.error(f"데이터베이스 오류: {stock_code}, 시도 횟수: {attempt + 1}, 오류: {e}")
                         return False
@@ -472,6 +690,16 @@ class DataCollectorService:
             
             logger.debug(f"저장 완료: {stock_code} ({total_saved}건)")
             
+            # 저장된 월의 다이제스트 갱신
+            try:
+                DigestService.refresh_months(
+                    stock_code, [data.trade_date[:7] for data in new_data_list]
+                )
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"다이제스트 갱신 실패: {stock_code}, {e}")
+            
             # 히스토리 로깅 (배치 처리 완료 후)
             if total_saved > 0:
                 try:
@@ -487,51 +715,208 @@ class DataCollectorService:
             
             return total_saved > 0
             
+        except OperationCancelled:
+            raise
+            
+        except OperationalError as e:
+            db.session.rollback()
+            db.session.remove()
+            return DataCollectorService.spool_trading_data(stock_code, stock_name, df, str(e))
+            
         except Exception as e:
             logger.error(f"데이터 저장 중 예외 발생: {stock_code}, 오류: {e}")
             return False
     
     @staticmethod
-    def collect_and_save_trading_data(stock_code: str, stock_name: str, years: int = 3, max_pages: int = 10) -> bool:
+    def collect_and_save_trading_data(
+        stock_code: str,
+        stock_name: str,
+        years: int = 3,
+        max_pages: int = 10,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> bool:
         """
         특정 주식의 거래 데이터를 수집하고 저장
         
+        취소되면 토큰 정책에 따라 이미 파싱된 페이지를 저장(flush)하거나 폐기(discard)한 뒤
+        OperationCancelled 예외를 호출자에게 다시 전달합니다.
+        
         Args:
             stock_code (str): 주식 코드
             stock_name (str): 주식 이름
             years (int): 수집할 기간 (년 단위)
             max_pages (int): 최대 페이지 수
+            cancel_token (Optional[CancellationToken]): 취소 토큰
             
         Returns:
             bool: 수집 및 저장 성공 여부
+            
+        Raises:
+            OperationCancelled: 수집 중 취소된 경우
         """
         try:
             # 1. 데이터 크롤링 (페이지네이션 지원)
-            df = DataCollectorService.fetch_stock_data(stock_code, years, max_pages)
+            try:
+                df = DataCollectorService.fetch_stock_data(stock_code, years, max_pages, cancel_token)
+            except OperationCancelled as e:
+                if cancel_token.should_flush and e.partial is not None and not e.partial.empty:
+                    logger.info(f"취소 전 파싱된 데이터 저장: {stock_code} ({len(e.partial)}건)")
+                    DataCollectorService.save_trading_data(stock_code, stock_name, e.partial)
+                raise
+            
             if df is None or df.empty:
                 logger.warning(f"수집할 데이터가 없음: {stock_code}")
                 return False
             
-            # 2. 데이터베이스 저장
-            success = DataCollectorService.save_trading_data(stock_code, stock_name, df)
+            # 2. 저장된 다이제스트와 같은 월은 저장 대상에서 제외 (DB 장애 중에는 건너뜀)
+            if not get_spool().is_degraded():
+                try:
+                    df, unchanged_months = DigestService.filter_unchanged(stock_code, df)
+                except OperationalError as e:
+                    db.session.rollback()
+                    db.session.remove()
+                    get_spool().mark_degraded(str(e))
+                    unchanged_months = []
+                if df.empty:
+                    logger.info(f"변경된 데이터 없음 (다이제스트 일치 {len(unchanged_months)}개월): {stock_code}")
+                    return True
+            
+            # 3. 데이터베이스 저장
+            success = DataCollectorService.save_trading_data(stock_code, stock_name, df, cancel_token)
             
             # 트렌드 분석은 별도의 API에서 수행하므로 여기서는 제거
             logger.info(f"데이터 저장 완료: {stock_code}")
             
             return success
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"데이터 수집 및 저장 실패: {stock_code}, {e}")
             return False
     
+    @staticmethod
+    def fill_gaps(
+        stock_code: str,
+        stock_name: str,
+        mode: str = 'market',
+        max_pages: int = 50,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, any]:
+        """
+        누락 구간만 골라서 수집 (누락 날짜를 포함하는 페이지만 요청)
+        
+        취소되면 토큰 정책에 따라 이미 파싱된 누락 날짜 데이터를 저장(flush)하거나 폐기(discard)한 뒤
+        OperationCancelled 예외를 호출자에게 다시 전달합니다.
+        
+        Args:
+            stock_code (str): 주식 코드
+            stock_name (str): 주식 이름
+            mode (str): 거래일 캘린더 모드 (market, weekday)
+            max_pages (int): 수집할 최대 페이지 번호
+            cancel_token (Optional[CancellationToken]): 취소 토큰
+            
+        Returns:
+            Dict: 보충 결과 (누락 일수, 요청 페이지, 보충된 건수, DB 장애로 스풀에 기록된 건수)
+            
+        Raises:
+            OperationCancelled: 보충 중 취소된 경우
+        """
+        from backend.services.gap_analyzer import GapAnalyzer
+        
+        result = {
+            'stock_code': stock_code,
+            'missing_days': 0,
+            'pages': [],
+            'filled_days': 0,
+            'spooled_days': 0,
+            'success': True
+        }
+        
+        try:
+            plan = GapAnalyzer.plan_gap_fill(stock_code, mode=mode, max_pages=max_pages)
+            result['missing_days'] = len(plan['missing_dates'])
+            result['pages'] = plan['pages']
+            
+            if not plan['pages']:
+                logger.info(f"보충할 누락 구간 없음: {stock_code}")
+                return result
+            
+            logger.info(f"누락 구간 보충 시작: {stock_code}, 누락 {result['missing_days']}일, 페이지 {plan['pages']}")
+            
+            missing_set = set(plan['missing_dates'])
+            try:
+                df = DataCollectorService.fetch_stock_pages(stock_code, plan['pages'], cancel_token)
+            except OperationCancelled as e:
+                if cancel_token.should_flush and e.partial is not None and not e.partial.empty:
+                    partial = DataCollectorService._only_dates(e.partial, missing_set)
+                    if not partial.empty:
+                        logger.info(f"취소 전 파싱된 누락 구간 저장: {stock_code} ({len(partial)}건)")
+                        DataCollectorService._save_gap_rows(stock_code, stock_name, partial, result)
+                raise
+            
+            if df is None or df.empty:
+                return result
+            
+            # 누락된 날짜의 행만 저장
+            df = DataCollectorService._only_dates(df, missing_set)
+            if df.empty:
+                logger.info(f"요청한 페이지에 누락 날짜 데이터가 없음: {stock_code}")
+                return result
+            
+            DataCollectorService._save_gap_rows(stock_code, stock_name, df, result, cancel_token)
+            return result
+            
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"누락 구간 보충 실패: {stock_code}, {e}")
+            result['success'] = False
+            result['error'] = str(e)
+            return result
+    
+    @staticmethod
+    def _only_dates(df: pd.DataFrame, dates: set) -> pd.DataFrame:
+        """지정한 거래일(YYYY-MM-DD)의 행만 남김"""
+        return df[df['trade_date'].map(lambda d: d.strftime('%Y-%m-%d') in dates)]
+    
+    @staticmethod
+    def _save_gap_rows(
+        stock_code: str,
+        stock_name: str,
+        df: pd.DataFrame,
+        result: Dict[str, any],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> None:
+        """
+        누락 구간 데이터를 저장하고 보충 결과와 누적값을 갱신
+        
+        DB 장애로 스풀에 기록된 경우(저장 후 장애 상태)는 아직 DB에 없으므로 spooled_days로만 보고하고,
+        누적값 계산은 스풀 재생에 맡깁니다.
+        """
+        result['success'] = DataCollectorService.save_trading_data(stock_code, stock_name, df, cancel_token)
+        if not result['success']:
+            return
+        if get_spool().is_degraded():
+            result['spooled_days'] = len(df)
+            return
+        result['filled_days'] = len(df)
+        # 과거 구간이 채워졌으므로 누적값을 다시 계산
+        DataCollectorService.calculate_accumulated_data(stock_code)
+    
     @staticmethod  
-    def collect_all_stocks_data(years: int = 3, max_pages: int = 10) -> Dict[str, any]:
+    def collect_all_stocks_data(
+        years: int = 3,
+        max_pages: int = 10,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, any]:
         """
         모든 주식의 거래 데이터를 수집 (배치 처리 방식)
         
         Args:
             years (int): 수집할 기간 (년 단위)
             max_pages (int): 최대 페이지 수
+            cancel_token (Optional[CancellationToken]): 취소 토큰 (취소 시 results['cancelled'] = True)
             
         Returns:
             Dict: 수집 결과 통계
@@ -544,7 +929,9 @@ class DataCollectorService:
             'failed_stocks': 0,
             'failed_list': [],
             'batches_processed': 0,
-            'memory_cleanups': 0
+            'memory_cleanups': 0,
+            'cancelled': False,
+            'cancelled_stock': None  # 취소 시 처리 중이던 종목 (실패로 집계하지 않음)
         }
         
         try:
@@ -572,6 +959,8 @@ class DataCollectorService:
                 # 배치 내 각 주식 처리
                 for stock_idx, stock in enumerate(batch_stocks):
                     current_stock_count = start_idx + stock_idx + 1
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
                     
                     try:
                         # 메모리 사용률 체크
@@ -589,17 +978,18 @@ class DataCollectorService:
                             db.session.remove()
                             time.sleep(2)
                         
-                        # 데이터베이스 연결 상태 확인
-                        try:
-                            db.session.execute(text("SELECT 1"))
-                        except Exception as conn_error:
-                            logger.warning(f"데이터베이스 연결 확인 실패, 세션 재생성: {conn_error}")
-                            db.session.close()
-                            db.session.remove()
-                            time.sleep(2)
+                        # 데이터베이스 연결 상태 확인 (장애 중에는 스풀에 기록하므로 건너뜀)
+                        if not get_spool().is_degraded():
+                            try:
+                                db.session.execute(text("SELECT 1"))
+                            except Exception as conn_error:
+                                logger.warning(f"데이터베이스 연결 확인 실패, 로컬 스풀로 전환: {conn_error}")
+                                db.session.close()
+                                db.session.remove()
+                                get_spool().mark_degraded(str(conn_error))
                         
                         success = DataCollectorService.collect_and_save_trading_data(
-                            stock.stock_code, stock.stock_name, years, max_pages
+                            stock.stock_code, stock.stock_name, years, max_pages, cancel_token
                         )
                         
                         if success:
@@ -610,7 +1000,16 @@ class DataCollectorService:
                             logger.warning(f"수집 실패: {stock.stock_code} {stock.stock_name}")
                         
                         # 요청 간 대기
-                        time.sleep(DataCollectorService.REQUEST_DELAY)
+                        if cancel_token is None:
+                            time.sleep(DataCollectorService.REQUEST_DELAY)
+                        else:
+                            cancel_token.wait(DataCollectorService.REQUEST_DELAY)
+                            cancel_token.raise_if_cancelled()
+                        
+                    except OperationCancelled:
+                        # 취소로 저장하지 않은 종목은 실패가 아닌 취소로 보고
+                        results['cancelled_stock'] = f"{stock.stock_code} {stock.stock_name}"
+                        raise
                         
                     except OperationalError as e:
                         results['failed_stocks'] += 1
@@ -635,13 +1034,25 @@ class DataCollectorService:
                 # 배치 완료 후 대기
                 if batch_idx < total_batches - 1:  # 마지막 배치가 아니면
                     logger.info(f"배치 {batch_idx + 1} 완료, {DataCollectorService.BATCH_DELAY}초 대기")
-                    time.sleep(DataCollectorService.BATCH_DELAY)
+                    if cancel_token is None:
+                        time.sleep(DataCollectorService.BATCH_DELAY)
+                    else:
+                        cancel_token.wait(DataCollectorService.BATCH_DELAY)
+                        cancel_token.raise_if_cancelled()
                 
                 results['batches_processed'] += 1
             
             logger.info(f"전체 데이터 수집 완료: 성공 {results['success_stocks']}개, 실패 {results['failed_stocks']}개, 배치 {results['batches_processed']}개, 메모리 정리 {results['memory_cleanups']}회")
             return results
             
+        except OperationCancelled:
+            results['cancelled'] = True
+            logger.info(
+                f"전체 데이터 수집 취소: 성공 {results['success_stocks']}개, 실패 {results['failed_stocks']}개, "
+                f"취소된 종목 {results['cancelled_stock'] or '없음'}"
+            )
+            return results
+            
         except Exception as e:
             logger.error(f"전체 데이터 수집 중 오류: {e}")
             results['error'] = str(e)
@@ -700,6 +1111,7 @@ class DataCollectorService:
                 logger.debug(f"{trading_data.trade_date}: 기관순매수={trading_data.institution_net_buy}, 기관누적={institution_accum}, 외국인순매수={trading_data.foreigner_net_buy}, 외국인누적={foreigner_accum}")
             
             # 배치로 저장
+            DataVersionService.bump(DataVersionService.TRADING, [stock_code])
             db.session.commit()
             
             logger.info(f"누적 데이터 계산 완료: {stock_code}, {updated_count}건 업데이트 (초기값 0부터 시작)")
@@ -794,6 +1206,8 @@ class DataCollectorService:
             
             # 해당 주식의 모든 거래 데이터 삭제
             deleted_count = StockInvestorTrading.query.filter_by(stock_code=stock_code).delete()
+            DigestService.delete_digests(stock_code)
+            DataVersionService.bump(DataVersionService.TRADING, [stock_code])
             db.session.commit()
             
             # 히스토리 로깅
@@ -842,6 +1256,8 @@ class DataCollectorService:
             
             # 모든 거래 데이터 삭제
             deleted_count = StockInvestorTrading.query.delete()
+            DigestService.delete_digests()
+            DataVersionService.bump_all_stocks(DataVersionService.TRADING)
             db.session.commit()
             
             # 히스토리 로깅
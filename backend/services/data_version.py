@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 버전 서비스
+stock_list / stock_investor_trading이 바뀔 때 테이블 전체('*')와 종목별 버전을 증가시키고,
+조회 API는 이 버전으로 ETag를 만들어 변경이 없으면 쿼리 없이 304를 반환합니다.
+
+버전 증가는 쓰기와 같은 트랜잭션에서 실행하므로(커밋은 호출자가 관리) 롤백되면 함께 취소됩니다.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.models.data_version import DataVersion
+
+logger = logging.getLogger(__name__)
+
+TABLE_SCOPE = '*'
+
+# 여러 트랜잭션이 같은 행을 갱신할 때 교착 상태가 생기지 않도록 키 순서대로 갱신
+_BUMP_SQL = """
+INSERT INTO data_version (table_name, scope_key, version, updated_at)
+SELECT :table_name, scope_key, 1, now() AT TIME ZONE 'utc'
+FROM unnest(CAST(:scope_keys AS VARCHAR[])) AS scope_key
+ORDER BY scope_key
+ON CONFLICT (table_name, scope_key) DO UPDATE
+SET version = data_version.version + 1,
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+class DataVersionService:
+    """데이터 버전 서비스 클래스"""
+
+    STOCK_LIST = 'stock_list'
+    TRADING = 'stock_investor_trading'
+
+    @staticmethod
+    def bump(table_name: str, stock_codes: Optional[Iterable[str]] = None) -> None:
+        """
+        테이블 전체 버전과 종목별 버전 증가 (커밋은 호출자가 관리)
+
+        Args:
+            table_name (str): 테이블명 (STOCK_LIST 또는 TRADING)
+            stock_codes (Optional[Iterable[str]]): 변경된 종목 코드 (없으면 테이블 전체 버전만 증가)
+        """
+        scope_keys = sorted({TABLE_SCOPE, *(code for code in (stock_codes or ()) if code)})
+        db.session.execute(text(_BUMP_SQL), {'table_name': table_name, 'scope_keys': scope_keys})
+
+    @staticmethod
+    def bump_all_stocks(table_name: str) -> None:
+        """
+        테이블 전체 변경 (전체 삭제 등) 시 테이블 버전과 기록된 모든 종목 버전 증가 (커밋은 호출자가 관리)
+
+        Args:
+            table_name (str): 테이블명
+        """
+        db.session.execute(text("""
+            UPDATE data_version
+            SET version = version + 1, updated_at = now() AT TIME ZONE 'utc'
+            WHERE table_name = :table_name AND scope_key <> :table_scope
+        """), {'table_name': table_name, 'table_scope': TABLE_SCOPE})
+        DataVersionService.bump(table_name)
+
+    @staticmethod
+    def get_version(table_name: str, stock_code: Optional[str] = None) -> int:
+        """
+        현재 버전 조회 (기본 키 조회)
+
+        Args:
+            table_name (str): 테이블명
+            stock_code (Optional[str]): 종목 코드 (없으면 테이블 전체 버전)
+
+        Returns:
+            int: 버전 번호 (기록이 없으면 0)
+        """
+        version = db.session.query(DataVersion.version).filter(
+            DataVersion.table_name == table_name,
+            DataVersion.scope_key == (stock_code or TABLE_SCOPE)
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def get_versions(table_name: str, stock_codes: Optional[Iterable[str]] = None) -> List[int]:
+        """
+        여러 범위의 현재 버전을 한 번에 조회
+
+        Args:
+            table_name (str): 테이블명
+            stock_codes (Optional[Iterable[str]]): 종목 코드 목록 (없으면 테이블 전체 버전 하나)
+
+        Returns:
+            List[int]: 정렬된 종목 코드 순서의 버전 목록 (기록이 없으면 0)
+        """
+        scope_keys = sorted({code for code in (stock_codes or ()) if code}) or [TABLE_SCOPE]
+        rows = db.session.query(DataVersion.scope_key, DataVersion.version).filter(
+            DataVersion.table_name == table_name,
+            DataVersion.scope_key.in_(scope_keys)
+        ).all()
+        versions: Dict[str, int] = {scope_key: version for scope_key, version in rows}
+        return [versions.get(scope_key, 0) for scope_key in scope_keys]
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+종목-월 다이제스트 서비스
+거래 데이터의 종목-월 단위 해시를 관리하여 재수집 없이 정합성을 확인합니다.
+
+다이제스트는 원본 컬럼(거래일, 종가, 기관/외국인 순매수)만으로 계산하며,
+누적값처럼 파생되는 컬럼은 포함하지 않습니다. Python과 PostgreSQL에서
+같은 값을 얻도록 행 표현과 해시(MD5)를 동일하게 맞춥니다.
+"""
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.models.digest import StockMonthDigest
+from backend.models.stock import StockList
+
+logger = logging.getLogger(__name__)
+
+# 한 행의 정규화된 문자열 표현 (PostgreSQL)
+_ROW_EXPR = (
+    "trade_date || '|' || coalesce(close_price::text, '') || '|' || "
+    "coalesce(institution_net_buy::text, '') || '|' || coalesce(foreigner_net_buy::text, '')"
+)
+
+_REFRESH_SQL = f"""
+INSERT INTO stock_month_digest (stock_code, year_month, row_count, digest, updated_at)
+SELECT stock_code,
+       substr(trade_date, 1, 7) AS year_month,
+       count(*) AS row_count,
+       md5(string_agg({_ROW_EXPR}, E'\\n' ORDER BY trade_date)) AS digest,
+       now() AT TIME ZONE 'utc'
+FROM stock_investor_trading
+WHERE stock_code = :stock_code
+  AND trade_date >= :start_date AND trade_date <= :end_date
+  AND substr(trade_date, 1, 7) = ANY(:months)
+GROUP BY stock_code, substr(trade_date, 1, 7)
+ON CONFLICT (stock_code, year_month) DO UPDATE
+SET row_count = EXCLUDED.row_count,
+    digest = EXCLUDED.digest,
+    updated_at = EXCLUDED.updated_at
+"""
+
+# 다이제스트가 있는 월만 해당 월의 날짜 범위로 비교 (종목 목록은 호출자가 페이지 단위로 지정)
+_MISMATCH_SQL = f"""
+WITH stored AS (
+    SELECT stock_code, year_month, row_count, digest
+    FROM stock_month_digest
+    WHERE stock_code = ANY(:stock_codes)
+), actual AS (
+    SELECT s.stock_code,
+           s.year_month,
+           count(t.stock_code) AS row_count,
+           md5(string_agg({_ROW_EXPR}, E'\\n' ORDER BY trade_date)) AS digest
+    FROM stored s
+    LEFT JOIN stock_investor_trading t
+      ON t.stock_code = s.stock_code
+     AND t.trade_date >= s.year_month || '-01' AND t.trade_date <= s.year_month || '-31'
+    GROUP BY s.stock_code, s.year_month
+)
+SELECT s.stock_code,
+       s.year_month,
+       a.row_count AS actual_row_count,
+       s.row_count AS stored_row_count,
+       a.digest AS actual_digest,
+       s.digest AS stored_digest
+FROM stored s
+JOIN actual a ON a.stock_code = s.stock_code AND a.year_month = s.year_month
+WHERE a.digest IS DISTINCT FROM s.digest
+   OR a.row_count IS DISTINCT FROM s.row_count
+"""
+
+# 거래 데이터는 있지만 다이제스트가 없는 월 (include_missing=True일 때만)
+_MISSING_DIGEST_SQL = f"""
+SELECT t.stock_code,
+       substr(t.trade_date, 1, 7) AS year_month,
+       count(*) AS actual_row_count,
+       NULL::integer AS stored_row_count,
+       md5(string_agg({_ROW_EXPR}, E'\\n' ORDER BY trade_date)) AS actual_digest,
+       NULL::text AS stored_digest
+FROM stock_investor_trading t
+WHERE t.stock_code = ANY(:stock_codes)
+  AND NOT EXISTS (
+      SELECT 1 FROM stock_month_digest d
+      WHERE d.stock_code = t.stock_code AND d.year_month = substr(t.trade_date, 1, 7)
+  )
+GROUP BY t.stock_code, substr(t.trade_date, 1, 7)
+"""
+
+
+class DigestService:
+    """종목-월 다이제스트 서비스 클래스"""
+
+    @staticmethod
+    def _format_value(value) -> str:
+        """다이제스트 계산용 값 문자열 변환 (NULL은 빈 문자열)"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return ''
+        return str(int(value))
+
+    @staticmethod
+    def compute_digest(rows: List[Dict]) -> Tuple[int, str]:
+        """
+        거래 데이터 행 목록의 다이제스트 계산
+
+        Args:
+            rows (List[Dict]): trade_date(YYYY-MM-DD), close_price, institution_net_buy,
+                foreigner_net_buy 키를 가진 행 목록
+
+        Returns:
+            Tuple[int, str]: (행 수, MD5 해시)
+        """
+        lines = [
+            '|'.join([
+                row['trade_date'],
+                DigestService._format_value(row.get('close_price')),
+                DigestService._format_value(row.get('institution_net_buy')),
+                DigestService._format_value(row.get('foreigner_net_buy')),
+            ])
+            for row in sorted(rows, key=lambda r: r['trade_date'])
+        ]
+        return len(lines), hashlib.md5('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def refresh_months(stock_code: str, months: List[str]) -> None:
+        """
+        특정 종목의 월별 다이제스트를 저장된 거래 데이터로부터 다시 계산 (커밋은 호출자가 관리)
+
+        거래 데이터가 모두 사라진 월은 다이제스트도 삭제합니다.
+
+        Args:
+            stock_code (str): 주식 코드
+            months (List[str]): 갱신할 연월 목록 (YYYY-MM)
+        """
+        months = sorted(set(months))
+        if not months:
+            return
+
+        StockMonthDigest.query.filter(
+            StockMonthDigest.stock_code == stock_code,
+            StockMonthDigest.year_month.in_(months)
+        ).delete(synchronize_session=False)
+        db.session.execute(text(_REFRESH_SQL), {
+            'stock_code': stock_code,
+            'start_date': f'{months[0]}-01',
+            'end_date': f'{months[-1]}-31',
+            'months': months
+        })
+
+    @staticmethod
+    def delete_digests(stock_code: Optional[str] = None) -> int:
+        """
+        거래 데이터 삭제에 맞춰 다이제스트 삭제 (커밋은 호출자가 관리)
+
+        삭제된 데이터의 다이제스트가 남아 있으면 재수집한 데이터가 변경 없음으로 건너뛰어지므로,
+        거래 데이터를 지우는 같은 트랜잭션에서 호출해야 합니다.
+
+        Args:
+            stock_code (Optional[str]): 주식 코드 (없으면 전체)
+
+        Returns:
+            int: 삭제된 다이제스트 수
+        """
+        query = StockMonthDigest.query
+        if stock_code is not None:
+            query = query.filter(StockMonthDigest.stock_code == stock_code)
+        return query.delete(synchronize_session=False)
+
+    @staticmethod
+    def get_stored_digests(stock_code: str, months: List[str]) -> Dict[str, Tuple[int, str]]:
+        """
+        저장된 다이제스트 조회
+
+        Args:
+            stock_code (str): 주식 코드
+            months (List[str]): 조회할 연월 목록
+
+        Returns:
+            Dict[str, Tuple[int, str]]: 연월별 (행 수, 해시)
+        """
+        if not months:
+            return {}
+
+        digests = StockMonthDigest.query.filter(
+            StockMonthDigest.stock_code == stock_code,
+            StockMonthDigest.year_month.in_(sorted(set(months)))
+        ).all()
+        return {d.year_month: (d.row_count, d.digest) for d in digests}
+
+    @staticmethod
+    def filter_unchanged(stock_code: str, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        새로 수집한 데이터에서 저장된 다이제스트와 동일한 월을 제외
+
+        월 전체가 수집된 경우에만 다이제스트가 일치하므로, 일부만 수집된 월은
+        그대로 남겨 기존 저장 로직(중복 건너뛰기)에 맡깁니다.
+
+        Args:
+            stock_code (str): 주식 코드
+            df (pd.DataFrame): 수집된 거래 데이터 (trade_date는 date 객체)
+
+        Returns:
+            Tuple[pd.DataFrame, List[str]]: (변경된 월의 데이터, 변경 없는 연월 목록)
+        """
+        if df is None or df.empty:
+            return df, []
+
+        date_strings = df['trade_date'].map(
+            lambda d: d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d)
+        )
+        year_months = date_strings.str.slice(0, 7)
+        stored = DigestService.get_stored_digests(stock_code, year_months.unique().tolist())
+        if not stored:
+            return df, []
+
+        unchanged = []
+        for year_month, group in df.assign(_date=date_strings, _ym=year_months).groupby('_ym'):
+            if year_month not in stored:
+                continue
+            rows = [
+                {
+                    'trade_date': row['_date'],
+                    'close_price': row.get('close_price'),
+                    'institution_net_buy': row.get('institution_net_buy'),
+                    'foreigner_net_buy': row.get('foreigner_net_buy'),
+                }
+                for _, row in group.iterrows()
+            ]
+            if DigestService.compute_digest(rows) == stored[year_month]:
+                unchanged.append(year_month)
+
+        if not unchanged:
+            return df, []
+        return df[~year_months.isin(unchanged)], unchanged
+
+    @staticmethod
+    def find_mismatches(
+        stock_code: Optional[str] = None,
+        after: Optional[str] = None,
+        stock_limit: int = 50,
+        include_missing: bool = False
+    ) -> Dict:
+        """
+        저장된 다이제스트와 실제 거래 데이터가 일치하지 않는 종목-월 목록 조회
+
+        전체 테이블을 한 번에 집계하지 않도록 종목 코드 순으로 stock_limit개 종목씩 나누어 비교하며,
+        다이제스트가 있는 월만 해당 월의 날짜 범위로 집계합니다. 다이제스트가 없는 월(missing_digest)은
+        include_missing=True일 때만 포함합니다 (POST /collector/digests/rebuild/<stock_code>로 생성).
+
+        Args:
+            stock_code (Optional[str]): 주식 코드 (지정하면 해당 종목만)
+            after (Optional[str]): 이 종목 코드 다음 종목부터 조회 (이전 응답의 next_after)
+            stock_limit (int): 한 번에 비교할 종목 수
+            include_missing (bool): 다이제스트가 없는 월도 포함할지 여부
+
+        Returns:
+            Dict: 불일치 종목-월 목록(mismatches), 비교한 종목 수(stocks_checked),
+                다음 페이지 시작 종목 코드(next_after, 마지막 페이지면 None)
+        """
+        if stock_code:
+            stock_codes = [stock_code]
+        else:
+            query = StockList.query.with_entities(StockList.stock_code)
+            if after:
+                query = query.filter(StockList.stock_code > after)
+            stock_codes = [row[0] for row in query.order_by(StockList.stock_code).limit(stock_limit).all()]
+
+        results = []
+        if stock_codes:
+            params = {'stock_codes': stock_codes}
+            rows = list(db.session.execute(text(_MISMATCH_SQL), params).mappings().all())
+            if include_missing:
+                rows.extend(db.session.execute(text(_MISSING_DIGEST_SQL), params).mappings().all())
+
+            for row in sorted(rows, key=lambda r: (r['stock_code'], r['year_month'])):
+                if row['stored_digest'] is None:
+                    reason = 'missing_digest'
+                elif row['actual_digest'] is None:
+                    reason = 'missing_data'
+                else:
+                    reason = 'changed'
+                item = dict(row)
+                item['reason'] = reason
+                results.append(item)
+
+        has_more = not stock_code and len(stock_codes) == stock_limit
+        return {
+            'mismatches': results,
+            'stocks_checked': len(stock_codes),
+            'next_after': stock_codes[-1] if has_more else None
+        }
+
+    @staticmethod
+    def rebuild(stock_code: str) -> int:
+        """
+        특정 종목의 모든 월 다이제스트를 다시 계산 (커밋은 호출자가 관리)
+
+        Args:
+            stock_code (str): 주식 코드
+
+        Returns:
+            int: 갱신된 월 수
+        """
+        months = [
+            row[0] for row in db.session.execute(text(
+                "SELECT DISTINCT substr(trade_date, 1, 7) FROM stock_investor_trading WHERE stock_code = :stock_code"
+            ), {'stock_code': stock_code}).all()
+        ]
+        db.session.execute(
+            text("DELETE FROM stock_month_digest WHERE stock_code = :stock_code"),
+            {'stock_code': stock_code}
+        )
+        DigestService.refresh_months(stock_code, months)
+        return len(months)
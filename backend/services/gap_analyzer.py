@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+거래 데이터 누락 구간 분석 서비스
+종목별로 저장된 거래일을 거래일 캘린더와 비교하여 누락 구간을 찾고,
+누락 구간을 포함하는 frgn.naver 페이지 번호를 계산합니다.
+"""
+import bisect
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from backend.extensions import db
+from backend.models.stock import StockList
+from backend.models.trading import StockInvestorTrading
+from backend.services.stock_service import StockService
+
+logger = logging.getLogger(__name__)
+
+
+class GapAnalyzer:
+    """거래 데이터 누락 구간 분석 서비스 클래스"""
+
+    # 캘린더 모드
+    # market: 저장된 전체 종목의 거래일 합집합 (휴장일 자동 제외)
+    # weekday: 평일 전체 (휴장일 정보가 없으므로 공휴일도 포함)
+    CALENDAR_MODES = ('market', 'weekday')
+
+    ROWS_PER_PAGE = 20   # frgn.naver 한 페이지당 거래일 수
+    PAGE_MARGIN = 1      # 페이지 추정 오차(목록 갱신 등)를 감안한 앞뒤 여유 페이지 수
+
+    @staticmethod
+    def get_trading_calendar(start_date: str, end_date: str, mode: str = 'market') -> List[str]:
+        """
+        거래일 캘린더 조회
+
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            mode (str): 캘린더 모드 (market, weekday)
+
+        Returns:
+            List[str]: 거래일 목록 (오름차순, YYYY-MM-DD)
+        """
+        if mode not in GapAnalyzer.CALENDAR_MODES:
+            raise ValueError(f"지원하지 않는 캘린더 모드입니다: {mode} ({', '.join(GapAnalyzer.CALENDAR_MODES)})")
+
+        if mode == 'weekday':
+            current = datetime.strptime(start_date, '%Y-%m-%d').date()
+            last = datetime.strptime(end_date, '%Y-%m-%d').date()
+            days = []
+            while current <= last:
+                if current.weekday() < 5:
+                    days.append(current.strftime('%Y-%m-%d'))
+                current += timedelta(days=1)
+            return days
+
+        rows = db.session.query(StockInvestorTrading.trade_date).filter(
+            StockInvestorTrading.trade_date >= start_date,
+            StockInvestorTrading.trade_date <= end_date
+        ).distinct().order_by(StockInvestorTrading.trade_date.asc()).all()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _group_ranges(missing_dates: List[str], calendar: List[str]) -> List[Dict]:
+        """캘린더상 연속된 누락일을 구간으로 묶습니다."""
+        positions = {day: idx for idx, day in enumerate(calendar)}
+        ranges = []
+
+        for day in missing_dates:
+            idx = positions[day]
+            if ranges and ranges[-1]['_last_idx'] == idx - 1:
+                ranges[-1]['end_date'] = day
+                ranges[-1]['days'] += 1
+                ranges[-1]['_last_idx'] = idx
+            else:
+                ranges.append({'start_date': day, 'end_date': day, 'days': 1, '_last_idx': idx})
+
+        for item in ranges:
+            item.pop('_last_idx')
+        return ranges
+
+    @staticmethod
+    def pages_for_dates(dates: List[str], stored_dates: List[str]) -> List[int]:
+        """
+        날짜 목록을 포함하는 frgn.naver 페이지 번호 계산
+
+        frgn.naver는 해당 종목의 실제 거래일을 최신순으로 페이지당 ROWS_PER_PAGE 건씩 보여줍니다.
+        캘린더의 날짜 수는 휴장일(weekday 모드)이나 거래정지일 때문에 실제 행 수와 어긋나므로,
+        종목에 저장된 거래일을 기준으로 위치를 계산합니다. 각 날짜의 실제 위치는
+        (더 최신인 저장 거래일 수) 이상, (여기에 더 최신인 누락 날짜 수를 더한 값) 이하이므로
+        그 범위에 걸친 페이지를 모두 포함하고 앞뒤로 PAGE_MARGIN 페이지를 더합니다.
+
+        Args:
+            dates (List[str]): 대상 날짜 목록 (누락 날짜)
+            stored_dates (List[str]): 종목에 저장된 거래일 목록
+
+        Returns:
+            List[int]: 페이지 번호 목록 (오름차순, 1부터 시작)
+        """
+        if not dates:
+            return []
+
+        stored = sorted(stored_dates)
+        targets = sorted(set(dates))
+        pages = set()
+
+        for idx, day in enumerate(targets):
+            stored_newer = len(stored) - bisect.bisect_right(stored, day)
+            missing_newer = len(targets) - idx - 1
+            first_page = stored_newer // GapAnalyzer.ROWS_PER_PAGE + 1
+            last_page = (stored_newer + missing_newer) // GapAnalyzer.ROWS_PER_PAGE + 1
+            for candidate in range(first_page - GapAnalyzer.PAGE_MARGIN, last_page + GapAnalyzer.PAGE_MARGIN + 1):
+                if candidate >= 1:
+                    pages.add(candidate)
+
+        return sorted(pages)
+
+    @staticmethod
+    def _slice_calendar(calendar: List[str], start_date: str, end_date: str) -> List[str]:
+        """오름차순 캘린더에서 [start_date, end_date] 구간만 잘라냄 (이진 탐색)"""
+        return calendar[bisect.bisect_left(calendar, start_date):bisect.bisect_right(calendar, end_date)]
+
+    @staticmethod
+    def analyze_stock(
+        stock_code: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        mode: str = 'market'
+    ) -> Dict:
+        """
+        특정 종목의 누락 구간 분석
+
+        Args:
+            stock_code (str): 주식 코드
+            start_date (Optional[str]): 분석 시작 날짜 (없으면 상장일 또는 저장된 최초 거래일)
+            end_date (Optional[str]): 분석 종료 날짜 (없으면 오늘)
+            mode (str): 캘린더 모드 (market, weekday)
+
+        Returns:
+            Dict: 누락 구간 분석 결과
+        """
+        stock = StockService.get_stock_by_code(stock_code)
+        if not stock:
+            raise ValueError(f"주식 코드 '{stock_code}'을 찾을 수 없습니다.")
+        return GapAnalyzer._analyze(stock, start_date, end_date, mode)
+
+    @staticmethod
+    def _analyze(
+        stock: StockList,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        mode: str,
+        calendar: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        종목 하나의 누락 구간 분석
+
+        Args:
+            stock (StockList): 주식 정보
+            start_date (Optional[str]): 분석 시작 날짜
+            end_date (Optional[str]): 분석 종료 날짜
+            mode (str): 캘린더 모드 (market, weekday)
+            calendar (Optional[List[str]]): 분석 구간을 포함하는 거래일 캘린더 (없으면 직접 조회)
+
+        Returns:
+            Dict: 누락 구간 분석 결과
+        """
+        stored = [
+            row[0] for row in db.session.query(StockInvestorTrading.trade_date).filter(
+                StockInvestorTrading.stock_code == stock.stock_code
+            ).all()
+        ]
+
+        end_date = end_date or date.today().strftime('%Y-%m-%d')
+        lower_bounds = [d for d in (start_date, stock.init_date) if d]
+        if lower_bounds:
+            start_date = max(lower_bounds)
+        elif stored:
+            start_date = min(stored)
+        else:
+            start_date = end_date
+
+        if calendar is None:
+            calendar = GapAnalyzer.get_trading_calendar(start_date, end_date, mode)
+        else:
+            calendar = GapAnalyzer._slice_calendar(calendar, start_date, end_date)
+        stored_set = {day for day in stored if start_date <= day <= end_date}
+        missing = [day for day in calendar if day not in stored_set]
+
+        return {
+            'stock_code': stock.stock_code,
+            'stock_name': stock.stock_name,
+            'start_date': start_date,
+            'end_date': end_date,
+            'calendar_mode': mode,
+            'calendar_days': len(calendar),
+            'stored_days': len(stored_set),
+            'missing_days': len(missing),
+            'missing_dates': missing,
+            'missing_ranges': GapAnalyzer._group_ranges(missing, calendar)
+        }
+
+    @staticmethod
+    def analyze_all(
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        mode: str = 'market',
+        only_with_gaps: bool = True
+    ) -> List[Dict]:
+        """
+        전체 종목의 누락 구간 분석
+
+        거래일 캘린더는 가장 넓은 구간으로 한 번만 조회하고 종목마다 분석 구간만큼 잘라 씁니다.
+
+        Args:
+            start_date (Optional[str]): 분석 시작 날짜
+            end_date (Optional[str]): 분석 종료 날짜
+            mode (str): 캘린더 모드 (market, weekday)
+            only_with_gaps (bool): 누락이 있는 종목만 반환할지 여부
+
+        Returns:
+            List[Dict]: 종목별 분석 결과 (누락 날짜 목록 제외)
+        """
+        end_date = end_date or date.today().strftime('%Y-%m-%d')
+        stocks = StockService.get_all_stocks()
+        if start_date:
+            widest_start = start_date
+        else:
+            # 종목별 시작일은 상장일 또는 저장된 최초 거래일이므로 그중 가장 이른 날짜부터
+            lower_bounds = [stock.init_date for stock in stocks if stock.init_date]
+            first_stored = db.session.query(db.func.min(StockInvestorTrading.trade_date)).scalar()
+            if first_stored:
+                lower_bounds.append(first_stored)
+            widest_start = min(lower_bounds, default=end_date)
+        calendar = GapAnalyzer.get_trading_calendar(widest_start, end_date, mode)
+
+        results = []
+        for stock in stocks:
+            try:
+                result = GapAnalyzer._analyze(stock, start_date, end_date, mode, calendar)
+            except Exception as e:
+                logger.warning(f"누락 구간 분석 실패: {stock.stock_code}, {e}")
+                continue
+
+            if only_with_gaps and result['missing_days'] == 0:
+                continue
+            result.pop('missing_dates')
+            results.append(result)
+        return results
+
+    @staticmethod
+    def plan_gap_fill(stock_code: str, mode: str = 'market', max_pages: int = 50) -> Dict:
+        """
+        누락 구간을 보충하기 위해 수집해야 할 페이지 계획 수립
+
+        Args:
+            stock_code (str): 주식 코드
+            mode (str): 캘린더 모드 (market, weekday)
+            max_pages (int): 수집할 최대 페이지 번호
+
+        Returns:
+            Dict: 누락 날짜 목록과 수집할 페이지 번호 목록
+        """
+        analysis = GapAnalyzer.analyze_stock(stock_code, mode=mode)
+        if not analysis['missing_dates']:
+            return {'missing_dates': [], 'pages': []}
+
+        # 페이지 번호는 종목의 최신 거래일부터 세므로 가장 오래된 누락 날짜 이후의 저장 거래일을 기준으로 계산
+        stored = [
+            row[0] for row in db.session.query(StockInvestorTrading.trade_date).filter(
+                StockInvestorTrading.stock_code == stock_code,
+                StockInvestorTrading.trade_date > analysis['missing_dates'][0]
+            ).all()
+        ]
+        pages = [p for p in GapAnalyzer.pages_for_dates(analysis['missing_dates'], stored) if p <= max_pages]
+        return {'missing_dates': analysis['missing_dates'], 'pages': pages}
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+히스토리 콜드 스토리지 아카이브 서비스
+보존 기간(N일)이 지난 data_history / system_log 행을 월별 압축 컬럼형 파일로 옮기고
+history_archive 매니페스트 테이블에 기록합니다. 라이브 테이블은 최근 데이터만 유지합니다.
+
+파일 형식: gzip으로 압축한 JSON, 컬럼별 값 배열 ({'columns': [...], 'data': {컬럼: [값...]}})
+파일 이름 규칙: {테이블명}_{YYYYMM}_{첫 id}-{마지막 id}.json.gz
+
+아카이브 시점에 cutoff 이전 행을 모두 옮기므로, 아카이브된 행은 같은 테이블의 라이브 행보다 항상 오래되었습니다.
+"""
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.models.history import DataHistory, SystemLog, HistoryArchive
+from backend.services.history_partition import HistoryPartitionService
+from backend.utils.pagination import NEXT
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+ARCHIVE_MODELS = {
+    'data_history': DataHistory,
+    'system_log': SystemLog,
+}
+
+
+def _read_archive_file(path: str) -> Dict[str, Any]:
+    """아카이브 파일 읽기 (한 달 분량이므로 캐시하지 않고 필요할 때만 읽음)"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        payload = json.load(f)
+    if payload.get('version') != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 아카이브 파일 버전입니다: {path}")
+    return payload
+
+
+class HistoryArchiveService:
+    """히스토리 아카이브 서비스 클래스"""
+
+    FETCH_SIZE = 5000           # 아카이브 대상 행 조회 단위
+    DELETE_CHUNK_SIZE = 10000   # 아카이브 후 행 삭제 청크 크기
+    COMPRESS_LEVEL = 6
+
+    @staticmethod
+    def _settings() -> Dict[str, Any]:
+        return current_app.config.get('HISTORY_ARCHIVE', {})
+
+    @staticmethod
+    def _directory() -> str:
+        directory = HistoryArchiveService._settings().get(
+            'directory', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'archive')
+        )
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    @staticmethod
+    def _model(table: str):
+        if table not in ARCHIVE_MODELS:
+            raise ValueError(f"아카이브 대상이 아닌 테이블입니다: {table}")
+        return ARCHIVE_MODELS[table]
+
+    # ------------------------------------------------------------------
+    # 아카이브
+    # ------------------------------------------------------------------
+    @staticmethod
+    def archive(table: str, cutoff: datetime) -> Dict[str, Any]:
+        """
+        cutoff 이전 행을 월별 아카이브 파일로 옮기기 (월마다 커밋)
+
+        Args:
+            table (str): data_history 또는 system_log
+            cutoff (datetime): 이 시각 이전 행을 아카이브
+
+        Returns:
+            Dict[str, Any]: 생성된 아카이브 목록, 옮긴 행 수
+        """
+        model = HistoryArchiveService._model(table)
+        months = [row[0] for row in db.session.query(db.func.date_trunc('month', model.created_at))
+                  .filter(model.created_at < cutoff).distinct().order_by(1).all()]
+
+        result = {'table': table, 'archives': [], 'archived_rows': 0}
+        for month_start in months:
+            year, month = HistoryPartitionService._add_months(month_start.year, month_start.month, 1)
+            month_end = datetime(year, month, 1)
+            archive = HistoryArchiveService._archive_range(
+                table, month_start, min(month_end, cutoff), whole_month=month_end <= cutoff
+            )
+            if archive is not None:
+                result['archives'].append(archive.to_dict())
+                result['archived_rows'] += archive.row_count
+
+        logger.info(f"{table} 아카이브 완료: 파일 {len(result['archives'])}개, {result['archived_rows']}건")
+        return result
+
+    @staticmethod
+    def _archive_range(table: str, start: datetime, end: datetime, whole_month: bool) -> Optional[HistoryArchive]:
+        """[start, end) 구간 행을 파일로 쓰고 매니페스트 기록 후 라이브 테이블에서 제거"""
+        model = HistoryArchiveService._model(table)
+        columns = [column.name for column in model.__table__.columns]
+        query = db.session.query(*[model.__table__.c[name] for name in columns]).filter(
+            model.created_at >= start, model.created_at < end
+        ).order_by(model.created_at, model.id)
+
+        data = {name: [] for name in columns}
+        for row in query.yield_per(HistoryArchiveService.FETCH_SIZE):
+            for name, value in zip(columns, row):
+                data[name].append(value.isoformat() if isinstance(value, datetime) else value)
+
+        ids = data['id']
+        if not ids:
+            return None
+
+        year_month = f'{start.year:04d}-{start.month:02d}'
+        file_name = f'{table}_{start.year:04d}{start.month:02d}_{ids[0]}-{ids[-1]}.json.gz'
+        path = os.path.join(HistoryArchiveService._directory(), file_name)
+        payload = {
+            'version': FORMAT_VERSION,
+            'table': table,
+            'year_month': year_month,
+            'columns': columns,
+            'row_count': len(ids),
+            'data': data
+        }
+
+        # 임시 파일에 쓴 뒤 이름을 바꿔 불완전한 파일이 남지 않게 함
+        temp_path = path + '.tmp'
+        level = HistoryArchiveService._settings().get('compress_level', HistoryArchiveService.COMPRESS_LEVEL)
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=level) as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+        try:
+            archive = HistoryArchive(
+                table_name=table,
+                year_month=year_month,
+                file_name=file_name,
+                row_count=len(ids),
+                min_created_at=datetime.fromisoformat(data['created_at'][0]),
+                max_created_at=datetime.fromisoformat(data['created_at'][-1]),
+                size_bytes=os.path.getsize(path)
+            )
+            db.session.add(archive)
+            HistoryArchiveService._remove_live_rows(table, start, end, ids, whole_month)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            os.remove(path)
+            raise
+
+        logger.info(f"히스토리 아카이브 생성: {file_name} ({len(ids)}건, {archive.size_bytes:,d} bytes)")
+        return archive
+
+    @staticmethod
+    def _remove_live_rows(table: str, start: datetime, end: datetime, ids: List[int], whole_month: bool) -> None:
+        """
+        아카이브한 행 제거 (한 달 전체를 옮긴 파티션은 통째로 제거, 커밋은 호출자가 관리)
+
+        월 파티션이 생기기 전에 default 파티션에 들어간 같은 달의 행도 아카이브에 포함되었으므로,
+        파티션을 제거한 뒤에도 남은 행을 id로 삭제해 라이브 테이블과 아카이브에 중복되지 않게 합니다.
+        """
+        if whole_month and HistoryPartitionService.is_partitioned(table):
+            partition = HistoryPartitionService._partition_name(table, start.year, start.month)
+            if any(p['name'] == partition for p in HistoryPartitionService.list_partitions(table)):
+                db.session.execute(text(f"DROP TABLE IF EXISTS {partition}"))
+
+        model = HistoryArchiveService._model(table)
+        for offset in range(0, len(ids), HistoryArchiveService.DELETE_CHUNK_SIZE):
+            chunk = ids[offset:offset + HistoryArchiveService.DELETE_CHUNK_SIZE]
+            model.query.filter(
+                model.created_at >= start, model.created_at < end, model.id.in_(chunk)
+            ).delete(synchronize_session=False)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def list_archives(table: Optional[str] = None) -> List[HistoryArchive]:
+        """
+        아카이브 매니페스트 조회
+
+        Args:
+            table (Optional[str]): 테이블명 필터
+
+        Returns:
+            List[HistoryArchive]: 아카이브 목록 (오래된 순)
+        """
+        query = HistoryArchive.query
+        if table:
+            query = query.filter(HistoryArchive.table_name == table)
+        return query.order_by(HistoryArchive.min_created_at, HistoryArchive.id).all()
+
+    @staticmethod
+    def _manifests(table: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> List[HistoryArchive]:
+        query = HistoryArchive.query.filter(HistoryArchive.table_name == table)
+        if start_date:
+            query = query.filter(HistoryArchive.max_created_at >= start_date)
+        if end_date:
+            query = query.filter(HistoryArchive.min_created_at <= end_date)
+        return query.order_by(HistoryArchive.min_created_at).all()
+
+    @staticmethod
+    def latest_archived_at(table: str) -> Optional[datetime]:
+        """
+        아카이브된 행 중 가장 최근 생성 시간
+
+        Args:
+            table (str): 테이블명
+
+        Returns:
+            Optional[datetime]: 가장 최근 아카이브 행의 created_at (아카이브가 없으면 None)
+        """
+        return db.session.query(db.func.max(HistoryArchive.max_created_at)).filter(
+            HistoryArchive.table_name == table
+        ).scalar()
+
+    @staticmethod
+    def reaches_archive(table: str, start_date: Optional[datetime], position: Optional[datetime] = None) -> bool:
+        """
+        조회 범위가 아카이브 구간까지 내려가는지 여부
+
+        시작 날짜나 커서 위치가 아카이브 경계(가장 최근 아카이브 행의 created_at) 이전일 때만 True입니다.
+        날짜 범위 없이 조회하면 라이브 테이블만 사용합니다.
+
+        Args:
+            table (str): 테이블명
+            start_date (Optional[datetime]): 조회 시작 날짜
+            position (Optional[datetime]): 커서 위치의 created_at
+
+        Returns:
+            bool: 아카이브 파일을 읽어야 하는지 여부
+        """
+        if start_date is None and position is None:
+            return False
+        latest = HistoryArchiveService.latest_archived_at(table)
+        if latest is None:
+            return False
+        return (start_date is not None and start_date <= latest) or (position is not None and position <= latest)
+
+    @staticmethod
+    def load_rows(table: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                  limit: Optional[int] = None, newest_first: bool = True, **filters) -> List[Any]:
+        """
+        날짜 범위와 겹치는 아카이브 파일에서 행 조회
+
+        매니페스트의 날짜 범위로 먼저 걸러낸 파일만 열고, limit을 지정하면 필요한 행을 채운 뒤
+        나머지 파일은 열지 않습니다. (아카이브 파일끼리는 기간이 겹치지 않음)
+
+        Args:
+            table (str): data_history 또는 system_log
+            start_date (Optional[datetime]): 시작 날짜
+            end_date (Optional[datetime]): 종료 날짜
+            limit (Optional[int]): 필요한 행 수 (없으면 범위 안의 모든 파일)
+            newest_first (bool): 최근 파일부터 읽을지 여부 (이전 페이지 방향은 False)
+            **filters: 컬럼 값 일치 필터 (None 값은 무시)
+
+        Returns:
+            List[Any]: 세션에 연결되지 않은 모델 인스턴스 목록 (created_at, id 내림차순)
+        """
+        model = HistoryArchiveService._model(table)
+        datetime_columns = {column.name for column in model.__table__.columns
+                            if isinstance(column.type, db.DateTime)}
+        filters = {name: value for name, value in filters.items() if value is not None}
+
+        manifests = HistoryArchiveService._manifests(table, start_date, end_date)
+        if newest_first:
+            manifests.reverse()
+
+        items = []
+        directory = HistoryArchiveService._directory()
+        for manifest in manifests:
+            if limit is not None and len(items) >= limit:
+                break
+            path = os.path.join(directory, manifest.file_name)
+            try:
+                payload = _read_archive_file(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"아카이브 파일 읽기 실패 ({manifest.file_name}): {e}")
+                continue
+
+            columns = payload['columns']
+            data = payload['data']
+            for index in range(payload['row_count']):
+                created_at = datetime.fromisoformat(data['created_at'][index])
+                if start_date and created_at < start_date:
+                    continue
+                if end_date and created_at > end_date:
+                    continue
+                values = {name: data[name][index] for name in columns}
+                if any(values.get(name) != value for name, value in filters.items()):
+                    continue
+                for name in datetime_columns:
+                    if values.get(name):
+                        values[name] = datetime.fromisoformat(values[name])
+                items.append(model(**values))
+
+        items.sort(key=lambda item: (item.created_at, item.id), reverse=True)
+        return items
+
+    @staticmethod
+    def supplement_for(table: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                       **filters) -> Callable[[Optional[List[Any]], str, bool], List[Any]]:
+        """
+        KeysetPaginator.page의 supplement 함수 생성
+
+        라이브 테이블만으로 페이지가 채워지거나, 시작 날짜와 커서 위치가 모두 아카이브 경계 이후이면
+        아카이브를 읽지 않습니다. 읽을 때도 커서 위치로 범위를 좁히고 페이지에 필요한 만큼만 읽습니다.
+
+        Args:
+            table (str): data_history 또는 system_log
+            start_date (Optional[datetime]): 시작 날짜
+            end_date (Optional[datetime]): 종료 날짜
+            **filters: 컬럼 값 일치 필터
+
+        Returns:
+            Callable: (커서 키 값, 방향, DB 조회만으로 limit을 넘었는지, 필요한 행 수) -> 아카이브 항목 목록
+        """
+        def supplement(values, direction, has_more, needed):
+            position = values[0] if values is not None else None
+            if direction == NEXT:
+                if has_more or not HistoryArchiveService.reaches_archive(table, start_date, position):
+                    return []
+                # 내림차순 다음 페이지: 커서보다 오래된 행만 필요
+                end = min(end_date, position) if end_date and position else (position or end_date)
+                return HistoryArchiveService.load_rows(table, start_date, end, needed, True, **filters)
+
+            if position is None or not HistoryArchiveService.reaches_archive(table, None, position):
+                return []
+            # 이전 페이지: 커서보다 최근 행만 필요하므로 커서에 가까운 오래된 파일부터 읽음
+            start = max(start_date, position) if start_date else position
+            return HistoryArchiveService.load_rows(table, start, end_date, needed, False, **filters)
+
+        return supplement
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+히스토리 테이블 파티션 관리 서비스
+data_history / system_log 테이블을 created_at 기준 월별 파티션으로 관리하고,
+보존 기간이 지난 데이터는 행 삭제 대신 파티션 단위로 제거합니다.
+
+파티션 이름 규칙: {테이블명}_pYYYYMM (예: data_history_p202410), 범위 밖 데이터는 {테이블명}_default
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from backend.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryPartitionService:
+    """히스토리 테이블 파티션 관리 서비스 클래스"""
+
+    # 테이블명 -> 인덱스 이름: 컬럼 (모델의 __table_args__와 동일하게 유지)
+    TABLES = {
+        'data_history': {
+            'idx_data_history_created_at': ('created_at',),
+            'idx_data_history_table_created': ('table_name', 'created_at'),
+            'idx_data_history_created_id': ('created_at', 'id'),
+        },
+        'system_log': {
+            'idx_system_log_created_at': ('created_at',),
+            'idx_system_log_category_created': ('category', 'created_at'),
+            'idx_system_log_level_created': ('level', 'created_at'),
+            'idx_system_log_created_id': ('created_at', 'id'),
+        },
+    }
+
+    MONTHS_AHEAD = 2            # 미리 만들어 둘 미래 파티션 개수
+    DELETE_CHUNK_SIZE = 10000   # 파티션 경계 달의 행 삭제 청크 크기
+
+    @staticmethod
+    def _add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+        index = year * 12 + (month - 1) + months
+        return index // 12, index % 12 + 1
+
+    @staticmethod
+    def _partition_name(table: str, year: int, month: int) -> str:
+        return f'{table}_p{year:04d}{month:02d}'
+
+    @staticmethod
+    def _validate_table(table: str) -> None:
+        if table not in HistoryPartitionService.TABLES:
+            raise ValueError(f"파티션 관리 대상이 아닌 테이블입니다: {table}")
+
+    @staticmethod
+    def is_partitioned(table: str) -> bool:
+        """
+        테이블이 파티션 테이블인지 확인
+
+        Args:
+            table (str): 테이블명
+
+        Returns:
+            bool: 파티션 테이블 여부
+        """
+        HistoryPartitionService._validate_table(table)
+        result = db.session.execute(text(
+            "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relname = :table AND n.nspname = current_schema()"
+        ), {'table': table}).scalar()
+        return result == 'p'
+
+    @staticmethod
+    def list_partitions(table: str) -> List[Dict]:
+        """
+        월별 파티션 목록 조회
+
+        Args:
+            table (str): 테이블명
+
+        Returns:
+            List[Dict]: 파티션 이름, 연월, 예상 행 수 (오래된 순)
+        """
+        HistoryPartitionService._validate_table(table)
+        rows = db.session.execute(text(
+            "SELECT child.relname, child.reltuples "
+            "FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table "
+            "ORDER BY child.relname"
+        ), {'table': table}).all()
+
+        pattern = re.compile(rf'^{table}_p(\d{{4}})(\d{{2}})$')
+        partitions = []
+        for name, reltuples in rows:
+            match = pattern.match(name)
+            partitions.append({
+                'name': name,
+                'year_month': f'{match.group(1)}-{match.group(2)}' if match else None,
+                'estimated_rows': max(int(reltuples), 0)
+            })
+        return partitions
+
+    @staticmethod
+    def _create_partition(table: str, year: int, month: int) -> None:
+        """
+        월 파티션 생성 (이미 있으면 무시)
+
+        기본 파티션에 그 달의 행이 있으면 PARTITION OF가 실패하므로, 빈 테이블을 만들어 기본 파티션의
+        해당 달 행을 옮긴 뒤 ATTACH PARTITION으로 연결합니다. (인덱스와 기본 키는 연결 시 자동 생성)
+        """
+        name = HistoryPartitionService._partition_name(table, year, month)
+        next_year, next_month = HistoryPartitionService._add_months(year, month, 1)
+        bounds = f"FROM ('{year:04d}-{month:02d}-01') TO ('{next_year:04d}-{next_month:02d}-01')"
+
+        existing = db.session.execute(text("SELECT to_regclass(:name), to_regclass(:default)"), {
+            'name': name, 'default': f'{table}_default'
+        }).one()
+        if existing[0] is not None:
+            return
+        if existing[1] is None:
+            db.session.execute(text(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"))
+            return
+
+        db.session.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        moved = db.session.execute(text(
+            f"WITH moved AS ("
+            f"  DELETE FROM {table}_default WHERE created_at >= :start AND created_at < :end RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ), {
+            'start': datetime(year, month, 1),
+            'end': datetime(next_year, next_month, 1)
+        }).rowcount
+        db.session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}"))
+        if moved:
+            logger.info(f"기본 파티션의 행을 새 파티션으로 이동: {name} ({moved}건)")
+
+    @staticmethod
+    def ensure_partitions(table: str, months_ahead: Optional[int] = None) -> int:
+        """
+        이번 달부터 months_ahead개월 뒤까지의 파티션 생성 (커밋은 호출자가 관리)
+
+        Args:
+            table (str): 테이블명
+            months_ahead (Optional[int]): 미리 만들 미래 파티션 수
+
+        Returns:
+            int: 확인한 파티션 수 (파티션 테이블이 아니면 0)
+        """
+        if not HistoryPartitionService.is_partitioned(table):
+            return 0
+
+        months_ahead = HistoryPartitionService.MONTHS_AHEAD if months_ahead is None else months_ahead
+        now = datetime.utcnow()
+        for offset in range(months_ahead + 1):
+            year, month = HistoryPartitionService._add_months(now.year, now.month, offset)
+            HistoryPartitionService._create_partition(table, year, month)
+        return months_ahead + 1
+
+    @staticmethod
+    def convert_to_partitioned(table: str, months_ahead: Optional[int] = None) -> Dict:
+        """
+        기존 일반 테이블을 월별 파티션 테이블로 변환 (단일 트랜잭션, 커밋 포함)
+
+        기존 테이블을 {table}_legacy로 이름을 바꾼 뒤 같은 컬럼 구성의 파티션 테이블을 만들고,
+        기존 데이터가 걸친 모든 달의 파티션을 생성하여 데이터를 옮깁니다. id 시퀀스는 그대로 이어서 사용합니다.
+
+        Args:
+            table (str): 테이블명
+            months_ahead (Optional[int]): 미리 만들 미래 파티션 수
+
+        Returns:
+            Dict: 변환 결과 (생성된 파티션 수, 이동한 행 수)
+        """
+        HistoryPartitionService._validate_table(table)
+        if HistoryPartitionService.is_partitioned(table):
+            return {'table': table, 'converted': False, 'partitions': 0, 'moved_rows': 0}
+
+        months_ahead = HistoryPartitionService.MONTHS_AHEAD if months_ahead is None else months_ahead
+        legacy = f'{table}_legacy'
+        sequence = f'{table}_id_seq'
+
+        try:
+            db.session.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+            db.session.execute(text(f"ALTER INDEX IF EXISTS {table}_pkey RENAME TO {legacy}_pkey"))
+            db.session.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+            db.session.execute(text(
+                f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING COMMENTS) "
+                f"PARTITION BY RANGE (created_at)"
+            ))
+            db.session.execute(text(f"UPDATE {legacy} SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL"))
+            db.session.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL"))
+            db.session.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc')"))
+            db.session.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)"))
+
+            oldest = db.session.execute(text(f"SELECT min(created_at) FROM {legacy}")).scalar()
+            now = datetime.utcnow()
+            year, month = (oldest.year, oldest.month) if oldest else (now.year, now.month)
+            last_year, last_month = HistoryPartitionService._add_months(now.year, now.month, months_ahead)
+
+            partitions = 0
+            while (year, month) <= (last_year, last_month):
+                HistoryPartitionService._create_partition(table, year, month)
+                partitions += 1
+                year, month = HistoryPartitionService._add_months(year, month, 1)
+            db.session.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+
+            moved = db.session.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}")).rowcount
+            db.session.execute(text(f"DROP TABLE {legacy}"))
+            db.session.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+
+            HistoryPartitionService.create_indexes(table)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(f"{table} 테이블을 월별 파티션으로 변환: 파티션 {partitions}개, {moved}건 이동")
+        return {'table': table, 'converted': True, 'partitions': partitions, 'moved_rows': moved}
+
+    @staticmethod
+    def create_indexes(table: str) -> None:
+        """
+        created_at 및 복합 인덱스 생성 (파티션 테이블이면 모든 파티션에 전파, 커밋은 호출자가 관리)
+
+        Args:
+            table (str): 테이블명
+        """
+        HistoryPartitionService._validate_table(table)
+        for name, columns in HistoryPartitionService.TABLES[table].items():
+            db.session.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+
+    @staticmethod
+    def _delete_in_chunks(table: str, cutoff: datetime, chunk_size: int) -> int:
+        """cutoff 이전 행을 청크 단위로 삭제 (커밋은 호출자가 관리)"""
+        total = 0
+        while True:
+            deleted = db.session.execute(text(
+                f"DELETE FROM {table} WHERE (id, created_at) IN ("
+                f"  SELECT id, created_at FROM {table} WHERE created_at < :cutoff LIMIT :chunk_size"
+                f")"
+            ), {'cutoff': cutoff, 'chunk_size': chunk_size}).rowcount
+            total += deleted
+            if deleted < chunk_size:
+                return total
+
+    @staticmethod
+    def apply_retention(table: str, cutoff: datetime, chunk_size: Optional[int] = None) -> Dict:
+        """
+        보존 기간 적용 (커밋은 호출자가 관리)
+
+        파티션 테이블이면 cutoff 이전에 끝나는 월 파티션을 통째로 제거하고, cutoff가 걸친 달의
+        남은 행만 청크 단위로 삭제합니다. 일반 테이블이면 전체를 청크 단위로 삭제합니다.
+
+        Args:
+            table (str): 테이블명
+            cutoff (datetime): 이 시각 이전 데이터를 삭제
+            chunk_size (Optional[int]): 행 삭제 청크 크기
+
+        Returns:
+            Dict: 제거한 파티션 목록, 삭제한 행 수 (파티션 제거분은 통계 기반 추정치)
+        """
+        HistoryPartitionService._validate_table(table)
+        chunk_size = chunk_size or HistoryPartitionService.DELETE_CHUNK_SIZE
+        result = {'table': table, 'dropped_partitions': [], 'deleted_rows': 0}
+
+        if HistoryPartitionService.is_partitioned(table):
+            cutoff_month = f'{cutoff.year:04d}-{cutoff.month:02d}'
+            for partition in HistoryPartitionService.list_partitions(table):
+                if partition['year_month'] and partition['year_month'] < cutoff_month:
+                    db.session.execute(text(f"DROP TABLE IF EXISTS {partition['name']}"))
+                    result['dropped_partitions'].append(partition['name'])
+                    result['deleted_rows'] += partition['estimated_rows']
+                    logger.info(f"히스토리 파티션 제거: {partition['name']}")
+
+        result['deleted_rows'] += HistoryPartitionService._delete_in_chunks(table, cutoff, chunk_size)
+
+        # 삭제된 구간의 시간별 집계 정리
+        from backend.services.history_rollup import HistoryRollupService
+        HistoryRollupService.prune_before(table, cutoff)
+        return result
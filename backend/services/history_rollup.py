@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+히스토리 집계 서비스
+history_rollup 테이블의 시간별 건수를 관리하고, 히스토리 통계/요약을 집계 테이블에서 조회합니다.
+통계 조회는 히스토리 테이블 크기와 무관하게 일정한 시간에 응답하며, 짧은 TTL 캐시를 둡니다.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.models.history import DataHistory, SystemLog, HistoryRollup
+from backend.utils.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_LOG_TABLE = 'system_log'
+SYSTEM_LOG_ACTION = 'LOG'
+
+_UPSERT_SQL = """
+INSERT INTO history_rollup (hour, table_name, action, level, event_count)
+VALUES (:hour, :table_name, :action, :level, :event_count)
+ON CONFLICT (hour, table_name, action, level) DO UPDATE
+SET event_count = history_rollup.event_count + EXCLUDED.event_count
+"""
+
+_REBUILD_SQL = """
+INSERT INTO history_rollup (hour, table_name, action, level, event_count)
+SELECT date_trunc('hour', created_at), table_name, action, '', count(*)
+FROM data_history
+WHERE created_at >= :start
+GROUP BY 1, 2, 3
+UNION ALL
+SELECT date_trunc('hour', created_at), 'system_log', 'LOG', level, count(*)
+FROM system_log
+WHERE created_at >= :start
+GROUP BY 1, 4
+"""
+
+RollupKey = Tuple[datetime, str, str, str]
+
+
+class HistoryRollupService:
+    """히스토리 집계 서비스 클래스"""
+
+    DEFAULT_CACHE_TTL = 10  # 통계 캐시 유지 시간 (초)
+
+    _cache: Dict[Any, Tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def _hour(value: Optional[datetime]) -> datetime:
+        value = value or datetime.utcnow()
+        return value.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def key_for(model, values: Dict[str, Any]) -> RollupKey:
+        """
+        감사 로그 행의 집계 키 계산
+
+        Args:
+            model: DataHistory 또는 SystemLog 모델 클래스
+            values (Dict[str, Any]): 컬럼 값
+
+        Returns:
+            RollupKey: (시간, 테이블명, 작업 유형, 로그 레벨)
+        """
+        hour = HistoryRollupService._hour(values.get('created_at'))
+        if model is SystemLog:
+            return hour, SYSTEM_LOG_TABLE, SYSTEM_LOG_ACTION, values.get('level') or ''
+        return hour, values.get('table_name') or '', values.get('action') or '', ''
+
+    @staticmethod
+    def increment(counts: Dict[RollupKey, int]) -> None:
+        """
+        집계 건수 증가 (커밋은 호출자가 관리, 히스토리 INSERT와 같은 트랜잭션에서 호출)
+
+        Args:
+            counts (Dict[RollupKey, int]): 집계 키별 증가량
+        """
+        if not counts:
+            return
+        db.session.execute(text(_UPSERT_SQL), [
+            {'hour': hour, 'table_name': table_name, 'action': action, 'level': level, 'event_count': count}
+            for (hour, table_name, action, level), count in counts.items()
+        ])
+
+    @staticmethod
+    def count_batch(batch: Iterable[Tuple[Any, Dict[str, Any]]]) -> Dict[RollupKey, int]:
+        """(모델, 컬럼 값) 목록을 집계 키별 건수로 변환"""
+        return Counter(HistoryRollupService.key_for(model, values) for model, values in batch)
+
+    @staticmethod
+    def rebuild(start: Optional[datetime] = None) -> int:
+        """
+        히스토리 테이블로부터 집계를 다시 계산 (커밋은 호출자가 관리)
+
+        Args:
+            start (Optional[datetime]): 이 시각 이후 구간만 다시 계산 (없으면 전체)
+
+        Returns:
+            int: 생성된 집계 행 수
+        """
+        start_hour = HistoryRollupService._hour(start) if start else datetime(1970, 1, 1)
+        HistoryRollup.query.filter(HistoryRollup.hour >= start_hour).delete(synchronize_session=False)
+        inserted = db.session.execute(text(_REBUILD_SQL), {'start': start_hour}).rowcount
+        HistoryRollupService.invalidate_cache()
+        return inserted
+
+    @staticmethod
+    def backfill_if_empty() -> int:
+        """
+        집계 테이블이 비어 있고 히스토리가 있으면 전체 집계 생성 (배포 직후 1회, 커밋은 호출자가 관리)
+
+        여러 워커가 동시에 시작해도 advisory lock으로 한 번만 실행합니다.
+
+        Returns:
+            int: 생성된 집계 행 수 (이미 집계가 있거나 히스토리가 없으면 0)
+        """
+        db.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('history_rollup_backfill'))"))
+        if db.session.query(HistoryRollup.id).first() is not None:
+            return 0
+        if db.session.query(DataHistory.id).first() is None and db.session.query(SystemLog.id).first() is None:
+            return 0
+        inserted = HistoryRollupService.rebuild()
+        logger.info(f"히스토리 집계가 비어 있어 기존 히스토리로 생성: {inserted}건")
+        return inserted
+
+    @staticmethod
+    def prune_before(table: str, cutoff: datetime) -> None:
+        """
+        보존 기간 적용 후 cutoff 이전 집계 제거 및 경계 시간 재계산 (커밋은 호출자가 관리)
+
+        Args:
+            table (str): data_history 또는 system_log
+            cutoff (datetime): 삭제 기준 시각
+        """
+        cutoff_hour = HistoryRollupService._hour(cutoff)
+        query = HistoryRollup.query.filter(HistoryRollup.hour <= cutoff_hour)
+        if table == SYSTEM_LOG_TABLE:
+            query = query.filter(HistoryRollup.table_name == SYSTEM_LOG_TABLE)
+            query.delete(synchronize_session=False)
+            rows = db.session.query(SystemLog.level, db.func.count(SystemLog.id)).filter(
+                SystemLog.created_at >= cutoff_hour,
+                SystemLog.created_at < cutoff_hour + timedelta(hours=1)
+            ).group_by(SystemLog.level).all()
+            counts = {(cutoff_hour, SYSTEM_LOG_TABLE, SYSTEM_LOG_ACTION, level): count for level, count in rows}
+        else:
+            query = query.filter(HistoryRollup.table_name != SYSTEM_LOG_TABLE)
+            query.delete(synchronize_session=False)
+            rows = db.session.query(DataHistory.table_name, DataHistory.action, db.func.count(DataHistory.id)).filter(
+                DataHistory.created_at >= cutoff_hour,
+                DataHistory.created_at < cutoff_hour + timedelta(hours=1)
+            ).group_by(DataHistory.table_name, DataHistory.action).all()
+            counts = {(cutoff_hour, table_name, action, ''): count for table_name, action, count in rows}
+
+        HistoryRollupService.increment(counts)
+        HistoryRollupService.invalidate_cache()
+
+    # ------------------------------------------------------------------
+    # 조회 (TTL 캐시)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _cache_ttl() -> float:
+        if has_app_context():
+            return current_app.config.get('HISTORY_STATS_CACHE_TTL', HistoryRollupService.DEFAULT_CACHE_TTL)
+        return HistoryRollupService.DEFAULT_CACHE_TTL
+
+    @staticmethod
+    def _cached(key, loader):
+        ttl = HistoryRollupService._cache_ttl()
+        now = time.monotonic()
+        with HistoryRollupService._cache_lock:
+            entry = HistoryRollupService._cache.get(key)
+            if entry and now - entry[0] < ttl:
+                return entry[1]
+
+        # TTL 만료 직후 동시 요청은 조회 하나로 합침
+        value = single_flight.do(('history_rollup', key), loader)
+        if ttl > 0:
+            with HistoryRollupService._cache_lock:
+                HistoryRollupService._cache[key] = (now, value)
+        return value
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """통계 캐시 비우기"""
+        with HistoryRollupService._cache_lock:
+            HistoryRollupService._cache.clear()
+
+    @staticmethod
+    def _sum_by(columns, start: Optional[datetime] = None, system: bool = False):
+        query = db.session.query(*columns, db.func.coalesce(db.func.sum(HistoryRollup.event_count), 0))
+        if system:
+            query = query.filter(HistoryRollup.table_name == SYSTEM_LOG_TABLE)
+        else:
+            query = query.filter(HistoryRollup.table_name != SYSTEM_LOG_TABLE)
+        if start is not None:
+            query = query.filter(HistoryRollup.hour >= HistoryRollupService._hour(start))
+        if columns:
+            return {row[0]: int(row[-1]) for row in query.group_by(*columns).all()}
+        return int(query.scalar())
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """
+        히스토리 통계 조회 (/history/stats 응답 형식)
+
+        Returns:
+            Dict[str, Any]: 전체/오늘 건수, 작업별·레벨별 건수
+        """
+        def load():
+            today_start = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+            return {
+                'total_data_history': HistoryRollupService._sum_by([]),
+                'total_system_logs': HistoryRollupService._sum_by([], system=True),
+                'today_data_history': HistoryRollupService._sum_by([], start=today_start),
+                'today_system_logs': HistoryRollupService._sum_by([], start=today_start, system=True),
+                'action_stats': HistoryRollupService._sum_by([HistoryRollup.action]),
+                'level_stats': HistoryRollupService._sum_by([HistoryRollup.level], system=True)
+            }
+
+        return HistoryRollupService._cached(('stats', datetime.utcnow().date()), load)
+
+    @staticmethod
+    def get_activity_summary(days: int = 7) -> Dict[str, Any]:
+        """
+        기간별 활동 요약 조회 (시간 단위로 집계하므로 시작 시각은 정시로 내림)
+
+        Args:
+            days (int): 조회할 일수
+
+        Returns:
+            Dict[str, Any]: 전체 활동 수, 작업별·테이블별 건수, 조회 기간
+        """
+        def load():
+            end_date = datetime.utcnow()
+            start_date = end_date - timedelta(days=days)
+            return {
+                'total_activities': HistoryRollupService._sum_by([], start=start_date),
+                'action_stats': HistoryRollupService._sum_by([HistoryRollup.action], start=start_date),
+                'table_stats': HistoryRollupService._sum_by([HistoryRollup.table_name], start=start_date),
+                'period': {
+                    'start_date': start_date.isoformat(),
+                    'end_date': end_date.isoformat(),
+                    'days': days
+                }
+            }
+
+        return HistoryRollupService._cached(('summary', days), load)
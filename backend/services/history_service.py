@@ -5,13 +5,50 @@ CRUD 작업의 히스토리를 관리합니다.
 """
 from backend.models.history import DataHistory, SystemLog
 from backend.extensions import db
+from backend.services.audit_writer import audit_writer
+from backend.services.history_archive import HistoryArchiveService
+from backend.services.history_rollup import HistoryRollupService
+from backend.utils.pagination import KeysetPaginator
+from backend.utils.single_flight import single_flight
 from datetime import datetime
 import json
-from flask import request
+from flask import request, has_request_context
 
 class HistoryService:
     """히스토리 관리 서비스 클래스"""
     
+    @staticmethod
+    def _request_info():
+        """요청 컨텍스트의 IP 주소와 User Agent (백그라운드 작업에서는 None)"""
+        if not has_request_context():
+            return None, None
+        return request.remote_addr, request.headers.get('User-Agent')
+    
+    @staticmethod
+    def _record(model, values):
+        """
+        감사 로그 행 기록
+        
+        비동기 기록기가 활성화되어 있으면 큐에 넣고 즉시 반환하며,
+        그렇지 않으면 현재 세션에 추가하고 커밋합니다.
+        
+        Returns:
+            모델 객체 (동기 기록 시) 또는 None (큐에 넣은 경우)
+        """
+        if audit_writer.enabled and audit_writer.app is not None:
+            audit_writer.submit(model, values)
+            return None
+        
+        try:
+            record = model(**values)
+            db.session.add(record)
+            HistoryRollupService.increment({HistoryRollupService.key_for(model, values): 1})
+            db.session.commit()
+            return record
+        except Exception as e:
+            db.session.rollback()
+            raise e
+    
     @staticmethod
     def log_data_change(table_name, record_id, action, field_name=None, 
                        old_value=None, new_value=None, description=None, user_id=None):
@@ -28,39 +65,29 @@ class HistoryService:
             description (str, optional): 작업 설명
             user_id (int, optional): 사용자 ID
         """
-        try:
-            # IP 주소와 User Agent 가져오기
-            ip_address = request.remote_addr if request else None
-            user_agent = request.headers.get('User-Agent') if request else None
-            
-            # 값들을 문자열로 변환
-            if old_value is not None and not isinstance(old_value, str):
-                old_value = json.dumps(old_value, ensure_ascii=False)
-            if new_value is not None and not isinstance(new_value, str):
-                new_value = json.dumps(new_value, ensure_ascii=False)
-            
-            # 히스토리 레코드 생성
-            history = DataHistory(
-                table_name=table_name,
-                record_id=record_id,
-                action=action,
-                field_name=field_name,
-                old_value=old_value,
-                new_value=new_value,
-                description=description,
-                user_id=user_id,
-                ip_address=ip_address,
-                user_agent=user_agent
-            )
-            
-            db.session.add(history)
-            db.session.commit()
-            
-            return history
-            
-        except Exception as e:
-            db.session.rollback()
-            raise e
+        # IP 주소와 User Agent 가져오기
+        ip_address, user_agent = HistoryService._request_info()
+        
+        # 값들을 문자열로 변환
+        if old_value is not None and not isinstance(old_value, str):
+            old_value = json.dumps(old_value, ensure_ascii=False)
+        if new_value is not None and not isinstance(new_value, str):
+            new_value = json.dumps(new_value, ensure_ascii=False)
+        
+        # 히스토리 레코드 기록
+        return HistoryService._record(DataHistory, {
+            'table_name': table_name,
+            'record_id': record_id,
+            'action': action,
+            'field_name': field_name,
+            'old_value': old_value,
+            'new_value': new_value,
+            'description': description,
+            'user_id': user_id,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'created_at': datetime.utcnow()
+        })
     
     @staticmethod
     def log_system_event(level, category, message, details=None, user_id=None):
@@ -74,33 +101,25 @@ class HistoryService:
             details (dict, optional): 상세 정보
             user_id (int, optional): 사용자 ID
         """
-        try:
-            # IP 주소 가져오기
-            ip_address = request.remote_addr if request else None
-            
-            # 상세 정보를 JSON으로 변환
-            details_json = json.dumps(details, ensure_ascii=False) if details else None
-            
-            # 시스템 로그 레코드 생성
-            log = SystemLog(
-                level=level,
-                category=category,
-                message=message,
-                details=details_json,
-                user_id=user_id,
-                ip_address=ip_address
-            )
-            
-            db.session.add(log)
-            db.session.commit()
-            
-            return log
-            
-        except Exception as e:
-            db.session.rollback()
-            raise e
+        # IP 주소 가져오기
+        ip_address, _ = HistoryService._request_info()
+        
+        # 상세 정보를 JSON으로 변환
+        details_json = json.dumps(details, ensure_ascii=False) if details else None
+        
+        # 시스템 로그 레코드 기록
+        return HistoryService._record(SystemLog, {
+            'level': level,
+            'category': category,
+            'message': message,
+            'details': details_json,
+            'user_id': user_id,
+            'ip_address': ip_address,
+            'created_at': datetime.utcnow()
+        })
     
     @staticmethod
+    @single_flight.coalesce
     def get_data_history(table_name=None, record_id=None, action=None, 
                         start_date=None, end_date=None, limit=100, offset=0):
         """
@@ -116,8 +135,36 @@ class HistoryService:
             offset (int): 오프셋
             
         Returns:
-            list: 히스토리 목록
+            list: 히스토리 딕셔너리 목록 (라이브 테이블로 부족하면 아카이브 행을 이어서 포함, 동시 요청과 공유)
+        """
+        query = HistoryService._data_history_query(table_name, record_id, action, start_date, end_date)
+        rows = query.order_by(DataHistory.created_at.desc(), DataHistory.id.desc()).limit(limit).offset(offset).all()
+        if len(rows) < limit:
+            rows += HistoryService._archived_rows(
+                'data_history', query, rows, limit, offset, start_date, end_date,
+                table_name=table_name, record_id=record_id, action=action
+            )
+        return rows
+    
+    @staticmethod
+    def _archived_rows(table, query, rows, limit, offset, start_date, end_date, **filters):
         """
+        라이브 테이블 조회 결과가 limit보다 적을 때 이어질 아카이브 행 조회
+        
+        아카이브된 행은 라이브 행보다 항상 오래되었으므로, 라이브 결과 뒤에 이어 붙입니다.
+        시작 날짜가 아카이브 경계 이전인 경우에만 아카이브를 읽습니다.
+        """
+        if not HistoryArchiveService.reaches_archive(table, start_date):
+            return []
+        live_count = offset + len(rows) if rows or not offset else query.count()
+        archive_offset = max(0, offset - live_count)
+        needed = archive_offset + limit - len(rows)
+        archived = HistoryArchiveService.load_rows(table, start_date, end_date, needed, **filters)
+        return archived[archive_offset:needed]
+    
+    @staticmethod
+    def _data_history_query(table_name=None, record_id=None, action=None, start_date=None, end_date=None):
+        """데이터 히스토리 필터 쿼리 (정렬 없이)"""
         query = DataHistory.query
         
         if table_name:
@@ -131,9 +178,37 @@ class HistoryService:
         if end_date:
             query = query.filter(DataHistory.created_at <= end_date)
         
-        return query.order_by(DataHistory.created_at.desc()).limit(limit).offset(offset).all()
+        return query
     
     @staticmethod
+    def get_data_history_page(table_name=None, record_id=None, action=None,
+                              start_date=None, end_date=None, cursor=None, limit=100):
+        """
+        데이터 히스토리 키셋 페이지 조회 (created_at, id 내림차순)
+        
+        Args:
+            table_name (str, optional): 테이블명 필터
+            record_id (int, optional): 레코드 ID 필터
+            action (str, optional): 작업 유형 필터
+            start_date (datetime, optional): 시작 날짜
+            end_date (datetime, optional): 종료 날짜
+            cursor (str, optional): 이전 응답의 next_cursor / prev_cursor (없으면 첫 페이지)
+            limit (int): 페이지 크기
+            
+        Returns:
+            KeysetPage: 히스토리 목록과 다음/이전 페이지 커서
+            
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        query = HistoryService._data_history_query(table_name, record_id, action, start_date, end_date)
+        supplement = HistoryArchiveService.supplement_for(
+            'data_history', start_date, end_date, table_name=table_name, record_id=record_id, action=action
+        )
+        return KeysetPaginator([DataHistory.created_at, DataHistory.id]).page(query, cursor, limit, supplement)
+    
+    @staticmethod
+    @single_flight.coalesce
     def get_system_logs(level=None, category=None, start_date=None, end_date=None, 
                        limit=100, offset=0):
         """
@@ -148,8 +223,19 @@ class HistoryService:
             offset (int): 오프셋
             
         Returns:
-            list: 시스템 로그 목록
+            list: 시스템 로그 딕셔너리 목록 (라이브 테이블로 부족하면 아카이브 행을 이어서 포함, 동시 요청과 공유)
         """
+        query = HistoryService._system_log_query(level, category, start_date, end_date)
+        rows = query.order_by(SystemLog.created_at.desc(), SystemLog.id.desc()).limit(limit).offset(offset).all()
+        if len(rows) < limit:
+            rows += HistoryService._archived_rows(
+                'system_log', query, rows, limit, offset, start_date, end_date, level=level, category=category
+            )
+        return rows
+    
+    @staticmethod
+    def _system_log_query(level=None, category=None, start_date=None, end_date=None):
+        """시스템 로그 필터 쿼리 (정렬 없이)"""
         query = SystemLog.query
         
         if level:
@@ -161,9 +247,36 @@ class HistoryService:
         if end_date:
             query = query.filter(SystemLog.created_at <= end_date)
         
-        return query.order_by(SystemLog.created_at.desc()).limit(limit).offset(offset).all()
+        return query
+    
+    @staticmethod
+    def get_system_logs_page(level=None, category=None, start_date=None, end_date=None,
+                             cursor=None, limit=100):
+        """
+        시스템 로그 키셋 페이지 조회 (created_at, id 내림차순)
+        
+        Args:
+            level (str, optional): 로그 레벨 필터
+            category (str, optional): 카테고리 필터
+            start_date (datetime, optional): 시작 날짜
+            end_date (datetime, optional): 종료 날짜
+            cursor (str, optional): 이전 응답의 next_cursor / prev_cursor (없으면 첫 페이지)
+            limit (int): 페이지 크기
+            
+        Returns:
+            KeysetPage: 시스템 로그 목록과 다음/이전 페이지 커서
+            
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        query = HistoryService._system_log_query(level, category, start_date, end_date)
+        supplement = HistoryArchiveService.supplement_for(
+            'system_log', start_date, end_date, level=level, category=category
+        )
+        return KeysetPaginator([SystemLog.created_at, SystemLog.id]).page(query, cursor, limit, supplement)
     
     @staticmethod
+    @single_flight.coalesce
     def get_latest_activity(table_name=None, limit=10):
         """
         최근 활동 조회
@@ -173,7 +286,7 @@ class HistoryService:
             limit (int): 조회 개수 제한
             
         Returns:
-            list: 최근 활동 목록
+            list: 최근 활동 딕셔너리 목록 (동시 요청과 공유)
         """
         query = DataHistory.query
         
@@ -185,7 +298,7 @@ class HistoryService:
     @staticmethod
     def get_activity_summary(days=7):
         """
-        활동 요약 조회
+        활동 요약 조회 (시간별 집계 테이블 사용)
         
         Args:
             days (int): 조회할 일수
@@ -193,39 +306,4 @@ class HistoryService:
         Returns:
             dict: 활동 요약 정보
         """
-        from datetime import timedelta
-        
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
-        
-        # 전체 활동 수
-        total_activities = DataHistory.query.filter(
-            DataHistory.created_at >= start_date
-        ).count()
-        
-        # 작업별 통계
-        action_stats = db.session.query(
-            DataHistory.action,
-            db.func.count(DataHistory.id).label('count')
-        ).filter(
-            DataHistory.created_at >= start_date
-        ).group_by(DataHistory.action).all()
-        
-        # 테이블별 통계
-        table_stats = db.session.query(
-            DataHistory.table_name,
-            db.func.count(DataHistory.id).label('count')
-        ).filter(
-            DataHistory.created_at >= start_date
-        ).group_by(DataHistory.table_name).all()
-        
-        return {
-            'total_activities': total_activities,
-            'action_stats': {action: count for action, count in action_stats},
-            'table_stats': {table: count for table, count in table_stats},
-            'period': {
-                'start_date': start_date.isoformat(),
-                'end_date': end_date.isoformat(),
-                'days': days
-            }
-        } 
\ No newline at end of file
+        return HistoryRollupService.get_activity_summary(days)
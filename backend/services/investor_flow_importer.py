@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+투자자별 매매동향 파일 일괄 적재 서비스
+KRX/벤더에서 내려받은 CSV·Parquet 덤프를 읽어 stock_investor_trading 테이블에 적재합니다.
+"""
+import os
+import logging
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from backend.extensions import db
+from backend.services.digest_service import DigestService
+from backend.services.stock_service import StockService
+from backend.services.trading_service import TradingService
+
+logger = logging.getLogger(__name__)
+
+
+class InvestorFlowImporter:
+    """
+    투자자별 매매동향 파일 일괄 적재기
+
+    파일 파싱은 여러 프로세스에서 병렬로 수행하고, DB 저장은 메인 프로세스에서
+    다중 행 INSERT로 처리합니다. 저장이 끝나면 데이터가 추가된 종목만 누적값을 재계산합니다.
+
+    워커는 파일을 READ_CHUNK_SIZE 행 단위 청크로 나눠 크기가 제한된 큐로 넘기고, 메인 프로세스는 청크마다
+    저장하고 커밋합니다. 파일 전체를 메모리에 올리지 않습니다. 중복 행은 무시하므로 실패한 파일을 다시 적재해도 안전합니다.
+    """
+
+    SUPPORTED_EXTENSIONS = ('.csv', '.parquet')
+    READ_CHUNK_SIZE = 50000   # 파일 읽기 청크 크기 (행)
+    QUEUE_CHUNKS_PER_WORKER = 2  # 워커당 저장 대기 청크 수 (메모리 상한)
+    INSERT_CHUNK_SIZE = 1000  # INSERT 한 번에 포함할 행 수
+    CSV_ENCODINGS = ['utf-8-sig', 'cp949', 'euc-kr']
+
+    # 벤더별 컬럼명 -> stock_investor_trading 컬럼명
+    COLUMN_ALIASES = {
+        'stock_code': ['stock_code', '종목코드', '단축코드', 'ISU_SRT_CD', 'code'],
+        'stock_name': ['stock_name', '종목명', '한글 종목약명', 'ISU_ABBRV', 'name'],
+        'trade_date': ['trade_date', '일자', '날짜', '거래일', '거래일자', 'TRD_DD', 'date'],
+        'close_price': ['close_price', '종가', 'TDD_CLSPRC', 'close'],
+        'institution_net_buy': ['institution_net_buy', '기관', '기관합계', '기관 순매수', '기관순매수'],
+        'foreigner_net_buy': ['foreigner_net_buy', '외국인', '외국인합계', '외국인 순매수', '외국인순매수'],
+    }
+    REQUIRED_COLUMNS = ['stock_code', 'trade_date']
+    DATE_FORMATS = ['%Y-%m-%d', '%Y%m%d', '%Y.%m.%d', '%Y/%m/%d']
+
+    @staticmethod
+    def discover_files(paths: List[str]) -> List[str]:
+        """
+        입력 경로(파일 또는 디렉터리)에서 적재 대상 파일 목록을 찾습니다.
+
+        Args:
+            paths (List[str]): 파일 또는 디렉터리 경로 목록
+
+        Returns:
+            List[str]: 정렬된 파일 경로 목록
+        """
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, names in os.walk(path):
+                    for name in names:
+                        if name.lower().endswith(InvestorFlowImporter.SUPPORTED_EXTENSIONS):
+                            files.append(os.path.join(root, name))
+            elif os.path.isfile(path) and path.lower().endswith(InvestorFlowImporter.SUPPORTED_EXTENSIONS):
+                files.append(path)
+            else:
+                logger.warning(f"지원하지 않거나 존재하지 않는 경로: {path}")
+        return sorted(files)
+
+    @staticmethod
+    def _iter_frames(file_path: str) -> Iterator[pd.DataFrame]:
+        """파일을 청크 단위 DataFrame으로 순차적으로 읽습니다."""
+        if file_path.lower().endswith('.parquet'):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)") from e
+
+            parquet_file = pq.ParquetFile(file_path)
+            for batch in parquet_file.iter_batches(batch_size=InvestorFlowImporter.READ_CHUNK_SIZE):
+                yield batch.to_pandas()
+            return
+
+        last_error = None
+        for encoding in InvestorFlowImporter.CSV_ENCODINGS:
+            try:
+                reader = pd.read_csv(
+                    file_path,
+                    encoding=encoding,
+                    dtype=str,
+                    chunksize=InvestorFlowImporter.READ_CHUNK_SIZE
+                )
+                for frame in reader:
+                    yield frame
+                return
+            except UnicodeDecodeError as e:
+                last_error = e
+                continue
+        raise ValueError(f"지원되는 인코딩으로 CSV 파일을 읽을 수 없습니다: {file_path} ({last_error})")
+
+    @staticmethod
+    def _resolve_columns(columns: List[str]) -> Dict[str, str]:
+        """원본 컬럼명을 모델 컬럼명으로 매핑합니다."""
+        normalized = {str(col).strip(): col for col in columns}
+        mapping = {}
+        for target, aliases in InvestorFlowImporter.COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in normalized:
+                    mapping[normalized[alias]] = target
+                    break
+        return mapping
+
+    @staticmethod
+    def _parse_date(value) -> Optional[str]:
+        """다양한 날짜 표기를 YYYY-MM-DD 문자열로 변환합니다."""
+        # NaT도 strftime을 갖고 있지만 호출하면 ValueError가 나므로 결측값을 먼저 확인
+        if value is None or pd.isna(value):
+            return None
+        if hasattr(value, 'strftime'):
+            return value.strftime('%Y-%m-%d')
+
+        text_value = str(value).strip()
+        for fmt in InvestorFlowImporter.DATE_FORMATS:
+            try:
+                return datetime.strptime(text_value, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return None
+
+    @staticmethod
+    def _parse_int(value) -> Optional[int]:
+        """콤마/부호가 포함된 숫자 문자열을 정수로 변환합니다."""
+        if value is None or pd.isna(value):
+            return None
+        text_value = str(value).strip().replace(',', '').replace('+', '')
+        if not text_value or text_value in ('-', '--'):
+            return None
+        try:
+            return int(float(text_value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_file(file_path: str) -> Iterator[Tuple[List[Dict], int]]:
+        """
+        한 파일을 스트리밍으로 읽어 청크별로 정규화된 행 목록을 만듭니다. (워커 프로세스에서 실행)
+
+        Args:
+            file_path (str): 파일 경로
+
+        Yields:
+            Tuple[List[Dict], int]: (정규화된 행 목록, 건너뛴 행 수), 최대 READ_CHUNK_SIZE 행 단위
+
+        Raises:
+            ValueError: 필수 컬럼이 없거나 파일을 읽을 수 없는 경우
+        """
+        for frame in InvestorFlowImporter._iter_frames(file_path):
+            mapping = InvestorFlowImporter._resolve_columns(list(frame.columns))
+            missing = [col for col in InvestorFlowImporter.REQUIRED_COLUMNS if col not in mapping.values()]
+            if missing:
+                raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing)} ({file_path})")
+
+            frame = frame[list(mapping.keys())].rename(columns=mapping)
+            rows = []
+            skipped = 0
+
+            for record in frame.itertuples(index=False):
+                record = record._asdict()
+
+                stock_code = str(record.get('stock_code') or '').strip()
+                if stock_code.isdigit():
+                    stock_code = stock_code.zfill(6)
+                trade_date = InvestorFlowImporter._parse_date(record.get('trade_date'))
+
+                if not TradingService.validate_stock_code(stock_code) or not trade_date:
+                    skipped += 1
+                    continue
+
+                stock_name = record.get('stock_name')
+                rows.append({
+                    'stock_code': stock_code,
+                    'stock_name': str(stock_name).strip() if stock_name and not pd.isna(stock_name) else None,
+                    'trade_date': trade_date,
+                    'close_price': InvestorFlowImporter._parse_int(record.get('close_price')),
+                    'institution_net_buy': InvestorFlowImporter._parse_int(record.get('institution_net_buy')),
+                    'foreigner_net_buy': InvestorFlowImporter._parse_int(record.get('foreigner_net_buy')),
+                    'institution_accum': 0,
+                    'foreigner_accum': 0,
+                })
+
+            yield rows, skipped
+
+    @staticmethod
+    def _parse_worker(file_path: str, out_queue) -> None:
+        """파일을 청크 단위로 파싱해 큐에 넣습니다. (워커 프로세스에서 실행, 마지막 메시지는 done 또는 error)"""
+        try:
+            for rows, skipped in InvestorFlowImporter.parse_file(file_path):
+                out_queue.put(('rows', file_path, rows, skipped))
+            out_queue.put(('done', file_path, None, 0))
+        except Exception as e:
+            out_queue.put(('error', file_path, str(e), 0))
+
+    @staticmethod
+    def _refresh_digests(rows: List[Dict]) -> None:
+        """적재된 행이 속한 종목-월의 다이제스트를 갱신합니다."""
+        months_by_stock: Dict[str, Set[str]] = {}
+        for row in rows:
+            months_by_stock.setdefault(row['stock_code'], set()).add(row['trade_date'][:7])
+        for stock_code, months in months_by_stock.items():
+            DigestService.refresh_months(stock_code, list(months))
+
+    @staticmethod
+    def import_paths(
+        paths: List[str],
+        workers: int = 2,
+        recalculate_accum: bool = True,
+        dry_run: bool = False
+    ) -> Dict[str, any]:
+        """
+        파일/디렉터리 목록을 적재합니다. (Flask 앱 컨텍스트 안에서 호출)
+
+        Args:
+            paths (List[str]): 파일 또는 디렉터리 경로 목록
+            workers (int): 파싱 워커 프로세스 수
+            recalculate_accum (bool): 적재 후 영향받은 종목의 누적값 재계산 여부
+            dry_run (bool): True이면 파싱만 하고 DB에 저장하지 않음
+
+        Returns:
+            Dict: 적재 결과 통계
+        """
+        results = {
+            'total_files': 0,
+            'processed_files': 0,
+            'failed_files': [],
+            'parsed_rows': 0,
+            'skipped_rows': 0,
+            'inserted_rows': 0,
+            'affected_stocks': [],
+            'accum_failed': []
+        }
+
+        files = InvestorFlowImporter.discover_files(paths)
+        results['total_files'] = len(files)
+        if not files:
+            logger.warning("적재할 파일이 없습니다.")
+            return results
+
+        # 주식명이 없는 파일을 위해 종목 마스터를 미리 조회
+        stock_names = {stock.stock_code: stock.stock_name for stock in StockService.get_all_stocks()}
+        affected: Set[str] = set()
+
+        logger.info(f"투자자별 매매동향 파일 적재 시작: {len(files)}개 파일, 워커 {workers}개")
+
+        workers = max(1, workers)
+        file_rows = {path: {'parsed': 0, 'inserted': 0} for path in files}
+        failed: Set[str] = set()
+
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=workers) as pool:
+            out_queue = manager.Queue(maxsize=workers * InvestorFlowImporter.QUEUE_CHUNKS_PER_WORKER)
+            futures = [pool.submit(InvestorFlowImporter._parse_worker, path, out_queue) for path in files]
+            remaining = set(files)
+
+            while remaining:
+                try:
+                    kind, path, payload, skipped = out_queue.get(timeout=1)
+                except queue.Empty:
+                    if all(future.done() for future in futures) and out_queue.empty():
+                        # 워커 프로세스가 비정상 종료되어 완료 메시지가 오지 않은 파일
+                        for path in sorted(remaining):
+                            logger.error(f"파일 파싱 실패: {path}, 워커 프로세스가 비정상 종료되었습니다")
+                            results['failed_files'].append(f"{path}: 워커 프로세스가 비정상 종료되었습니다")
+                        break
+                    continue
+
+                if kind == 'error':
+                    remaining.discard(path)
+                    failed.add(path)
+                    logger.error(f"파일 파싱 실패: {path}, {payload}")
+                    results['failed_files'].append(f"{path}: {payload}")
+                    continue
+
+                if kind == 'done':
+                    remaining.discard(path)
+                    if path not in failed:
+                        results['processed_files'] += 1
+                        logger.info(
+                            f"파일 적재 완료: {path} ({file_rows[path]['parsed']}건 중 {file_rows[path]['inserted']}건 저장)"
+                        )
+                    continue
+
+                if path in failed:
+                    continue
+
+                rows = payload
+                results['skipped_rows'] += skipped
+
+                valid_rows = []
+                for row in rows:
+                    if not row['stock_name']:
+                        row['stock_name'] = stock_names.get(row['stock_code'])
+                    if not row['stock_name']:
+                        results['skipped_rows'] += 1
+                        continue
+                    valid_rows.append(row)
+
+                results['parsed_rows'] += len(valid_rows)
+                file_rows[path]['parsed'] += len(valid_rows)
+
+                if dry_run:
+                    continue
+
+                try:
+                    inserted = TradingService.bulk_insert_trading_data(
+                        valid_rows, chunk_size=InvestorFlowImporter.INSERT_CHUNK_SIZE
+                    )
+                    if inserted:
+                        InvestorFlowImporter._refresh_digests(valid_rows)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    # 이미 커밋한 청크는 남으므로 파일 전체를 다시 적재하면 됨 (중복 행은 무시)
+                    failed.add(path)
+                    logger.error(f"파일 저장 실패: {path}, {e}")
+                    results['failed_files'].append(f"{path}: {str(e)}")
+                    continue
+
+                results['inserted_rows'] += inserted
+                file_rows[path]['inserted'] += inserted
+                if inserted:
+                    affected.update(row['stock_code'] for row in valid_rows)
+
+        results['affected_stocks'] = sorted(affected)
+
+        if recalculate_accum and not dry_run:
+            # 순환 참조 방지를 위해 지연 import
+            from backend.services.data_collector import DataCollectorService
+
+            for stock_code in results['affected_stocks']:
+                if not DataCollectorService.calculate_accumulated_data(stock_code):
+                    results['accum_failed'].append(stock_code)
+
+        if results['inserted_rows'] > 0:
+            try:
+                from backend.services.history_service import HistoryService
+                HistoryService.log_data_change(
+                    table_name='stock_investor_trading',
+                    record_id=None,
+                    action='CREATE',
+                    description=f"파일 일괄 적재로 {results['inserted_rows']}건의 거래 데이터 생성 ({len(affected)}개 종목)"
+                )
+            except Exception as e:
+                logger.warning(f"히스토리 로깅 실패: {e}")
+
+        logger.info(
+            f"투자자별 매매동향 파일 적재 완료: 파일 {results['processed_files']}/{results['total_files']}, "
+            f"저장 {results['inserted_rows']}건, 종목 {len(results['affected_stocks'])}개"
+        )
+        return results
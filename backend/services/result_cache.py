@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+공유 조회 결과 캐시
+TradingService의 범위 조회 결과를 정규화한 인자 기준으로 캐시합니다. 저장소는 교체할 수 있습니다.
+
+    memory: 프로세스 내 LRU (워커마다 별도, 테스트용 대체 구현으로도 사용)
+    redis: Redis 프로토콜 서버 (워커 간 공유, redis 패키지 필요 - 선택 의존성)
+    none: 캐시 사용 안 함
+
+무효화는 키를 지우지 않고 data_version의 버전을 키에 넣는 방식입니다. 버전은 DB에 있으므로 다른 워커나
+스크립트(import_investor_flow 등)의 쓰기도 바로 반영되고, ETag와 같은 버전을 쓰므로 새 ETag에 이전 본문이
+붙지 않습니다. 버전을 조회보다 먼저 읽으므로, 조회 도중 바뀐 데이터는 이전 버전 키로만 저장됩니다.
+
+시장 전체 조회처럼 결과가 큰 경우(max_rows 행 초과 또는 직렬화 결과가 max_entry_bytes 초과)는 저장하지 않습니다.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from backend.services.data_version import DataVersionService
+from backend.utils.json_provider import dumps_bytes
+from backend.utils.single_flight import normalize_arguments, to_plain
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKENDS = ('memory', 'redis', 'none')
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 저장소 (항목 수 / 전체 바이트 제한, 항목별 TTL, 스레드 안전)"""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._bytes -= len(value)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._bytes += len(value)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Redis 프로토콜 서버 저장소 (워커 간 공유)"""
+
+    def __init__(self, url: str, socket_timeout: float = 0.5):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("RESULT_CACHE backend=redis를 사용하려면 redis 패키지가 필요합니다. (pip install redis)") from e
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._client.set(key, value, ex=ttl)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class ResultCache:
+    """교체 가능한 저장소 기반 조회 결과 캐시"""
+
+    def __init__(self):
+        self.backend = None
+        self.enabled = False
+        self.default_ttl = 300
+        self.key_prefix = 'stock_analysis:'
+        self.max_rows = 5000
+        self.max_entry_bytes = 1024 * 1024
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'skipped': 0, 'errors': 0}
+
+    def init_app(self, app, backend=None) -> None:
+        """
+        Flask 앱 설정(RESULT_CACHE)으로 캐시 초기화
+
+        Args:
+            app: Flask 애플리케이션 객체
+            backend: 직접 지정할 저장소 (테스트용 대체 구현, 지정 시 설정의 backend 무시)
+
+        Raises:
+            ValueError: 지원하지 않는 저장소인 경우
+            ImportError: redis 저장소를 지정했지만 redis 패키지가 없는 경우
+        """
+        settings = app.config.get('RESULT_CACHE', {})
+        name = settings.get('backend', 'memory')
+        if name not in CACHE_BACKENDS:
+            raise ValueError(f"지원하지 않는 결과 캐시 저장소입니다: {name} ({', '.join(CACHE_BACKENDS)})")
+
+        self.default_ttl = settings.get('default_ttl', self.default_ttl)
+        self.key_prefix = settings.get('key_prefix', self.key_prefix)
+        self.max_rows = settings.get('max_rows', self.max_rows)
+        self.max_entry_bytes = settings.get('max_entry_bytes', self.max_entry_bytes)
+        if backend is not None:
+            self.backend = backend
+        elif name == 'redis':
+            self.backend = RedisCacheBackend(settings.get('url'), settings.get('socket_timeout', 0.5))
+        elif name == 'memory':
+            self.backend = MemoryCacheBackend(
+                settings.get('max_entries', 512), settings.get('max_bytes', 64 * 1024 * 1024)
+            )
+        else:
+            self.backend = None
+        self.enabled = self.backend is not None
+        app.extensions['result_cache'] = self
+        logger.info(f"조회 결과 캐시: {name if backend is None else type(backend).__name__}")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _too_large(self, result: Any) -> bool:
+        if isinstance(result, list):
+            return len(result) > self.max_rows
+        if isinstance(result, dict):
+            return result.get('count', 0) > self.max_rows
+        return False
+
+    def cached(self, namespace: str, table_name: str,
+               scope: Optional[Callable[[Dict[str, Any]], Optional[Iterable[str]]]] = None,
+               ttl: Optional[int] = None) -> Callable:
+        """
+        조회 함수 결과 캐시 데코레이터 (@staticmethod 아래에 적용)
+
+        캐시를 사용하면 ORM 객체 / Row 대신 딕셔너리 목록을 반환합니다 (serialize()로 직렬화 가능).
+
+        Args:
+            namespace (str): 캐시 키 이름공간 (함수별로 고유)
+            table_name (str): 버전을 확인할 테이블명
+            scope (Optional[Callable]): 정규화된 인자 딕셔너리 -> 종목 코드 목록 (None이면 테이블 전체 버전 사용)
+            ttl (Optional[int]): 유지 시간 (초, 기본값: default_ttl)
+
+        Returns:
+            Callable: 데코레이터
+        """
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                params = normalize_arguments(signature, args, kwargs)
+                try:
+                    codes = scope(params) if scope else None
+                    versions = DataVersionService.get_versions(table_name, codes)
+                    digest = hashlib.sha1(
+                        json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+                    ).hexdigest()
+                    key = f"{self.key_prefix}result:{namespace}:{'.'.join(map(str, versions))}:{digest}"
+                    cached_value = self.backend.get(key)
+                except Exception as e:
+                    self._count('errors')
+                    logger.warning(f"결과 캐시 조회 실패, 캐시 없이 조회 ({namespace}): {e}")
+                    return func(*args, **kwargs)
+
+                if cached_value is not None:
+                    self._count('hits')
+                    return json.loads(cached_value)
+
+                self._count('misses')
+                result = to_plain(func(*args, **kwargs))
+                if self._too_large(result):
+                    self._count('skipped')
+                    return result
+                try:
+                    value = dumps_bytes(result)
+                    if len(value) > self.max_entry_bytes:
+                        self._count('skipped')
+                        return result
+                    self.backend.set(key, value, ttl or self.default_ttl)
+                    self._count('stores')
+                except Exception as e:
+                    self._count('errors')
+                    logger.warning(f"결과 캐시 저장 실패 ({namespace}): {e}")
+                return result
+
+            return wrapper
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 지표 (프로세스 기준)
+
+        Returns:
+            Dict[str, Any]: 저장소, 적중/미스/저장/크기 초과로 저장 안 함/오류 횟수, 적중률
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else None
+        stats['backend'] = type(self.backend).__name__ if self.backend is not None else None
+        stats['entries'] = self.backend.size() if self.backend is not None else None
+        return stats
+
+
+result_cache = ResultCache()
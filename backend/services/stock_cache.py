@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+주식 목록(stock_list) 프로세스 내 캐시
+약 2,700건의 주식 마스터를 읽기 전용 스냅샷으로 메모리에 보관하고 코드 / 이름 인덱스를 제공합니다.
+
+무효화:
+    - 같은 프로세스의 쓰기(StockService 생성/수정/삭제, 일괄 동기화)는 mark_changed()로 세션에 기록하고,
+      커밋 후(after_commit) 트랜잭션당 한 번만 무효화 (롤백되면 기록도 버려짐)
+    - 다른 프로세스의 쓰기는 data_version의 stock_list 버전을 version_check_interval마다 확인하여 감지
+    - 어떤 경우에도 ttl이 지나면 다시 로드
+
+스냅샷은 요청 세션과 별도의 연결에서 커밋된 데이터만 읽으므로, 롤백될 수 있는 미커밋 행이 캐시되지 않습니다.
+DB 조회(버전 확인, 다시 로드)는 잠금 밖에서 하고 만든 스냅샷만 잠금 안에서 교체하므로, 조회 중에도 다른 스레드는
+기존 스냅샷을 읽습니다. 다시 로드는 한 번에 하나만 실행합니다.
+캐시 항목은 수정할 수 없는 CachedStock이며, 수정이 필요하면 StockService.get_stock_by_code(..., for_update=True)를 사용합니다.
+"""
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from backend.extensions import db
+from backend.models.data_version import DataVersion
+from backend.models.stock import StockList
+from backend.services.data_version import DataVersionService, TABLE_SCOPE
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 캐시를 무효화할지 기록하는 세션 info 키
+PENDING_INVALIDATION_KEY = 'stock_cache_invalidate'
+
+
+@dataclass(frozen=True)
+class CachedStock:
+    """캐시된 주식 정보 (StockList와 같은 속성, 읽기 전용)"""
+    id: int
+    stock_code: str
+    stock_name: str
+    init_date: Optional[str]
+    institution_accum_init: int
+    foreigner_accum_init: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """StockList.to_dict()와 같은 형식의 딕셔너리"""
+        return asdict(self)
+
+
+class StockCache:
+    """주식 목록 스냅샷 캐시 (스레드 안전)"""
+
+    DEFAULT_TTL = 300
+    DEFAULT_VERSION_CHECK_INTERVAL = 5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stocks: List[CachedStock] = []
+        self._by_code: Dict[str, CachedStock] = {}
+        self._by_name: Dict[str, List[CachedStock]] = {}
+        self._version: Optional[int] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._valid = False
+        self._generation = 0
+        self._invalidated = 0
+        self._stats = {'hits': 0, 'loads': 0, 'invalidations': 0}
+
+    def init_app(self, app) -> None:
+        """
+        커밋 후 무효화 리스너 등록
+
+        Args:
+            app: Flask 애플리케이션 객체
+        """
+        if not event.contains(Session, 'after_commit', _after_commit):
+            event.listen(Session, 'after_commit', _after_commit)
+            event.listen(Session, 'after_soft_rollback', _after_soft_rollback)
+        app.extensions['stock_cache'] = self
+
+    @staticmethod
+    def _settings() -> Dict[str, Any]:
+        return current_app.config.get('STOCK_CACHE', {})
+
+    @staticmethod
+    def mark_changed() -> None:
+        """현재 트랜잭션에서 주식 목록이 바뀌었음을 기록 (커밋 후 한 번 무효화)"""
+        db.session.info[PENDING_INVALIDATION_KEY] = True
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (다음 조회 시 다시 로드)"""
+        with self._lock:
+            self._valid = False
+            self._invalidated += 1
+            self._stats['invalidations'] += 1
+
+    @staticmethod
+    def _read_version(connection) -> int:
+        return connection.execute(
+            select(DataVersion.version).where(
+                DataVersion.table_name == DataVersionService.STOCK_LIST,
+                DataVersion.scope_key == TABLE_SCOPE
+            )
+        ).scalar() or 0
+
+    def _load(self, generation: int) -> None:
+        with self._load_lock:
+            with self._lock:
+                if self._generation != generation and self._valid:
+                    # 기다리는 동안 다른 스레드가 이미 다시 로드함
+                    return
+                invalidated = self._invalidated
+
+            columns = [StockList.__table__.c[name] for name in CachedStock.__dataclass_fields__]
+            with db.engine.connect() as connection:
+                # 버전을 먼저 읽어 로드 도중의 변경은 다음 버전 확인에서 감지되게 함
+                version = self._read_version(connection)
+                rows = connection.execute(select(*columns).order_by(StockList.stock_code.asc())).all()
+
+            stocks = [CachedStock(*row) for row in rows]
+            by_code = {stock.stock_code: stock for stock in stocks}
+            by_name: Dict[str, List[CachedStock]] = {}
+            for stock in stocks:
+                by_name.setdefault(stock.stock_name.strip().lower(), []).append(stock)
+
+            now = time.monotonic()
+            with self._lock:
+                self._stocks = stocks
+                self._by_code = by_code
+                self._by_name = by_name
+                self._version = version
+                self._loaded_at = now
+                self._checked_at = now
+                # 로드 도중 무효화되었으면 다음 조회에서 다시 로드
+                self._valid = self._invalidated == invalidated
+                self._generation += 1
+                self._stats['loads'] += 1
+            logger.debug(f"주식 목록 캐시 로드: {len(stocks)}건 (버전 {version})")
+
+    def _ensure_fresh(self) -> None:
+        settings = self._settings()
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generation
+            fresh = self._valid and now - self._loaded_at < settings.get('ttl', self.DEFAULT_TTL)
+            if fresh and now - self._checked_at < settings.get('version_check_interval', self.DEFAULT_VERSION_CHECK_INTERVAL):
+                self._stats['hits'] += 1
+                return
+            if fresh:
+                self._checked_at = now
+
+        if fresh:
+            with db.engine.connect() as connection:
+                version = self._read_version(connection)
+            with self._lock:
+                if self._valid and version == self._version:
+                    self._stats['hits'] += 1
+                    return
+        self._load(generation)
+
+    def enabled(self) -> bool:
+        """설정(STOCK_CACHE.enabled)에 따른 캐시 사용 여부"""
+        return self._settings().get('enabled', True)
+
+    def all(self) -> List[CachedStock]:
+        """
+        전체 주식 목록
+
+        Returns:
+            List[CachedStock]: 주식 목록 (주식 코드 기준 오름차순, 호출자가 수정해도 캐시에 영향 없음)
+        """
+        self._ensure_fresh()
+        return list(self._stocks)
+
+    def snapshot(self) -> Tuple[int, Tuple[CachedStock, ...]]:
+        """
+        현재 스냅샷과 세대 번호 (다시 로드할 때마다 증가, 파생 인덱스의 재구성 여부 판단용)
+
+        Returns:
+            Tuple[int, Tuple[CachedStock, ...]]: (세대 번호, 주식 목록)
+        """
+        self._ensure_fresh()
+        with self._lock:
+            return self._generation, tuple(self._stocks)
+
+    def by_code(self, stock_code: str) -> Optional[CachedStock]:
+        """
+        주식 코드로 조회
+
+        Args:
+            stock_code (str): 주식 코드
+
+        Returns:
+            Optional[CachedStock]: 주식 정보 (없으면 None)
+        """
+        self._ensure_fresh()
+        return self._by_code.get(stock_code)
+
+    def by_name(self, stock_name: str) -> List[CachedStock]:
+        """
+        주식명으로 조회 (대소문자, 앞뒤 공백 무시한 완전 일치)
+
+        Args:
+            stock_name (str): 주식명
+
+        Returns:
+            List[CachedStock]: 이름이 같은 주식 목록
+        """
+        self._ensure_fresh()
+        return list(self._by_name.get(stock_name.strip().lower(), ()))
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 (건수, 버전, 적중/로드/무효화 횟수)"""
+        with self._lock:
+            return {
+                'size': len(self._stocks),
+                'version': self._version,
+                'valid': self._valid,
+                'age_seconds': round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None,
+                **self._stats
+            }
+
+
+def _after_commit(session) -> None:
+    if session.info.pop(PENDING_INVALIDATION_KEY, False):
+        stock_cache.invalidate()
+
+
+def _after_soft_rollback(session, previous_transaction) -> None:
+    if session.info.pop(PENDING_INVALIDATION_KEY, False):
+        logger.debug("롤백으로 주식 목록 캐시 무효화 기록 취소")
+
+
+stock_cache = StockCache()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+주식 검색 인덱스
+주식 목록 캐시(stock_cache) 스냅샷으로 메모리 인덱스를 만들어 검색어를 종목으로 변환합니다.
+거래 데이터 검색은 이 결과(종목 코드)로 인덱스를 타는 stock_code 조건을 사용합니다.
+
+일치 순위 (앞쪽이 우선, 같은 순위는 짧은 이름 / 주식 코드 순):
+    0. 주식 코드 완전 일치
+    1. 주식명 완전 일치
+    2. 주식명 / 주식 코드 접두 일치
+    3. 초성 접두 일치 (예: 'ㅅㅅㅈ' -> 삼성전자, '삼ㅅ' -> 삼성전자)
+    4. 주식명 / 주식 코드 부분 일치
+    5. 초성 부분 일치
+    6. 트라이그램 유사도 (위 순위에서 하나도 찾지 못한 경우에만, 오타 대응)
+
+비교는 대소문자와 공백을 무시합니다. 스냅샷이 다시 로드되면 인덱스도 다시 만듭니다.
+캐시를 사용하지 않는 설정에서는 stock_list 테이블(약 2,700건)을 ILIKE로 조회합니다.
+"""
+import bisect
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import or_
+
+from backend.models.stock import StockList
+from backend.services.stock_cache import CachedStock, stock_cache
+from backend.utils.hangul import CHOSUNG_SET, chosung, is_chosung_query, normalize, similarity, trigrams
+
+logger = logging.getLogger(__name__)
+
+
+class _Index:
+    """한 스냅샷에 대한 검색 인덱스 (만든 뒤에는 수정하지 않음)"""
+
+    def __init__(self, generation: int, stocks: Sequence[CachedStock]):
+        self.generation = generation
+        self.stocks = stocks
+        self.names = [normalize(stock.stock_name) for stock in stocks]
+        self.chosungs = [chosung(name) for name in self.names]
+        self.codes = [stock.stock_code.lower() for stock in stocks]
+        self.code_positions = {code: index for index, code in enumerate(self.codes)}
+        self.sorted_names = sorted((name, index) for index, name in enumerate(self.names))
+        self.sorted_codes = sorted((code, index) for index, code in enumerate(self.codes))
+        self.sorted_chosungs = sorted((cho, index) for index, cho in enumerate(self.chosungs))
+        self.name_trigrams = [trigrams(name) for name in self.names]
+        self.postings: Dict[str, Set[int]] = {}
+        for index, grams in enumerate(self.name_trigrams):
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(index)
+
+
+def _prefixed(sorted_pairs: List[Tuple[str, int]], prefix: str) -> List[int]:
+    """정렬된 (키, 위치) 목록에서 접두어로 시작하는 위치 목록 (이진 탐색)"""
+    start = bisect.bisect_left(sorted_pairs, (prefix, -1))
+    matches = []
+    for key, index in sorted_pairs[start:]:
+        if not key.startswith(prefix):
+            break
+        matches.append(index)
+    return matches
+
+
+def _jamo_match(term: str, name: str, name_chosung: str, prefix_only: bool) -> bool:
+    """초성이 섞인 검색어 일치 여부 (초성 글자는 초성끼리, 완성형 글자는 글자끼리 비교)"""
+    term_chosung = chosung(term)
+    starts = [0] if prefix_only else range(len(name) - len(term) + 1)
+    for start in starts:
+        if not name_chosung.startswith(term_chosung, start):
+            continue
+        if all(char in CHOSUNG_SET or char == name[start + offset] for offset, char in enumerate(term)):
+            return True
+    return False
+
+
+class StockSearchIndex:
+    """주식 검색 (스레드 안전, 스냅샷 세대가 바뀌면 인덱스 재구성)"""
+
+    FUZZY_THRESHOLD = 0.3  # pg_trgm 기본 similarity_threshold와 같은 값
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Optional[_Index] = None
+
+    def _current(self) -> _Index:
+        generation, stocks = stock_cache.snapshot()
+        index = self._index
+        if index is not None and index.generation == generation:
+            return index
+        with self._lock:
+            if self._index is None or self._index.generation != generation:
+                self._index = _Index(generation, stocks)
+                logger.debug(f"주식 검색 인덱스 생성: {len(stocks)}건 (세대 {generation})")
+            return self._index
+
+    @staticmethod
+    def _rank(index: _Index, term: str, include_codes: bool) -> Dict[int, float]:
+        ranks: Dict[int, float] = {}
+
+        def add(positions, rank):
+            for position in positions:
+                if position not in ranks or rank < ranks[position]:
+                    ranks[position] = rank
+
+        if include_codes:
+            if term in index.code_positions:
+                add([index.code_positions[term]], 0)
+            add(_prefixed(index.sorted_codes, term), 2)
+            add((position for position, code in enumerate(index.codes) if term in code), 4)
+
+        name_prefixed = _prefixed(index.sorted_names, term)
+        add((position for position in name_prefixed if index.names[position] == term), 1)
+        add(name_prefixed, 2)
+
+        if len(term) >= 3:
+            # 검색어의 트라이그램을 모두 가진 이름만 부분 일치 후보로 확인
+            candidates = None
+            for gram in trigrams(term, padded=False):
+                postings = index.postings.get(gram, set())
+                candidates = postings if candidates is None else candidates & postings
+                if not candidates:
+                    break
+            add((position for position in sorted(candidates or ()) if term in index.names[position]), 4)
+        else:
+            add((position for position, name in enumerate(index.names) if term in name), 4)
+
+        if is_chosung_query(term):
+            term_chosung = chosung(term)
+            add((position for position in _prefixed(index.sorted_chosungs, term_chosung)
+                 if _jamo_match(term, index.names[position], index.chosungs[position], True)), 3)
+            add((position for position, cho in enumerate(index.chosungs)
+                 if term_chosung in cho and _jamo_match(term, index.names[position], cho, False)), 5)
+
+        if not ranks:
+            term_grams = trigrams(term)
+            candidates = set()
+            for gram in term_grams:
+                candidates |= index.postings.get(gram, set())
+            for position in candidates:
+                score = similarity(term_grams, index.name_trigrams[position])
+                if score >= StockSearchIndex.FUZZY_THRESHOLD:
+                    # 유사도가 높을수록 앞에 오도록 순위를 세분화
+                    ranks[position] = 6 + round(1 - score, 3)
+        return ranks
+
+    def search(self, term: str, limit: Optional[int] = None, include_codes: bool = False) -> List[CachedStock]:
+        """
+        주식 검색 (주식 목록 캐시 사용)
+
+        Args:
+            term (str): 검색어 (주식명, 초성, 주식 코드 일부)
+            limit (Optional[int]): 최대 결과 수 (없으면 전체)
+            include_codes (bool): 주식 코드도 검색할지 여부
+
+        Returns:
+            List[CachedStock]: 일치 순위 순 주식 목록
+        """
+        term = normalize(term)
+        if not term:
+            return []
+        index = self._current()
+        ranks = self._rank(index, term, include_codes)
+        ordered = sorted(ranks, key=lambda position: (ranks[position], len(index.names[position]), index.codes[position]))
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [index.stocks[position] for position in ordered]
+
+    def resolve_codes(self, term: str, limit: int, include_codes: bool = True) -> List[str]:
+        """
+        검색어를 주식 코드 목록으로 변환 (캐시를 사용하지 않으면 stock_list 테이블 조회)
+
+        Args:
+            term (str): 검색어
+            limit (int): 최대 종목 수
+            include_codes (bool): 주식 코드도 검색할지 여부
+
+        Returns:
+            List[str]: 일치 순위 순 주식 코드 목록
+        """
+        if not term or not term.strip():
+            return []
+        if stock_cache.enabled():
+            return [stock.stock_code for stock in self.search(term, limit, include_codes)]
+
+        pattern = f'%{term.strip()}%'
+        conditions = [StockList.stock_name.ilike(pattern)]
+        if include_codes:
+            conditions.append(StockList.stock_code.like(pattern))
+        rows = StockList.query.with_entities(StockList.stock_code).filter(
+            or_(*conditions)
+        ).order_by(StockList.stock_code.asc()).limit(limit).all()
+        return [row.stock_code for row in rows]
+
+
+stock_search = StockSearchIndex()
@@ -7,6 +7,10 @@ from typing import List, Optional
 from sqlalchemy.exc import IntegrityError
 from backend.models.stock import StockList
 from backend.extensions import db
+from backend.services.data_version import DataVersionService
+from backend.services.stock_cache import stock_cache
+from backend.services.stock_search import stock_search
+from backend.utils.projection import project
 import re
 
 
@@ -125,6 +129,7 @@ class StockService:
             )
             
             db.session.add(stock)
+            StockService._changed(stock.stock_code)
             # 트랜잭션은 API 레벨에서 관리됨
             return stock
             
@@ -134,15 +139,26 @@ class StockService:
             raise Exception(f"주식 생성 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def get_all_stocks() -> List[StockList]:
+    def _changed(stock_code: str) -> None:
+        """주식 목록 변경 기록 (데이터 버전 증가, 커밋 후 프로세스 내 캐시 무효화)"""
+        DataVersionService.bump(DataVersionService.STOCK_LIST, [stock_code])
+        stock_cache.mark_changed()
+    
+    @staticmethod
+    def get_all_stocks(fields: Optional[List[str]] = None) -> List[StockList]:
         """
-        모든 주식 조회
+        모든 주식 조회 (프로세스 내 캐시 사용)
+        
+        Args:
+            fields (Optional[List[str]]): 조회할 필드 (캐시 비활성화 시 해당 컬럼만 SELECT하여 Row 반환)
         
         Returns:
-            List[StockList]: 주식 목록 (주식 코드 기준 오름차순)
+            List[StockList]: 주식 목록 (주식 코드 기준 오름차순, 캐시 사용 시 읽기 전용 CachedStock)
         """
         try:
-            return StockList.query.order_by(StockList.stock_code.asc()).all()
+            if stock_cache.enabled():
+                return stock_cache.all()
+            return project(StockList.query, StockList, fields).order_by(StockList.stock_code.asc()).all()
         except Exception as e:
             raise Exception(f"주식 목록 조회 중 오류 발생: {str(e)}") from e
 
@@ -165,19 +181,22 @@ class StockService:
             raise Exception(f"주식 조회 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def get_stock_by_code(stock_code: str) -> Optional[StockList]:
+    def get_stock_by_code(stock_code: str, for_update: bool = False) -> Optional[StockList]:
         """
-        주식 코드로 주식 조회
+        주식 코드로 주식 조회 (프로세스 내 캐시 사용)
         
         Args:
             stock_code (str): 주식 코드
+            for_update (bool): 수정할 객체가 필요한 경우 True (캐시 대신 세션의 StockList 반환)
             
         Returns:
-            Optional[StockList]: 주식 객체 (없으면 None)
+            Optional[StockList]: 주식 객체 (없으면 None, 캐시 사용 시 읽기 전용 CachedStock)
         """
         try:
             if not stock_code or not stock_code.strip():
                 return None
+            if not for_update and stock_cache.enabled():
+                return stock_cache.by_code(stock_code.strip())
             return StockList.query.filter_by(stock_code=stock_code.strip()).first()
         except Exception as e:
             raise Exception(f"주식 조회 중 오류 발생: {str(e)}") from e
@@ -237,6 +256,7 @@ class StockService:
                 foreigner_accum_init=foreigner_accum_init
             )
             
+            StockService._changed(stock.stock_code)
             db.session.commit()
             return stock
             
@@ -261,6 +281,7 @@ class StockService:
                 return False
             
             db.session.delete(stock)
+            StockService._changed(stock.stock_code)
             db.session.commit()
             
             return True
@@ -270,34 +291,44 @@ class StockService:
             raise Exception(f"주식 삭제 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def search_stocks_by_name(name: str) -> List[StockList]:
+    def search_stocks_by_name(
+        name: str,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[StockList]:
         """
-        주식명으로 주식 검색
+        주식명으로 주식 검색 (캐시 사용 시 접두 / 초성 / 부분 / 유사도 일치, 일치 순위 순)
         
         Args:
-            name (str): 검색할 주식명 (부분 일치)
+            name (str): 검색할 주식명 (부분 일치, 초성 가능. 예: ㅅㅅㅈㅈ)
+            fields (Optional[List[str]]): 조회할 필드 (캐시 비활성화 시 해당 컬럼과 id만 SELECT하여 Row 반환)
+            limit (Optional[int]): 최대 결과 수 (없으면 전체)
             
         Returns:
-            List[StockList]: 검색된 주식 목록
+            List[StockList]: 검색된 주식 목록 (캐시 사용 시 읽기 전용 CachedStock)
         """
         try:
             if not name or not name.strip():
                 return []
+            if stock_cache.enabled():
+                return stock_search.search(name, limit)
             
-            return StockList.query.filter(
-                StockList.stock_name.like(f'%{name.strip()}%')
-            ).order_by(StockList.stock_code.asc()).all()
+            query = project(StockList.query, StockList, fields, ('id',)).filter(
+                StockList.stock_name.ilike(f'%{name.strip()}%')
+            ).order_by(StockList.stock_code.asc())
+            return query.limit(limit).all() if limit else query.all()
             
         except Exception as e:
             raise Exception(f"주식 검색 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def search_stocks_by_code(code: str) -> List[StockList]:
+    def search_stocks_by_code(code: str, fields: Optional[List[str]] = None) -> List[StockList]:
         """
         주식 코드로 주식 검색
         
         Args:
             code (str): 검색할 주식 코드 (부분 일치)
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼과 id만 SELECT하여 Row 반환)
             
         Returns:
             List[StockList]: 검색된 주식 목록
@@ -306,7 +337,7 @@ class StockService:
             if not code or not code.strip():
                 return []
             
-            return StockList.query.filter(
+            return project(StockList.query, StockList, fields, ('id',)).filter(
                 StockList.stock_code.like(f'%{code.strip()}%')
             ).order_by(StockList.stock_code.asc()).all()
             
@@ -343,6 +374,7 @@ class StockService:
                 return None
             
             stock.update_accum_values(institution_accum_init, foreigner_accum_init)
+            StockService._changed(stock.stock_code)
             db.session.commit()
             
             return stock
@@ -3,12 +3,22 @@
 Stock Investor Trading 서비스 계층
 주식 투자자별 거래 데이터 관련 비즈니스 로직을 처리하는 서비스
 """
-from typing import List, Optional
+from datetime import date
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_
+from sqlalchemy import Date, any_, bindparam, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array_agg, insert as pg_insert
 from backend.models.trading import StockInvestorTrading
 from backend.extensions import db
 from backend.services.history_service import HistoryService
+from backend.services.data_version import DataVersionService
+from backend.services.digest_service import DigestService
+from backend.services.result_cache import result_cache
+from backend.services.stock_search import stock_search
+from backend.utils.single_flight import single_flight
+from backend.utils.pagination import KeysetPage, KeysetPaginator, estimate_row_count
+from backend.utils.projection import project
+from backend.utils.downsampling import date_axis, lttb_indices
 import re
 
 
@@ -21,6 +31,29 @@ class TradingService:
     MAX_TRADE_DATE_LENGTH = 10
     MAX_TREND_SIGNAL_LENGTH = 50
     
+    # 키셋 페이지네이션 페이지 크기
+    DEFAULT_PAGE_SIZE = 500
+    MAX_PAGE_SIZE = 5000
+    PAGE_KEY_FIELDS = ('trade_date', 'stock_code', 'id')
+    
+    # 다중 종목 일괄 조회 시 최대 종목 수
+    MAX_BATCH_STOCK_CODES = 100
+    
+    # 검색 시 검색어로 찾을 최대 종목 수와 반환할 최대 행 수
+    MAX_SEARCH_STOCKS = 20
+    DEFAULT_SEARCH_LIMIT = 1000
+    MAX_SEARCH_LIMIT = 10000
+    
+    # 스트리밍 조회 시 서버 측 커서에서 한 번에 가져올 행 수
+    STREAM_BATCH_SIZE = 2000
+    
+    # 차트용 시간 구간 집계 (bucket=week|month|auto)
+    BUCKETS = ('week', 'month', 'auto')
+    DEFAULT_MAX_POINTS = 500
+    MAX_MAX_POINTS = 5000
+    # auto에서 종목 코드 없이 조회할 때 구간 단위별 평균 일수 (영업일 기준 점 수 추정용)
+    AUTO_BUCKET_DAYS = (('day', 7 / 5), ('week', 7), ('month', 30))
+    
     @staticmethod
     def validate_stock_code(stock_code: str) -> bool:
         """
@@ -170,6 +203,7 @@ class TradingService:
             )
             
             db.session.add(trading_data)
+            DataVersionService.bump(DataVersionService.TRADING, [trading_data.stock_code])
             db.session.commit()
             
             # 히스토리 로깅
@@ -284,18 +318,170 @@ class TradingService:
             raise Exception(f"거래 데이터 생성 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def get_all_trading_data() -> List[StockInvestorTrading]:
+    def bulk_insert_trading_data(rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        거래 데이터 대량 저장 (다중 행 INSERT, 중복은 건너뜀)
+
+        (stock_code, trade_date) 유니크 제약을 이용해 이미 존재하는 행은
+        ON CONFLICT DO NOTHING 으로 무시합니다. 커밋은 호출자가 관리합니다.
+
+        Args:
+            rows (List[Dict[str, Any]]): 컬럼명을 키로 하는 거래 데이터 목록
+            chunk_size (int): 한 번의 INSERT 문에 포함할 최대 행 수
+
+        Returns:
+            int: 실제로 저장된 행 수
+        """
+        if not rows:
+            return 0
+
+        table = StockInvestorTrading.__table__
+        inserted = 0
+
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                stmt = pg_insert(table).values(chunk).on_conflict_do_nothing(
+                    index_elements=['stock_code', 'trade_date']
+                )
+                result = db.session.execute(stmt)
+                inserted += max(result.rowcount or 0, 0)
+            if inserted:
+                DataVersionService.bump(DataVersionService.TRADING, {row['stock_code'] for row in rows})
+            return inserted
+        except Exception as e:
+            raise Exception(f"거래 데이터 대량 저장 중 오류 발생: {str(e)}") from e
+
+    @staticmethod
+    def get_all_trading_data(fields: Optional[List[str]] = None) -> List[StockInvestorTrading]:
         """
         모든 거래 데이터 조회
         
+        Args:
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
+        
         Returns:
             List[StockInvestorTrading]: 거래 데이터 목록 (날짜 기준 내림차순)
         """
         try:
-            return StockInvestorTrading.query.order_by(StockInvestorTrading.trade_date.desc()).all()
+            query = project(StockInvestorTrading.query, StockInvestorTrading, fields)
+            return query.order_by(StockInvestorTrading.trade_date.desc()).all()
         except Exception as e:
             raise Exception(f"거래 데이터 목록 조회 중 오류 발생: {str(e)}") from e
 
+    @staticmethod
+    def _apply_filters(query, stock_code: Optional[str], start_date: Optional[str], end_date: Optional[str]):
+        """
+        종목 코드 / 날짜 범위 필터 적용
+        
+        Raises:
+            ValueError: 입력값 형식이 올바르지 않은 경우
+        """
+        if stock_code:
+            if not TradingService.validate_stock_code(stock_code):
+                raise ValueError("주식 코드 형식이 올바르지 않습니다. (6자리 숫자)")
+            query = query.filter(StockInvestorTrading.stock_code == stock_code)
+        if start_date:
+            if not TradingService.validate_date_format(start_date):
+                raise ValueError("시작 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+            query = query.filter(StockInvestorTrading.trade_date >= start_date)
+        if end_date:
+            if not TradingService.validate_date_format(end_date):
+                raise ValueError("종료 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+            query = query.filter(StockInvestorTrading.trade_date <= end_date)
+        return query
+
+    @staticmethod
+    def iter_trading_rows(
+        stock_code: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        거래 데이터를 서버 측 커서로 순회 (스트리밍 응답용)
+        
+        ORM 객체 대신 컬럼 튜플을 batch_size 단위로 가져와 딕셔너리로 변환하므로,
+        결과 크기와 무관하게 메모리 사용량이 일정합니다. 행 형식은 to_dict()와 같습니다.
+        
+        Args:
+            stock_code (Optional[str]): 주식 코드 필터
+            start_date (Optional[str]): 시작 날짜 (YYYY-MM-DD)
+            end_date (Optional[str]): 종료 날짜 (YYYY-MM-DD)
+            batch_size (Optional[int]): 서버 측 커서에서 한 번에 가져올 행 수
+            fields (Optional[List[str]]): 조회할 필드 (없으면 전체)
+            
+        Returns:
+            Iterator[Dict[str, Any]]: 거래 데이터 딕셔너리 이터레이터 ((trade_date, stock_code, id) 내림차순)
+            
+        Raises:
+            ValueError: 입력값 형식이 올바르지 않은 경우 (순회 시작 전에 검증)
+        """
+        table_columns = StockInvestorTrading.__table__.columns
+        columns = [table_columns[name] for name in fields] if fields else list(table_columns)
+        query = TradingService._apply_filters(db.session.query(*columns), stock_code, start_date, end_date)
+        query = query.order_by(
+            StockInvestorTrading.trade_date.desc(),
+            StockInvestorTrading.stock_code.desc(),
+            StockInvestorTrading.id.desc()
+        ).execution_options(stream_results=True, yield_per=batch_size or TradingService.STREAM_BATCH_SIZE)
+        names = [column.name for column in columns]
+        
+        def rows():
+            for row in query:
+                yield dict(zip(names, row))
+        
+        return rows()
+
+    @staticmethod
+    def get_trading_data_page(
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        stock_code: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """
+        거래 데이터 키셋 페이지 조회 ((trade_date, stock_code, id) 내림차순)
+        
+        OFFSET 없이 커서 위치부터 인덱스 범위 검색하므로 범위가 길어도 페이지당 비용이 일정합니다.
+        
+        Args:
+            cursor (Optional[str]): 이전 응답의 next_cursor / prev_cursor (없으면 첫 페이지)
+            limit (Optional[int]): 페이지 크기 (기본값: DEFAULT_PAGE_SIZE, 최대 MAX_PAGE_SIZE)
+            stock_code (Optional[str]): 주식 코드 필터
+            start_date (Optional[str]): 시작 날짜 (YYYY-MM-DD)
+            end_date (Optional[str]): 종료 날짜 (YYYY-MM-DD)
+            include_total (bool): 실행 계획 기반 전체 건수 추정치 포함 여부
+            fields (Optional[List[str]]): 조회할 필드 (정렬 키 컬럼은 커서 계산을 위해 함께 조회)
+            
+        Returns:
+            KeysetPage: 거래 데이터 목록, 다음/이전 페이지 커서, 전체 건수 추정치
+            
+        Raises:
+            ValueError: 입력값 또는 커서가 올바르지 않은 경우
+        """
+        try:
+            query = TradingService._apply_filters(StockInvestorTrading.query, stock_code, start_date, end_date)
+            
+            limit = min(max(limit or TradingService.DEFAULT_PAGE_SIZE, 1), TradingService.MAX_PAGE_SIZE)
+            page = KeysetPaginator([
+                StockInvestorTrading.trade_date,
+                StockInvestorTrading.stock_code,
+                StockInvestorTrading.id
+            ]).page(project(query, StockInvestorTrading, fields, TradingService.PAGE_KEY_FIELDS), cursor, limit)
+            
+            if include_total:
+                page.total_estimate = estimate_row_count(query)
+            return page
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"거래 데이터 페이지 조회 중 오류 발생: {str(e)}") from e
+
     @staticmethod
     def get_trading_data_by_id(trading_id: int) -> Optional[StockInvestorTrading]:
         """
@@ -315,12 +501,15 @@ class TradingService:
             raise Exception(f"거래 데이터 조회 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def get_trading_data_by_stock_code(stock_code: str) -> List[StockInvestorTrading]:
+    @result_cache.cached('by_stock_code', DataVersionService.TRADING, lambda p: [p['stock_code']])
+    @single_flight.coalesce
+    def get_trading_data_by_stock_code(stock_code: str, fields: Optional[List[str]] = None) -> List[StockInvestorTrading]:
         """
         주식 코드로 거래 데이터 조회
         
         Args:
             stock_code (str): 주식 코드
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
             
         Returns:
             List[StockInvestorTrading]: 거래 데이터 목록 (날짜 기준 내림차순)
@@ -328,17 +517,20 @@ class TradingService:
         try:
             if not stock_code or not stock_code.strip():
                 return []
-            return StockInvestorTrading.query.filter_by(
+            return project(StockInvestorTrading.query, StockInvestorTrading, fields).filter_by(
                 stock_code=stock_code.strip()
             ).order_by(StockInvestorTrading.trade_date.desc()).all()
         except Exception as e:
             raise Exception(f"거래 데이터 조회 중 오류 발생: {str(e)}") from e
 
     @staticmethod
+    @result_cache.cached('by_date_range', DataVersionService.TRADING, lambda p: [p['stock_code']] if p['stock_code'] else None)
+    @single_flight.coalesce
     def get_trading_data_by_date_range(
         start_date: str, 
         end_date: str, 
-        stock_code: Optional[str] = None
+        stock_code: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> List[StockInvestorTrading]:
         """
         날짜 범위로 거래 데이터 조회 (인덱스 최적화)
@@ -347,6 +539,7 @@ class TradingService:
             start_date (str): 시작 날짜 (YYYY-MM-DD)
             end_date (str): 종료 날짜 (YYYY-MM-DD)
             stock_code (Optional[str]): 주식 코드 (선택)
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
             
         Returns:
             List[StockInvestorTrading]: 거래 데이터 목록
@@ -375,18 +568,21 @@ class TradingService:
                     StockInvestorTrading.trade_date <= end_date
                 ).order_by(StockInvestorTrading.trade_date.desc())
             
-            return query.all()
+            return project(query, StockInvestorTrading, fields).all()
         except Exception as e:
             raise Exception(f"날짜 범위 거래 데이터 조회 중 오류 발생: {str(e)}") from e
 
     @staticmethod
+    @result_cache.cached('by_stock_date_range', DataVersionService.TRADING, lambda p: [p['stock_code']])
+    @single_flight.coalesce
     def get_trading_data_by_stock_date_range(
         stock_code: str,
         start_date: str, 
         end_date: str,
         include_price: bool = True,
         include_institution: bool = True,
-        include_foreigner: bool = True
+        include_foreigner: bool = True,
+        fields: Optional[List[str]] = None
     ) -> List[StockInvestorTrading]:
         """
         특정 종목의 날짜 범위 거래 데이터 조회 (고성능)
@@ -398,9 +594,10 @@ class TradingService:
             include_price (bool): 종가 포함 여부
             include_institution (bool): 기관 데이터 포함 여부
             include_foreigner (bool): 외국인 데이터 포함 여부
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 include_* 대신 사용)
             
         Returns:
-            List[StockInvestorTrading]: 거래 데이터 목록
+            List[StockInvestorTrading]: 거래 데이터 목록 (컬럼을 좁히면 Row 튜플)
         """
         try:
             # 입력값 검증
@@ -419,55 +616,337 @@ class TradingService:
             )
             
             # 필요한 컬럼만 선택하여 성능 최적화
-            if include_price and include_institution and include_foreigner:
-                # 모든 데이터 포함
-                pass
-            elif include_price and include_institution:
-                # 종가 + 기관 데이터만
-                query = query.with_entities(
-                    StockInvestorTrading.id,
-                    StockInvestorTrading.stock_code,
-                    StockInvestorTrading.stock_name,
-                    StockInvestorTrading.trade_date,
-                    StockInvestorTrading.close_price,
-                    StockInvestorTrading.institution_net_buy,
-                    StockInvestorTrading.institution_accum,
-                    StockInvestorTrading.institution_trend_signal,
-                    StockInvestorTrading.institution_trend_score
-                )
-            elif include_price and include_foreigner:
-                # 종가 + 외국인 데이터만
-                query = query.with_entities(
-                    StockInvestorTrading.id,
-                    StockInvestorTrading.stock_code,
-                    StockInvestorTrading.stock_name,
-                    StockInvestorTrading.trade_date,
-                    StockInvestorTrading.close_price,
-                    StockInvestorTrading.foreigner_net_buy,
-                    StockInvestorTrading.foreigner_accum,
-                    StockInvestorTrading.foreigner_trend_signal,
-                    StockInvestorTrading.foreigner_trend_score
-                )
-            elif include_price:
-                # 종가만
-                query = query.with_entities(
-                    StockInvestorTrading.id,
-                    StockInvestorTrading.stock_code,
-                    StockInvestorTrading.stock_name,
-                    StockInvestorTrading.trade_date,
-                    StockInvestorTrading.close_price
-                )
+            if fields:
+                query = project(query, StockInvestorTrading, fields)
+            else:
+                columns = TradingService._stock_date_range_columns(include_price, include_institution, include_foreigner)
+                if len(columns) < len(StockInvestorTrading.__table__.columns):
+                    query = query.with_entities(*columns)
             
             return query.order_by(StockInvestorTrading.trade_date.desc()).all()
         except Exception as e:
             raise Exception(f"종목별 날짜 범위 거래 데이터 조회 중 오류 발생: {str(e)}") from e
 
     @staticmethod
+    def _stock_date_range_columns(include_price: bool, include_institution: bool, include_foreigner: bool) -> List:
+        """종목별 날짜 범위 조회의 include_* 옵션에 해당하는 컬럼 목록"""
+        base = [
+            StockInvestorTrading.id,
+            StockInvestorTrading.stock_code,
+            StockInvestorTrading.stock_name,
+            StockInvestorTrading.trade_date
+        ]
+        if include_price and include_institution and include_foreigner:
+            # 모든 데이터 포함
+            return list(StockInvestorTrading.__table__.columns)
+        elif include_price and include_institution:
+            # 종가 + 기관 데이터만
+            return base + [
+                StockInvestorTrading.close_price,
+                StockInvestorTrading.institution_net_buy,
+                StockInvestorTrading.institution_accum,
+                StockInvestorTrading.institution_trend_signal,
+                StockInvestorTrading.institution_trend_score
+            ]
+        elif include_price and include_foreigner:
+            # 종가 + 외국인 데이터만
+            return base + [
+                StockInvestorTrading.close_price,
+                StockInvestorTrading.foreigner_net_buy,
+                StockInvestorTrading.foreigner_accum,
+                StockInvestorTrading.foreigner_trend_signal,
+                StockInvestorTrading.foreigner_trend_score
+            ]
+        elif include_price:
+            # 종가만
+            return base + [StockInvestorTrading.close_price]
+        return list(StockInvestorTrading.__table__.columns)
+
+    @staticmethod
+    def get_stock_date_range_series(
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        include_price: bool = True,
+        include_institution: bool = True,
+        include_foreigner: bool = True,
+        batch_size: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, Any], List, Iterator[List[Tuple]]]:
+        """
+        특정 종목의 날짜 범위 거래 데이터를 컬럼형 응답용 튜플 배치로 조회
+        
+        ORM 객체 없이 서버 측 커서에서 batch_size 단위의 튜플 배치를 그대로 넘깁니다.
+        모든 행에 반복되는 stock_code / stock_name은 컬럼에서 빼고 메타데이터로 한 번만 돌려줍니다.
+        
+        Args:
+            stock_code (str): 주식 코드
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            include_price (bool): 종가 포함 여부
+            include_institution (bool): 기관 데이터 포함 여부
+            include_foreigner (bool): 외국인 데이터 포함 여부
+            batch_size (Optional[int]): 서버 측 커서에서 한 번에 가져올 행 수
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 include_* 대신 사용)
+            
+        Returns:
+            Tuple: (메타데이터, 컬럼 목록, 튜플 배치 이터레이터) - 날짜 기준 내림차순
+            
+        Raises:
+            ValueError: 입력값 형식이 올바르지 않은 경우
+        """
+        if not TradingService.validate_stock_code(stock_code):
+            raise ValueError("주식 코드 형식이 올바르지 않습니다. (6자리 숫자)")
+        if not TradingService.validate_date_format(start_date):
+            raise ValueError("시작 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+        if not TradingService.validate_date_format(end_date):
+            raise ValueError("종료 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+        
+        if fields:
+            selected = [getattr(StockInvestorTrading, name) for name in fields]
+        else:
+            selected = TradingService._stock_date_range_columns(include_price, include_institution, include_foreigner)
+        columns = [column for column in selected if column.key not in ('stock_code', 'stock_name')]
+        stock_name = db.session.query(StockInvestorTrading.stock_name).filter(
+            StockInvestorTrading.stock_code == stock_code
+        ).order_by(StockInvestorTrading.trade_date.desc()).limit(1).scalar()
+        metadata = {
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            'start_date': start_date,
+            'end_date': end_date
+        }
+        
+        statement = select(*columns).where(
+            StockInvestorTrading.stock_code == stock_code,
+            StockInvestorTrading.trade_date >= start_date,
+            StockInvestorTrading.trade_date <= end_date
+        ).order_by(StockInvestorTrading.trade_date.desc()).execution_options(
+            stream_results=True, yield_per=batch_size or TradingService.STREAM_BATCH_SIZE
+        )
+        
+        def batches():
+            for partition in db.session.execute(statement).partitions():
+                yield partition
+        
+        return metadata, columns, batches()
+
+    @staticmethod
+    @result_cache.cached('bucketed', DataVersionService.TRADING, lambda p: [p['stock_code']] if p['stock_code'] else None)
+    @single_flight.coalesce
+    def get_trading_data_bucketed(
+        start_date: str,
+        end_date: str,
+        bucket: str,
+        stock_code: Optional[str] = None,
+        max_points: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        날짜 범위 거래 데이터를 차트용 시간 구간으로 줄여서 조회
+        
+        week / month: SQL에서 date_trunc로 종목별 구간 집계
+            (종가·누적은 구간의 마지막 값, 순매수는 구간 합계)
+        auto: 종목 코드가 있으면 일별 데이터를 LTTB로 max_points개 이하로 선택
+            (선택된 점의 순매수는 직전 선택 점 이후의 합계), 없으면 종목당 점 수가
+            max_points 이하가 되는 가장 작은 구간 단위(day/week/month)로 SQL 집계
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            bucket (str): week, month, auto
+            stock_code (Optional[str]): 주식 코드 (선택)
+            max_points (Optional[int]): auto에서 종목당 최대 점 수 (기본값: DEFAULT_MAX_POINTS, 최대 MAX_MAX_POINTS)
+            
+        Returns:
+            List[Dict[str, Any]]: 구간별 데이터 (bucket 시작일, 구간 내 마지막 trade_date, row_count 포함, 날짜 내림차순)
+            
+        Raises:
+            ValueError: 입력값 형식이 올바르지 않은 경우
+        """
+        if bucket not in TradingService.BUCKETS:
+            raise ValueError(f"지원하지 않는 구간 단위입니다: {bucket} ({', '.join(TradingService.BUCKETS)})")
+        if not start_date or not end_date:
+            raise ValueError("시작 날짜와 종료 날짜는 필수입니다.")
+        stock_code = stock_code.strip() if stock_code and stock_code.strip() else None
+        max_points = min(max(max_points or TradingService.DEFAULT_MAX_POINTS, 3), TradingService.MAX_MAX_POINTS)
+        
+        # 입력값 검증 (쿼리 실행 전)
+        TradingService._apply_filters(StockInvestorTrading.query, stock_code, start_date, end_date)
+        
+        try:
+            if bucket != 'auto':
+                return TradingService._aggregate_buckets(start_date, end_date, bucket, stock_code)
+            if stock_code:
+                return TradingService._downsample_lttb(stock_code, start_date, end_date, max_points)
+            
+            span_days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+            unit = next((name for name, days in TradingService.AUTO_BUCKET_DAYS if span_days / days <= max_points), 'month')
+            return TradingService._aggregate_buckets(start_date, end_date, unit, None)
+        except Exception as e:
+            raise Exception(f"구간 집계 거래 데이터 조회 중 오류 발생: {str(e)}") from e
+
+    @staticmethod
+    def _aggregate_buckets(start_date: str, end_date: str, unit: str, stock_code: Optional[str]) -> List[Dict[str, Any]]:
+        """date_trunc(unit)로 종목별 구간 집계 (unit은 검증된 day/week/month)"""
+        def last(column):
+            return array_agg(aggregate_order_by(column, StockInvestorTrading.trade_date.desc()))[1]
+        
+        # GROUP BY와 SELECT의 식이 같도록 구간 단위는 바인드 파라미터 대신 리터럴로 렌더링
+        bucket_start = func.date_trunc(literal_column(f"'{unit}'"), cast(StockInvestorTrading.trade_date, Date))
+        query = db.session.query(
+            func.to_char(bucket_start, 'YYYY-MM-DD').label('bucket'),
+            StockInvestorTrading.stock_code,
+            func.max(StockInvestorTrading.stock_name).label('stock_name'),
+            func.max(StockInvestorTrading.trade_date).label('trade_date'),
+            last(StockInvestorTrading.close_price).label('close_price'),
+            func.sum(StockInvestorTrading.institution_net_buy).label('institution_net_buy'),
+            func.sum(StockInvestorTrading.foreigner_net_buy).label('foreigner_net_buy'),
+            last(StockInvestorTrading.institution_accum).label('institution_accum'),
+            last(StockInvestorTrading.foreigner_accum).label('foreigner_accum'),
+            func.count().label('row_count')
+        )
+        query = TradingService._apply_filters(query, stock_code, start_date, end_date)
+        rows = query.group_by(bucket_start, StockInvestorTrading.stock_code).order_by(
+            bucket_start.desc(), StockInvestorTrading.stock_code
+        ).all()
+        return [dict(row._mapping) for row in rows]
+
+    @staticmethod
+    def _downsample_lttb(stock_code: str, start_date: str, end_date: str, max_points: int) -> List[Dict[str, Any]]:
+        """한 종목의 일별 데이터를 종가 기준 LTTB로 max_points개 이하로 선택"""
+        columns = [
+            StockInvestorTrading.stock_code,
+            StockInvestorTrading.stock_name,
+            StockInvestorTrading.trade_date,
+            StockInvestorTrading.close_price,
+            StockInvestorTrading.institution_net_buy,
+            StockInvestorTrading.foreigner_net_buy,
+            StockInvestorTrading.institution_accum,
+            StockInvestorTrading.foreigner_accum
+        ]
+        query = TradingService._apply_filters(db.session.query(*columns), stock_code, start_date, end_date)
+        rows = query.order_by(StockInvestorTrading.trade_date).all()
+        
+        selected = lttb_indices(date_axis([row.trade_date for row in rows]), [row.close_price for row in rows], max_points)
+        
+        result = []
+        previous = -1
+        for index in selected:
+            span = rows[previous + 1:index + 1]
+            item = dict(rows[index]._mapping)
+            item['bucket'] = span[0].trade_date
+            item['row_count'] = len(span)
+            for name in ('institution_net_buy', 'foreigner_net_buy'):
+                values = [getattr(row, name) for row in span if getattr(row, name) is not None]
+                item[name] = sum(values) if values else None
+            result.append(item)
+            previous = index
+        
+        result.reverse()
+        return result
+
+    @staticmethod
+    @result_cache.cached('batch', DataVersionService.TRADING, lambda p: p['stock_codes'])
+    @single_flight.coalesce
+    def get_trading_data_batch(
+        stock_codes: List[str],
+        start_date: str,
+        end_date: str,
+        fields: Optional[List[str]] = None,
+        align: bool = False
+    ) -> Dict[str, Any]:
+        """
+        여러 종목의 날짜 범위 거래 데이터를 한 번의 쿼리로 조회 (stock_code = ANY(:stock_codes))
+        
+        Args:
+            stock_codes (List[str]): 주식 코드 목록 (최대 MAX_BATCH_STOCK_CODES개, 중복 제거)
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT)
+            align (bool): 공통 날짜 축에 맞춘 필드별 배열로 반환할지 여부
+            
+        Returns:
+            Dict[str, Any]: 종목 코드별 행 목록 (align이면 dates와 종목별·필드별 배열, 데이터 없는 날은 null)
+            
+        Raises:
+            ValueError: 입력값 형식이 올바르지 않은 경우
+        """
+        codes = list(dict.fromkeys(code.strip() for code in stock_codes if code and code.strip()))
+        if not codes:
+            raise ValueError("주식 코드 목록은 필수입니다.")
+        if len(codes) > TradingService.MAX_BATCH_STOCK_CODES:
+            raise ValueError(f"한 번에 조회할 수 있는 종목은 최대 {TradingService.MAX_BATCH_STOCK_CODES}개입니다.")
+        invalid = [code for code in codes if not TradingService.validate_stock_code(code)]
+        if invalid:
+            raise ValueError(f"주식 코드 형식이 올바르지 않습니다. (6자리 숫자): {', '.join(invalid)}")
+        if not TradingService.validate_date_format(start_date):
+            raise ValueError("시작 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+        if not TradingService.validate_date_format(end_date):
+            raise ValueError("종료 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+        
+        try:
+            table_columns = StockInvestorTrading.__table__.columns
+            names = list(fields) if fields else [column.name for column in table_columns]
+            selected = list(dict.fromkeys([*names, 'stock_code', 'stock_name', 'trade_date']))
+            
+            # 종목 수와 무관하게 같은 SQL이 되도록 배열 파라미터 하나로 전달
+            rows = db.session.execute(
+                select(*[table_columns[name] for name in selected]).where(
+                    StockInvestorTrading.stock_code == any_(bindparam('stock_codes', codes, type_=ARRAY(db.String))),
+                    StockInvestorTrading.trade_date >= start_date,
+                    StockInvestorTrading.trade_date <= end_date
+                ).order_by(StockInvestorTrading.stock_code, StockInvestorTrading.trade_date.desc())
+            ).all()
+        except Exception as e:
+            raise Exception(f"다중 종목 거래 데이터 조회 중 오류 발생: {str(e)}") from e
+        
+        grouped = {code: [] for code in codes}
+        stock_names = {}
+        for row in rows:
+            grouped[row.stock_code].append(row)
+            stock_names.setdefault(row.stock_code, row.stock_name)
+        
+        result = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'count': len(rows),
+            'stock_names': stock_names,
+            'missing': [code for code in codes if not grouped[code]]
+        }
+        
+        if not align:
+            result['data'] = {
+                code: [{name: getattr(row, name) for name in names} for row in items]
+                for code, items in grouped.items()
+            }
+            return result
+        
+        # 공통 날짜 축 (내림차순)에 맞춰 필드별 배열 구성
+        dates = sorted({row.trade_date for row in rows}, reverse=True)
+        position = {trade_date: index for index, trade_date in enumerate(dates)}
+        value_names = [name for name in names if name not in ('stock_code', 'stock_name', 'trade_date')]
+        series = {}
+        for code, items in grouped.items():
+            arrays = {name: [None] * len(dates) for name in value_names}
+            for row in items:
+                index = position[row.trade_date]
+                for name in value_names:
+                    arrays[name][index] = getattr(row, name)
+            series[code] = arrays
+        
+        result['dates'] = dates
+        result['series'] = series
+        return result
+
+    @staticmethod
+    @result_cache.cached('by_date_range_optimized', DataVersionService.TRADING)
+    @single_flight.coalesce
     def get_trading_data_by_date_range_optimized(
         start_date: str, 
         end_date: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        fields: Optional[List[str]] = None
     ) -> List[StockInvestorTrading]:
         """
         날짜 범위 거래 데이터 조회 (페이징 지원, 고성능)
@@ -477,6 +956,7 @@ class TradingService:
             end_date (str): 종료 날짜 (YYYY-MM-DD)
             limit (Optional[int]): 조회할 레코드 수 제한
             offset (Optional[int]): 건너뛸 레코드 수
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
             
         Returns:
             List[StockInvestorTrading]: 거래 데이터 목록
@@ -489,12 +969,16 @@ class TradingService:
                 raise ValueError("종료 날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
             
             # 기본 쿼리 (날짜 인덱스 활용)
-            query = StockInvestorTrading.query.filter(
+            query = project(StockInvestorTrading.query, StockInvestorTrading, fields).filter(
                 StockInvestorTrading.trade_date >= start_date,
                 StockInvestorTrading.trade_date <= end_date
-            ).order_by(StockInvestorTrading.trade_date.desc())
+            ).order_by(
+                StockInvestorTrading.trade_date.desc(),
+                StockInvestorTrading.stock_code.desc(),
+                StockInvestorTrading.id.desc()
+            )
             
-            # 페이징 적용
+            # 페이징 적용 (동일 날짜 내 순서가 고정되도록 종목 코드, ID까지 정렬)
             if offset is not None:
                 query = query.offset(offset)
             if limit is not None:
@@ -575,7 +1059,10 @@ class TradingService:
                 foreigner_trend_signal=foreigner_trend_signal.strip() if foreigner_trend_signal else None,
                 foreigner_trend_score=foreigner_trend_score
             )
+            db.session.flush()
+            DigestService.refresh_months(trading_data.stock_code, [str(trading_data.trade_date)[:7]])
             
+            DataVersionService.bump(DataVersionService.TRADING, [trading_data.stock_code])
             db.session.commit()
             
             # 히스토리 로깅
@@ -616,6 +1103,9 @@ class TradingService:
             stock_info = f"{trading_data.stock_code} ({trading_data.stock_name}) - {trading_data.trade_date}"
             
             db.session.delete(trading_data)
+            db.session.flush()
+            DigestService.refresh_months(trading_data.stock_code, [str(trading_data.trade_date)[:7]])
+            DataVersionService.bump(DataVersionService.TRADING, [trading_data.stock_code])
             db.session.commit()
             
             # 히스토리 로깅
@@ -637,55 +1127,77 @@ class TradingService:
             raise Exception(f"거래 데이터 삭제 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def search_trading_data_by_name(name: str) -> List[StockInvestorTrading]:
+    def search_trading_data_by_name(
+        name: str,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[StockInvestorTrading]:
         """
         주식명으로 거래 데이터 검색
         
+        검색어를 주식 검색 인덱스로 종목 코드(최대 MAX_SEARCH_STOCKS개)로 바꾼 뒤 stock_code 조건으로 조회합니다.
+        
         Args:
-            name (str): 검색할 주식명 (부분 일치)
+            name (str): 검색할 주식명 (부분 일치, 초성 가능)
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
+            limit (Optional[int]): 최대 행 수 (기본값: DEFAULT_SEARCH_LIMIT, 최대 MAX_SEARCH_LIMIT)
             
         Returns:
-            List[StockInvestorTrading]: 검색된 거래 데이터 목록
+            List[StockInvestorTrading]: 검색된 거래 데이터 목록 (날짜 기준 내림차순)
         """
         try:
             if not name or not name.strip():
                 return []
-            
-            return StockInvestorTrading.query.filter(
-                StockInvestorTrading.stock_name.like(f'%{name.strip()}%')
-            ).order_by(StockInvestorTrading.trade_date.desc()).all()
+            codes = stock_search.resolve_codes(name, TradingService.MAX_SEARCH_STOCKS, include_codes=False)
+            return TradingService._search_by_codes(codes, fields, limit)
             
         except Exception as e:
             raise Exception(f"거래 데이터 검색 중 오류 발생: {str(e)}") from e
 
     @staticmethod
-    def search_trading_data_by_query(query: str) -> List[StockInvestorTrading]:
+    def search_trading_data_by_query(
+        query: str,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[StockInvestorTrading]:
         """
         주식 코드 또는 주식명으로 거래 데이터 검색
         
+        검색어를 주식 검색 인덱스로 종목 코드(최대 MAX_SEARCH_STOCKS개)로 바꾼 뒤 stock_code 조건으로 조회합니다.
+        
         Args:
-            query (str): 검색할 주식 코드 또는 주식명 (부분 일치)
+            query (str): 검색할 주식 코드 또는 주식명 (부분 일치, 초성 가능)
+            fields (Optional[List[str]]): 조회할 필드 (지정 시 해당 컬럼만 SELECT하여 Row 반환)
+            limit (Optional[int]): 최대 행 수 (기본값: DEFAULT_SEARCH_LIMIT, 최대 MAX_SEARCH_LIMIT)
             
         Returns:
-            List[StockInvestorTrading]: 검색된 거래 데이터 목록
+            List[StockInvestorTrading]: 검색된 거래 데이터 목록 (날짜 기준 내림차순)
         """
         try:
             if not query or not query.strip():
                 return []
-            
-            search_term = query.strip()
-            
-            # 주식 코드 또는 주식명에서 검색 (OR 조건)
-            return StockInvestorTrading.query.filter(
-                or_(
-                    StockInvestorTrading.stock_code.like(f'%{search_term}%'),
-                    StockInvestorTrading.stock_name.like(f'%{search_term}%')
-                )
-            ).order_by(StockInvestorTrading.trade_date.desc()).all()
+            codes = stock_search.resolve_codes(query, TradingService.MAX_SEARCH_STOCKS, include_codes=True)
+            return TradingService._search_by_codes(codes, fields, limit)
             
         except Exception as e:
             raise Exception(f"거래 데이터 검색 중 오류 발생: {str(e)}") from e
 
+    @staticmethod
+    def _search_by_codes(
+        codes: List[str],
+        fields: Optional[List[str]],
+        limit: Optional[int]
+    ) -> List[StockInvestorTrading]:
+        if not codes:
+            return []
+        limit = min(limit or TradingService.DEFAULT_SEARCH_LIMIT, TradingService.MAX_SEARCH_LIMIT)
+        return project(StockInvestorTrading.query, StockInvestorTrading, fields).filter(
+            StockInvestorTrading.stock_code == any_(bindparam('stock_codes', codes, type_=ARRAY(db.String)))
+        ).order_by(
+            StockInvestorTrading.trade_date.desc(),
+            StockInvestorTrading.stock_code.asc()
+        ).limit(limit).all()
+
     @staticmethod
     def update_trend_analysis(
         trading_id: int, 
@@ -725,6 +1237,7 @@ class TradingService:
                 foreigner_trend_signal=foreigner_trend_signal.strip(),
                 foreigner_trend_score=foreigner_trend_score
             )
+            DataVersionService.bump(DataVersionService.TRADING, [trading_data.stock_code])
             db.session.commit()
             
             return trading_data
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+거래 데이터 로컬 스풀 (Write-Ahead Spool)
+데이터베이스가 중단되었거나 느릴 때 수집한 거래 데이터를 로컬 파일에 추가 기록하고,
+DB가 복구되면 백그라운드에서 일괄 저장합니다.
+
+세그먼트 파일 형식 (little-endian):
+    레코드 = 헤더(MAGIC 2B, VERSION 1B, payload 길이 4B, CRC32 4B) + payload
+    payload = 코드 길이(1B) + 코드 + 이름 길이(2B) + 이름 + 행 수(4B) + 행 * ROW_STRUCT
+    행 = 거래일 ordinal(4B), NULL 플래그(1B), 종가(8B), 기관 순매수(8B), 외국인 순매수(8B)
+
+세그먼트 파일명은 생성 시각(ns), pid, 임의 문자열을 포함하므로 여러 프로세스가 같은 디렉터리를 써도 겹치지 않습니다.
+    segment-<시각>-<pid>-<uuid>.spool.active: 기록 중인 세그먼트 (재생 대상 아님)
+    segment-<시각>-<pid>-<uuid>.spool: 닫힌 세그먼트 (재생 대상)
+    segment-<시각>-<pid>-<uuid>.spool.replaying: 재생 중인 세그먼트 (이름 변경으로 선점, 한 프로세스만 처리)
+기록 중인 세그먼트는 orphan_after / 2 동안 기록이 없으면 닫으므로, orphan_after보다 오래 바뀌지 않은 .active 파일은
+종료된 프로세스가 남긴 것으로 보고 닫힌 세그먼트로 바꿔 재생합니다. 재생 도중 종료되어 남은 .replaying 파일도 같습니다.
+"""
+import os
+import glob
+import time
+import zlib
+import struct
+import logging
+import threading
+import uuid
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'SP'
+VERSION = 1
+HEADER_STRUCT = struct.Struct('<2sBII')
+ROW_STRUCT = struct.Struct('<IBqqq')
+ROW_FIELDS = ('close_price', 'institution_net_buy', 'foreigner_net_buy')
+
+
+def _encode_record(stock_code: str, stock_name: str, rows: List[Dict]) -> bytes:
+    """한 종목의 거래 데이터 행 목록을 레코드 바이트로 변환"""
+    code_bytes = stock_code.encode('utf-8')
+    name_bytes = stock_name.encode('utf-8')
+    parts = [
+        struct.pack('<B', len(code_bytes)), code_bytes,
+        struct.pack('<H', len(name_bytes)), name_bytes,
+        struct.pack('<I', len(rows))
+    ]
+    for row in rows:
+        trade_date = row['trade_date']
+        if not isinstance(trade_date, date):
+            trade_date = datetime.strptime(str(trade_date), '%Y-%m-%d').date()
+        null_flags = 0
+        values = []
+        for bit, field in enumerate(ROW_FIELDS):
+            value = row.get(field)
+            if value is None or value != value:  # None 또는 NaN
+                null_flags |= 1 << bit
+                value = 0
+            values.append(int(value))
+        parts.append(ROW_STRUCT.pack(trade_date.toordinal(), null_flags, *values))
+
+    payload = b''.join(parts)
+    header = HEADER_STRUCT.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload))
+    return header + payload
+
+
+def _decode_payload(payload: bytes) -> Tuple[str, str, List[Dict]]:
+    """레코드 payload를 (주식 코드, 주식명, 행 목록)으로 변환"""
+    offset = 0
+    (code_len,) = struct.unpack_from('<B', payload, offset)
+    offset += 1
+    stock_code = payload[offset:offset + code_len].decode('utf-8')
+    offset += code_len
+    (name_len,) = struct.unpack_from('<H', payload, offset)
+    offset += 2
+    stock_name = payload[offset:offset + name_len].decode('utf-8')
+    offset += name_len
+    (row_count,) = struct.unpack_from('<I', payload, offset)
+    offset += 4
+
+    rows = []
+    for _ in range(row_count):
+        ordinal, null_flags, *values = ROW_STRUCT.unpack_from(payload, offset)
+        offset += ROW_STRUCT.size
+        row = {'trade_date': date.fromordinal(ordinal).strftime('%Y-%m-%d')}
+        for bit, field in enumerate(ROW_FIELDS):
+            row[field] = None if null_flags & (1 << bit) else values[bit]
+        rows.append(row)
+    return stock_code, stock_name, rows
+
+
+class TradingSpool:
+    """
+    거래 데이터 로컬 스풀
+
+    append()는 활성 세그먼트 파일에 레코드를 추가하고, replay()는 닫힌 세그먼트를 순서대로
+    읽어 DB에 일괄 저장한 뒤 삭제합니다. 잘린 마지막 레코드(쓰기 도중 종료)와 CRC가
+    맞지 않는 레코드는 건너뜁니다.
+    """
+
+    SEGMENT_PREFIX = 'segment-'
+    SEGMENT_SUFFIX = '.spool'
+    ACTIVE_SUFFIX = '.active'
+    CLAIM_SUFFIX = '.replaying'
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        fsync: bool = True,
+        degraded_cooldown: float = 60.0,
+        orphan_after: float = 3600.0
+    ):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self.degraded_cooldown = degraded_cooldown
+        self.orphan_after = orphan_after
+
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._active_file = None
+        self._active_path = None
+        self._active_written_at = 0.0
+        self._degraded_until = 0.0
+        self._replayer = None
+        self._replayer_stop = threading.Event()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # DB 상태 관리
+    # ------------------------------------------------------------------
+    def mark_degraded(self, reason: str = '') -> None:
+        """DB 장애/지연 상태로 표시 (cooldown 동안 DB 저장을 시도하지 않음)"""
+        if not self.is_degraded():
+            logger.warning(f"데이터베이스 장애 감지, {self.degraded_cooldown}초 동안 로컬 스풀에 기록: {reason}")
+        self._degraded_until = time.time() + self.degraded_cooldown
+
+    def clear_degraded(self) -> None:
+        """DB 정상 상태로 표시"""
+        self._degraded_until = 0.0
+
+    def is_degraded(self) -> bool:
+        """DB 장애/지연 상태 여부"""
+        return time.time() < self._degraded_until
+
+    # ------------------------------------------------------------------
+    # 세그먼트 관리
+    # ------------------------------------------------------------------
+    def _glob(self, suffix: str) -> List[str]:
+        pattern = os.path.join(self.directory, f'{self.SEGMENT_PREFIX}*{suffix}')
+        return sorted(glob.glob(pattern))
+
+    def _segment_paths(self) -> List[str]:
+        """닫힌(재생 대상) 세그먼트 경로 목록 (생성 순)"""
+        return self._glob(self.SEGMENT_SUFFIX)
+
+    def _new_segment_path(self) -> str:
+        name = f'{self.SEGMENT_PREFIX}{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}{self.SEGMENT_SUFFIX}'
+        return os.path.join(self.directory, name + self.ACTIVE_SUFFIX)
+
+    def _close_active(self) -> None:
+        """기록 중인 세그먼트를 닫고 재생 대상으로 전환"""
+        if self._active_file is not None:
+            self._active_file.close()
+            try:
+                os.rename(self._active_path, self._active_path[:-len(self.ACTIVE_SUFFIX)])
+            except FileNotFoundError:
+                # 다른 프로세스가 버려진 세그먼트로 보고 이미 전환함
+                pass
+            self._active_file = None
+            self._active_path = None
+
+    def _stale_paths(self, suffix: str) -> List[str]:
+        """orphan_after보다 오래 바뀌지 않은 (종료된 프로세스가 남긴) 세그먼트 경로 목록"""
+        now = time.time()
+        stale = []
+        for path in self._glob(suffix):
+            if path == self._active_path:
+                continue
+            try:
+                if now - os.path.getmtime(path) >= self.orphan_after:
+                    stale.append(path)
+            except FileNotFoundError:
+                continue
+        return stale
+
+    def _recover_orphans(self) -> None:
+        """종료된 프로세스가 남긴 기록 중 / 재생 중 세그먼트를 재생 대상으로 되돌림"""
+        for suffix in (self.SEGMENT_SUFFIX + self.ACTIVE_SUFFIX, self.SEGMENT_SUFFIX + self.CLAIM_SUFFIX):
+            for path in self._stale_paths(suffix):
+                try:
+                    os.rename(path, path[:-len(suffix)] + self.SEGMENT_SUFFIX)
+                    logger.warning(f"버려진 스풀 세그먼트를 재생 대상으로 전환: {os.path.basename(path)}")
+                except FileNotFoundError:
+                    continue
+
+    def append(self, stock_code: str, stock_name: str, rows: List[Dict]) -> int:
+        """
+        한 종목의 거래 데이터를 스풀에 추가
+
+        Args:
+            stock_code (str): 주식 코드
+            stock_name (str): 주식명
+            rows (List[Dict]): trade_date, close_price, institution_net_buy, foreigner_net_buy 행 목록
+
+        Returns:
+            int: 기록한 행 수
+        """
+        if not rows:
+            return 0
+
+        record = _encode_record(stock_code, stock_name, rows)
+        with self._lock:
+            now = time.time()
+            if self._active_file is not None and (
+                self._active_file.tell() >= self.segment_max_bytes
+                or now - self._active_written_at >= self.orphan_after / 2
+            ):
+                # 크기 초과 또는 오래 쉬었으면 닫음 (버려진 세그먼트로 오인되기 전에 새 세그먼트 사용)
+                self._close_active()
+            if self._active_file is None:
+                self._active_path = self._new_segment_path()
+                self._active_file = open(self._active_path, 'ab')
+
+            self._active_file.write(record)
+            self._active_file.flush()
+            if self.fsync:
+                os.fsync(self._active_file.fileno())
+            self._active_written_at = now
+
+        logger.info(f"로컬 스풀 기록: {stock_code} ({len(rows)}건)")
+        return len(rows)
+
+    @staticmethod
+    def read_segment(path: str) -> Iterator[Tuple[str, str, List[Dict]]]:
+        """
+        세그먼트 파일의 레코드를 순서대로 읽기
+
+        Args:
+            path (str): 세그먼트 파일 경로
+
+        Yields:
+            Tuple[str, str, List[Dict]]: (주식 코드, 주식명, 행 목록)
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        offset = 0
+        while offset + HEADER_STRUCT.size <= len(data):
+            magic, version, length, checksum = HEADER_STRUCT.unpack_from(data, offset)
+            if magic != MAGIC or version != VERSION:
+                logger.error(f"스풀 세그먼트 손상 (헤더 불일치): {path} @ {offset}")
+                return
+            start = offset + HEADER_STRUCT.size
+            payload = data[start:start + length]
+            if len(payload) < length:
+                logger.warning(f"스풀 세그먼트 끝의 잘린 레코드를 건너뜀: {path} @ {offset}")
+                return
+            offset = start + length
+            if zlib.crc32(payload) != checksum:
+                logger.error(f"스풀 레코드 체크섬 불일치, 건너뜀: {path} @ {start}")
+                continue
+            yield _decode_payload(payload)
+
+    def stats(self) -> Dict:
+        """스풀 상태 (세그먼트 수, 크기, DB 장애 상태)"""
+        paths = self._segment_paths() + self._glob(self.SEGMENT_SUFFIX + self.ACTIVE_SUFFIX)
+        pending_bytes = 0
+        for path in paths:
+            try:
+                pending_bytes += os.path.getsize(path)
+            except FileNotFoundError:
+                continue
+        return {
+            'directory': self.directory,
+            'segments': len(paths),
+            'pending_bytes': pending_bytes,
+            'degraded': self.is_degraded(),
+            'replayer_running': bool(self._replayer and self._replayer.is_alive())
+        }
+
+    def has_pending(self) -> bool:
+        """이 프로세스가 재생할 수 있는 세그먼트 존재 여부 (기록 중인 자기 세그먼트 포함)"""
+        return bool(
+            self._active_path
+            or self._segment_paths()
+            or self._stale_paths(self.SEGMENT_SUFFIX + self.ACTIVE_SUFFIX)
+            or self._stale_paths(self.SEGMENT_SUFFIX + self.CLAIM_SUFFIX)
+        )
+
+    # ------------------------------------------------------------------
+    # 재생 (DB 일괄 저장)
+    # ------------------------------------------------------------------
+    def replay(self, max_segments: Optional[int] = None) -> Dict:
+        """
+        스풀 세그먼트를 DB에 일괄 저장 (Flask 앱 컨텍스트 안에서 호출)
+
+        Args:
+            max_segments (Optional[int]): 이번에 처리할 최대 세그먼트 수
+
+        Returns:
+            Dict: 재생 결과 통계
+        """
+        from backend.extensions import db
+        from backend.services.trading_service import TradingService
+        from backend.services.digest_service import DigestService
+        from backend.services.data_collector import DataCollectorService
+
+        results = {'segments': 0, 'records': 0, 'inserted_rows': 0, 'stocks': [], 'accum_failed': []}
+
+        # 같은 프로세스의 재생(API 요청, 백그라운드 스레드)은 한 번에 하나만 실행
+        with self._replay_lock:
+            with self._lock:
+                # 기록 중인 세그먼트를 닫아 재생 대상에 포함
+                self._close_active()
+            self._recover_orphans()
+            paths = self._segment_paths()
+
+            if max_segments is not None:
+                paths = paths[:max_segments]
+
+            affected = set()
+            for path in paths:
+                claimed = path + self.CLAIM_SUFFIX
+                try:
+                    # 이름 변경으로 세그먼트를 선점 (다른 프로세스가 먼저 가져갔으면 건너뜀)
+                    os.rename(path, claimed)
+                    os.utime(claimed)
+                except FileNotFoundError:
+                    continue
+
+                try:
+                    batch = []
+                    months_by_stock: Dict[str, set] = {}
+                    for stock_code, stock_name, rows in self.read_segment(claimed):
+                        results['records'] += 1
+                        for row in rows:
+                            batch.append({
+                                'stock_code': stock_code,
+                                'stock_name': stock_name,
+                                'trade_date': row['trade_date'],
+                                'close_price': row['close_price'],
+                                'institution_net_buy': row['institution_net_buy'],
+                                'foreigner_net_buy': row['foreigner_net_buy'],
+                                'institution_accum': 0,
+                                'foreigner_accum': 0
+                            })
+                            months_by_stock.setdefault(stock_code, set()).add(row['trade_date'][:7])
+
+                    inserted = TradingService.bulk_insert_trading_data(batch)
+                    for stock_code, months in months_by_stock.items():
+                        DigestService.refresh_months(stock_code, list(months))
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    # 다음 재생에서 다시 처리하도록 선점 해제
+                    os.rename(claimed, path)
+                    raise
+
+                os.remove(claimed)
+                results['segments'] += 1
+                results['inserted_rows'] += inserted
+                affected.update(months_by_stock.keys())
+                logger.info(f"스풀 세그먼트 저장 완료: {os.path.basename(path)} ({len(batch)}건 중 {inserted}건 저장)")
+
+                # 스풀 행은 누적값 0으로 저장되므로 세그먼트마다 영향받은 종목의 누적값을 다시 계산
+                for stock_code in sorted(months_by_stock):
+                    if not DataCollectorService.calculate_accumulated_data(stock_code):
+                        results['accum_failed'].append(stock_code)
+
+        results['stocks'] = sorted(affected)
+        results['accum_failed'] = sorted(set(results['accum_failed']))
+        if results['accum_failed']:
+            logger.warning(f"스풀 재생 후 누적 데이터 계산 실패: {', '.join(results['accum_failed'])}")
+        return results
+
+    def start_replayer(self, app, interval: float = 30.0) -> None:
+        """
+        백그라운드 재생 스레드 시작 (이미 실행 중이면 무시)
+
+        Args:
+            app: Flask 애플리케이션 객체
+            interval (float): DB 복구 확인 간격 (초)
+        """
+        with self._lock:
+            if self._replayer and self._replayer.is_alive():
+                return
+            self._replayer_stop.clear()
+            self._replayer = threading.Thread(
+                target=self._replay_loop, args=(app, interval), name='trading-spool-replayer', daemon=True
+            )
+            self._replayer.start()
+
+    def stop_replayer(self) -> None:
+        """백그라운드 재생 스레드 중지 요청"""
+        self._replayer_stop.set()
+
+    def _replay_loop(self, app, interval: float) -> None:
+        from sqlalchemy import text
+        from backend.extensions import db
+
+        logger.info("스풀 재생 스레드 시작")
+        while not self._replayer_stop.wait(interval):
+            if not self.has_pending():
+                if not self.is_degraded():
+                    break
+                continue
+
+            with app.app_context():
+                try:
+                    db.session.execute(text("SELECT 1"))
+                except Exception as e:
+                    logger.debug(f"데이터베이스 미복구, 스풀 재생 대기: {e}")
+                    db.session.remove()
+                    continue
+
+                try:
+                    results = self.replay()
+                    self.clear_degraded()
+                    logger.info(f"스풀 재생 완료: 세그먼트 {results['segments']}개, {results['inserted_rows']}건 저장")
+                except Exception as e:
+                    logger.error(f"스풀 재생 실패: {e}")
+                finally:
+                    db.session.remove()
+        logger.info("스풀 재생 스레드 종료")
+
+
+_spool: Optional[TradingSpool] = None
+_spool_lock = threading.Lock()
+
+
+def get_spool() -> TradingSpool:
+    """앱 설정(TRADING_SPOOL)으로 생성한 프로세스 전역 스풀 반환"""
+    global _spool
+    with _spool_lock:
+        if _spool is None:
+            settings = current_app.config['TRADING_SPOOL']
+            _spool = TradingSpool(
+                directory=settings['directory'],
+                segment_max_bytes=settings['segment_max_bytes'],
+                fsync=settings['fsync'],
+                degraded_cooldown=settings['degraded_cooldown'],
+                orphan_after=settings.get('orphan_after', 3600)
+            )
+        return _spool
@@ -32,9 +32,10 @@ CREATE TABLE IF NOT EXISTS stock_investor_trading (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 데이터 히스토리 테이블 생성
+-- 데이터 히스토리 테이블 생성 (created_at 기준 월별 파티션)
+-- 월별 파티션은 애플리케이션 시작 시 또는 scripts/manage_history_partitions.py ensure 로 생성
 CREATE TABLE IF NOT EXISTS data_history (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     table_name VARCHAR(50) NOT NULL,
     record_id INTEGER,
     action VARCHAR(20) NOT NULL,
@@ -45,21 +46,69 @@ CREATE TABLE IF NOT EXISTS data_history (
     ip_address VARCHAR(45),
     user_agent TEXT,
     user_id INTEGER,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE TABLE IF NOT EXISTS data_history_default PARTITION OF data_history DEFAULT;
 
--- 시스템 로그 테이블 생성
+-- 시스템 로그 테이블 생성 (created_at 기준 월별 파티션)
 CREATE TABLE IF NOT EXISTS system_log (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     level VARCHAR(20) NOT NULL,
     category VARCHAR(50) NOT NULL,
     message TEXT NOT NULL,
     details TEXT,
     user_id INTEGER,
     ip_address VARCHAR(45),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE TABLE IF NOT EXISTS system_log_default PARTITION OF system_log DEFAULT;
+
+-- 히스토리 시간별 집계 테이블 생성 (/history/stats, /history/summary 조회용)
+CREATE TABLE IF NOT EXISTS history_rollup (
+    id SERIAL PRIMARY KEY,
+    hour TIMESTAMP NOT NULL,
+    table_name VARCHAR(50) NOT NULL DEFAULT '',
+    action VARCHAR(20) NOT NULL DEFAULT '',
+    level VARCHAR(20) NOT NULL DEFAULT '',
+    event_count BIGINT NOT NULL DEFAULT 0,
+    CONSTRAINT uk_history_rollup_key UNIQUE (hour, table_name, action, level)
+);
+
+-- 히스토리 아카이브 매니페스트 테이블 생성 (콜드 스토리지 파일 목록)
+CREATE TABLE IF NOT EXISTS history_archive (
+    id SERIAL PRIMARY KEY,
+    table_name VARCHAR(50) NOT NULL,
+    year_month VARCHAR(7) NOT NULL,
+    file_name VARCHAR(255) NOT NULL UNIQUE,
+    row_count INTEGER NOT NULL,
+    min_created_at TIMESTAMP NOT NULL,
+    max_created_at TIMESTAMP NOT NULL,
+    size_bytes BIGINT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 데이터 버전 테이블 생성 (조회 API ETag / 304 응답용)
+CREATE TABLE IF NOT EXISTS data_version (
+    table_name VARCHAR(50) NOT NULL,
+    scope_key VARCHAR(20) NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (table_name, scope_key)
+);
+
+-- 종목-월 다이제스트 테이블 생성 (재수집 없이 정합성 확인용)
+CREATE TABLE IF NOT EXISTS stock_month_digest (
+    id SERIAL PRIMARY KEY,
+    stock_code VARCHAR(20) NOT NULL,
+    year_month VARCHAR(7) NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    digest VARCHAR(32) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uk_stock_month_digest_stock_month UNIQUE (stock_code, year_month)
+);
+
 -- 인덱스 생성
 -- 주식 코드 인덱스
 CREATE INDEX IF NOT EXISTS idx_stock_list_stock_code ON stock_list(stock_code);
@@ -69,6 +118,7 @@ CREATE INDEX IF NOT EXISTS idx_stock_investor_trading_stock_code ON stock_invest
 CREATE INDEX IF NOT EXISTS idx_stock_investor_trading_trade_date ON stock_investor_trading(trade_date);
 CREATE INDEX IF NOT EXISTS idx_stock_investor_trading_stock_date ON stock_investor_trading(stock_code, trade_date);
 CREATE INDEX IF NOT EXISTS idx_stock_investor_trading_date_stock ON stock_investor_trading(trade_date, stock_code);
+CREATE INDEX IF NOT EXISTS idx_trading_date_stock_id ON stock_investor_trading(trade_date, stock_code, id);
 
 -- 거래 데이터 조회 성능 최적화 인덱스 (추가)
 -- 날짜 범위 조회 최적화
@@ -86,11 +136,19 @@ CREATE INDEX IF NOT EXISTS idx_trading_stock_date_foreigner_net ON stock_investo
 -- 히스토리 인덱스들
 CREATE INDEX IF NOT EXISTS idx_data_history_table_name ON data_history(table_name);
 CREATE INDEX IF NOT EXISTS idx_data_history_created_at ON data_history(created_at);
+CREATE INDEX IF NOT EXISTS idx_data_history_table_created ON data_history(table_name, created_at);
+CREATE INDEX IF NOT EXISTS idx_data_history_created_id ON data_history(created_at, id);
 CREATE INDEX IF NOT EXISTS idx_data_history_action ON data_history(action);
 
 -- 시스템 로그 인덱스들
 CREATE INDEX IF NOT EXISTS idx_system_log_level ON system_log(level);
 CREATE INDEX IF NOT EXISTS idx_system_log_created_at ON system_log(created_at);
+CREATE INDEX IF NOT EXISTS idx_system_log_category_created ON system_log(category, created_at);
+CREATE INDEX IF NOT EXISTS idx_system_log_level_created ON system_log(level, created_at);
+CREATE INDEX IF NOT EXISTS idx_system_log_created_id ON system_log(created_at, id);
+
+-- 히스토리 아카이브 인덱스
+CREATE INDEX IF NOT EXISTS idx_history_archive_table_range ON history_archive(table_name, min_created_at, max_created_at);
 
 -- 제약 조건 추가
 -- 거래 데이터의 주식 코드와 날짜 조합은 유니크해야 함
@@ -121,6 +179,10 @@ COMMENT ON TABLE stock_list IS '주식 목록 정보';
 COMMENT ON TABLE stock_investor_trading IS '주식 투자자별 거래 데이터';
 COMMENT ON TABLE data_history IS '데이터 변경 히스토리';
 COMMENT ON TABLE system_log IS '시스템 로그';
+COMMENT ON TABLE stock_month_digest IS '종목-월 거래 데이터 다이제스트';
+COMMENT ON TABLE history_rollup IS '히스토리 시간별 집계';
+COMMENT ON TABLE history_archive IS '히스토리 아카이브 매니페스트';
+COMMENT ON TABLE data_version IS '테이블/종목별 데이터 버전 (ETag)';
 
 COMMENT ON COLUMN stock_list.stock_code IS '주식 코드';
 COMMENT ON COLUMN stock_list.stock_name IS '주식명';
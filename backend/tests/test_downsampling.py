@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+LTTB 다운샘플링 테스트
+"""
+from backend.utils.downsampling import date_axis, lttb_indices
+
+
+def test_returns_all_points_when_under_threshold():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+    assert lttb_indices(list(range(10)), list(range(10)), 2) == list(range(10))
+
+
+def test_keeps_endpoints_and_threshold():
+    xs = list(range(100))
+    ys = [x % 7 for x in xs]
+    selected = lttb_indices(xs, ys, 10)
+
+    assert len(selected) == 10
+    assert selected[0] == 0 and selected[-1] == 99
+    assert selected == sorted(set(selected))
+
+
+def test_keeps_spike():
+    xs = list(range(50))
+    ys = [0] * 50
+    ys[23] = 1000
+    assert 23 in lttb_indices(xs, ys, 5)
+
+
+def test_none_values_use_previous_value():
+    xs = list(range(20))
+    ys = [1.0] * 20
+    ys[5] = None
+    ys[12] = 50.0
+    selected = lttb_indices(xs, ys, 5)
+    assert 12 in selected
+    assert len(selected) == 5
+
+
+def test_date_axis_is_day_ordinal():
+    axis = date_axis(['2024-02-28', '2024-02-29', '2024-03-04'])
+    assert [b - a for a, b in zip(axis, axis[1:])] == [1, 4]
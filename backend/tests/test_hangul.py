@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+한글 검색 유틸리티 테스트
+"""
+from backend.utils.hangul import CHOSUNG_SET, chosung, is_chosung_query, normalize, similarity, trigrams
+
+
+def test_normalize_lowercases_and_removes_spaces():
+    assert normalize('SK 하이닉스') == 'sk하이닉스'
+    assert normalize('  Naver\t Corp ') == 'navercorp'
+    assert normalize(None) == ''
+
+
+def test_chosung_converts_hangul_only():
+    assert chosung('삼성전자') == 'ㅅㅅㅈㅈ'
+    assert chosung('sk하이닉스') == 'skㅎㅇㄴㅅ'
+    assert chosung('까치') == 'ㄲㅊ'
+    assert all(char in CHOSUNG_SET for char in chosung('삼성바이오로직스'))
+
+
+def test_is_chosung_query():
+    assert is_chosung_query('ㅅㅅㅂㅇ')
+    assert is_chosung_query('삼ㅅ')
+    assert not is_chosung_query('삼성')
+    assert not is_chosung_query('005930')
+
+
+def test_trigrams_padding():
+    assert trigrams('abc') == {'  a', ' ab', 'abc', 'bc '}
+    assert trigrams('abc', padded=False) == {'abc'}
+    assert trigrams('ab', padded=False) == set()
+
+
+def test_similarity():
+    assert similarity(trigrams('삼성전자'), trigrams('삼성전자')) == 1.0
+    assert similarity(trigrams('삼성전자'), set()) == 0.0
+    assert 0.0 < similarity(trigrams('삼성전자'), trigrams('삼성전기')) < 1.0
+    assert similarity(trigrams('삼성전자'), trigrams('삼성전자우')) > similarity(trigrams('삼성전자'), trigrams('현대차'))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+키셋 페이지네이션 커서 인코딩 테스트
+"""
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+from backend.utils.pagination import NEXT, PREV, decode_cursor, encode_cursor  # noqa: E402
+
+
+def test_cursor_round_trip_preserves_types():
+    values = [date(2024, 1, 2), '005930', 42, datetime(2024, 1, 2, 15, 30, 5)]
+    token = encode_cursor(values, PREV)
+
+    assert decode_cursor(token, len(values)) == (values, PREV)
+
+
+def test_cursor_is_url_safe_without_padding():
+    token = encode_cursor(['삼성전자?&=', 1])
+    assert '=' not in token and '+' not in token and '/' not in token
+    assert decode_cursor(token, 2) == (['삼성전자?&=', 1], NEXT)
+
+
+@pytest.mark.parametrize('token', ['not-a-cursor', '', encode_cursor([1]), encode_cursor([1, 2], 'sideways')])
+def test_invalid_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token, 2)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 스풀 세그먼트 테스트 (DB 없이 파일 형식, 손상 처리, 선점/버려진 세그먼트 복구 확인)
+"""
+import os
+import time
+
+import pytest
+
+pytest.importorskip('flask')
+
+from backend.services.trading_spool import (  # noqa: E402
+    HEADER_STRUCT, TradingSpool, _decode_payload, _encode_record
+)
+
+ROWS = [
+    {'trade_date': '2024-01-03', 'close_price': 71000, 'institution_net_buy': -1500, 'foreigner_net_buy': 2300},
+    {'trade_date': '2024-01-02', 'close_price': 70500, 'institution_net_buy': None, 'foreigner_net_buy': 0},
+]
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return TradingSpool(str(tmp_path), fsync=False, orphan_after=60.0)
+
+
+def _closed_segment(spool):
+    spool._close_active()
+    paths = spool._segment_paths()
+    assert len(paths) == 1
+    return paths[0]
+
+
+def test_record_round_trip():
+    record = _encode_record('005930', '삼성전자', ROWS)
+    stock_code, stock_name, rows = _decode_payload(record[HEADER_STRUCT.size:])
+
+    assert stock_code == '005930'
+    assert stock_name == '삼성전자'
+    assert rows == ROWS
+
+
+def test_record_treats_nan_as_null():
+    stock_code, stock_name, rows = _decode_payload(
+        _encode_record('000660', 'SK하이닉스', [dict(ROWS[0], close_price=float('nan'))])[HEADER_STRUCT.size:]
+    )
+    assert rows[0]['close_price'] is None
+
+
+def test_append_and_read_segment(spool):
+    spool.append('005930', '삼성전자', ROWS)
+    spool.append('000660', 'SK하이닉스', ROWS[:1])
+    path = _closed_segment(spool)
+
+    records = list(TradingSpool.read_segment(path))
+    assert [(code, len(rows)) for code, _, rows in records] == [('005930', 2), ('000660', 1)]
+
+
+def test_read_segment_skips_truncated_tail(spool):
+    spool.append('005930', '삼성전자', ROWS)
+    spool.append('000660', 'SK하이닉스', ROWS)
+    path = _closed_segment(spool)
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 5)
+
+    records = list(TradingSpool.read_segment(path))
+    assert [code for code, _, _ in records] == ['005930']
+
+
+def test_read_segment_skips_crc_mismatch(spool):
+    spool.append('005930', '삼성전자', ROWS)
+    spool.append('000660', 'SK하이닉스', ROWS)
+    path = _closed_segment(spool)
+    with open(path, 'r+b') as f:
+        data = bytearray(f.read())
+        data[HEADER_STRUCT.size + 3] ^= 0xFF  # 첫 레코드 payload 변조
+        f.seek(0)
+        f.write(bytes(data))
+
+    records = list(TradingSpool.read_segment(path))
+    assert [code for code, _, _ in records] == ['000660']
+
+
+def test_active_segment_is_not_replay_target_until_closed(spool):
+    spool.append('005930', '삼성전자', ROWS)
+    assert spool._segment_paths() == []
+    assert spool.has_pending()
+
+    spool._close_active()
+    assert len(spool._segment_paths()) == 1
+    assert spool._active_path is None
+
+
+def test_segment_paths_are_unique(spool):
+    assert spool._new_segment_path() != spool._new_segment_path()
+
+
+def test_recover_orphans_reopens_stale_segments(spool, tmp_path):
+    stale_time = time.time() - 120
+    active = tmp_path / 'segment-00000000000000000001-1-aaaaaaaa.spool.active'
+    claimed = tmp_path / 'segment-00000000000000000002-1-bbbbbbbb.spool.replaying'
+    fresh = tmp_path / 'segment-00000000000000000003-1-cccccccc.spool.active'
+    for path in (active, claimed, fresh):
+        path.write_bytes(_encode_record('005930', '삼성전자', ROWS))
+    os.utime(active, (stale_time, stale_time))
+    os.utime(claimed, (stale_time, stale_time))
+
+    spool._recover_orphans()
+
+    assert [os.path.basename(p) for p in spool._segment_paths()] == [
+        'segment-00000000000000000001-1-aaaaaaaa.spool',
+        'segment-00000000000000000002-1-bbbbbbbb.spool',
+    ]
+    assert fresh.exists()
+
+
+def test_own_active_segment_is_never_stale(spool):
+    spool.append('005930', '삼성전자', ROWS)
+    stale_time = time.time() - 120
+    os.utime(spool._active_path, (stale_time, stale_time))
+
+    assert spool._stale_paths(TradingSpool.SEGMENT_SUFFIX + TradingSpool.ACTIVE_SUFFIX) == []
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+협조적 취소 유틸리티
+장시간 실행되는 수집 작업(페이지 요청, 파싱, 저장)에 취소 요청을 전달하기 위한 토큰을 제공합니다.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OperationCancelled(Exception):
+    """
+    취소 토큰에 의해 작업이 중단되었을 때 발생하는 예외
+
+    Attributes:
+        partial (Any): 중단 시점까지 처리된 부분 결과 (없으면 None)
+    """
+
+    def __init__(self, message: str = '작업이 취소되었습니다.', partial: Any = None):
+        super().__init__(message)
+        self.partial = partial
+
+
+class CancellationToken:
+    """
+    협조적 취소 토큰
+
+    작업 코드는 단계 사이마다 raise_if_cancelled()를 호출하고, 대기는 time.sleep 대신 wait()를
+    사용합니다. 진행 중인 블로킹 작업(HTTP 요청 등)은 register()로 중단 콜백을 등록해 두면
+    cancel() 시점에 즉시 호출됩니다.
+
+    Attributes:
+        policy (str): 취소 시 이미 파싱된 데이터 처리 방식 (flush: 저장, discard: 폐기)
+    """
+
+    FLUSH = 'flush'
+    DISCARD = 'discard'
+    POLICIES = (FLUSH, DISCARD)
+
+    def __init__(self, policy: str = FLUSH):
+        if policy not in self.POLICIES:
+            raise ValueError(f"지원하지 않는 취소 정책입니다: {policy} ({', '.join(self.POLICIES)})")
+        self.policy = policy
+        self.reason = ''
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_handle = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._event.is_set()
+
+    @property
+    def should_flush(self) -> bool:
+        """취소 시 이미 파싱된 데이터를 저장해야 하는지 여부"""
+        return self.policy == self.FLUSH
+
+    def cancel(self, reason: str = '') -> None:
+        """
+        취소 요청 (등록된 중단 콜백을 모두 호출)
+
+        Args:
+            reason (str): 취소 사유
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"취소 콜백 실행 오류: {e}")
+
+    def raise_if_cancelled(self, partial: Any = None) -> None:
+        """
+        취소 요청이 있으면 OperationCancelled 예외 발생
+
+        Args:
+            partial (Any): 예외에 담을 부분 결과
+        """
+        if self._event.is_set():
+            raise OperationCancelled(self.reason or '작업이 취소되었습니다.', partial)
+
+    def wait(self, seconds: float) -> bool:
+        """
+        지정한 시간 동안 대기 (취소 요청 시 즉시 반환)
+
+        Args:
+            seconds (float): 대기 시간 (초)
+
+        Returns:
+            bool: 대기 중 취소 요청 여부
+        """
+        return self._event.wait(seconds)
+
+    def register(self, callback: Callable[[], None]) -> Optional[int]:
+        """
+        취소 시 호출할 콜백 등록 (이미 취소된 경우 즉시 호출)
+
+        Args:
+            callback (Callable[[], None]): 진행 중인 작업을 중단하는 함수
+
+        Returns:
+            Optional[int]: 등록 해제용 핸들 (즉시 호출된 경우 None)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = self._next_handle
+                self._next_handle += 1
+                self._callbacks[handle] = callback
+                return handle
+        callback()
+        return None
+
+    def unregister(self, handle: Optional[int]) -> None:
+        """콜백 등록 해제"""
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """with 블록 동안만 취소 콜백을 등록하는 컨텍스트 매니저"""
+        handle = self.register(callback)
+        try:
+            yield
+        finally:
+            self.unregister(handle)
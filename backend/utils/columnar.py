@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+컬럼형 응답 유틸리티
+DB 커서에서 받은 튜플 배치를 ORM 객체 없이 필드별 배열(struct-of-arrays) 또는
+Arrow IPC 스트림으로 변환합니다.
+
+Arrow 형식은 pyarrow 패키지가 필요합니다 (선택 의존성).
+"""
+import io
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+
+def to_columnar(columns: Sequence, batches: Iterable[Sequence[Sequence[Any]]]) -> Dict[str, List[Any]]:
+    """
+    튜플 배치를 필드별 배열로 변환
+
+    Args:
+        columns (Sequence): 조회한 SQLAlchemy 컬럼 목록 (튜플 순서와 동일)
+        batches (Iterable): 행 튜플 배치 이터러블
+
+    Returns:
+        Dict[str, List[Any]]: 컬럼명 -> 값 배열
+    """
+    names = [column.key for column in columns]
+    data = {name: [] for name in names}
+    arrays = [data[name] for name in names]
+    for batch in batches:
+        for row in batch:
+            for array, value in zip(arrays, row):
+                array.append(value)
+    return data
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Arrow 형식으로 응답하려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _arrow_type(pa, column):
+    python_type = column.type.python_type
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    return pa.string()
+
+
+def arrow_stream(columns: Sequence, batches: Iterable[Sequence[Sequence[Any]]],
+                 metadata: Dict[str, Any] = None) -> Iterator[bytes]:
+    """
+    튜플 배치를 Arrow IPC 스트림 바이트 조각으로 변환 (배치마다 하나의 RecordBatch)
+
+    Args:
+        columns (Sequence): 조회한 SQLAlchemy 컬럼 목록 (튜플 순서와 동일)
+        batches (Iterable): 행 튜플 배치 이터러블
+        metadata (Dict[str, Any], optional): 스키마 메타데이터 (예: 종목 코드, 종목명)
+
+    Returns:
+        Iterator[bytes]: 스키마, RecordBatch, 종료 표시 순서의 바이트 조각
+
+    Raises:
+        ImportError: pyarrow가 설치되지 않은 경우 (스트림 시작 전에 확인)
+    """
+    pa = _require_pyarrow()
+    schema = pa.schema(
+        [pa.field(column.key, _arrow_type(pa, column)) for column in columns],
+        metadata={key: str(value) for key, value in (metadata or {}).items()}
+    )
+
+    def generate():
+        sink = io.BytesIO()
+
+        def drain() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        with pa.ipc.new_stream(sink, schema) as writer:
+            yield drain()
+            for batch in batches:
+                if not batch:
+                    continue
+                arrays = [pa.array(list(values), type=field.type)
+                          for values, field in zip(zip(*batch), schema)]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                yield drain()
+        yield drain()
+
+    return generate()
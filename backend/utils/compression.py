@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+응답 압축 미들웨어
+Accept-Encoding에 따라 JSON 등 텍스트 응답을 brotli 또는 gzip으로 압축합니다.
+
+    - min_size 바이트보다 작은 응답은 압축하지 않음 (압축 이득보다 CPU 비용이 큼)
+    - 스트리밍 응답(stream=json|ndjson, Arrow)은 청크 단위로 압축하여 그대로 흘려보냄
+    - 같은 본문(본문 해시 기준)의 압축 결과는 메모리 LRU 캐시에 보관
+
+brotli 압축은 brotli 패키지가 필요합니다 (선택 의존성, 없으면 gzip만 사용).
+"""
+import hashlib
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from flask import request
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+DEFAULT_MIMETYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/vnd.apache.arrow.stream',
+    'text/html',
+    'text/plain',
+    'text/csv',
+)
+
+
+class CompressedBodyCache:
+    """압축된 응답 본문 LRU 캐시 (전체 바이트 수 기준으로 제한, 스레드 안전)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Tuple[str, str], bytes]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Tuple[str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._size, 'max_bytes': self.max_bytes}
+
+
+def _compressor(encoding: str, settings: Dict[str, Any]):
+    if encoding == 'br':
+        return brotli.Compressor(quality=settings.get('brotli_quality', 4))
+    # wbits=31: gzip 헤더/트레일러 포함
+    return zlib.compressobj(settings.get('gzip_level', 6), zlib.DEFLATED, 31)
+
+
+def compress_bytes(data: bytes, encoding: str, settings: Dict[str, Any]) -> bytes:
+    """
+    본문 전체 압축
+
+    Args:
+        data (bytes): 원본 본문
+        encoding (str): br 또는 gzip
+        settings (Dict[str, Any]): COMPRESSION 설정
+
+    Returns:
+        bytes: 압축된 본문
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=settings.get('brotli_quality', 4))
+    compressor = _compressor(encoding, settings)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str, settings: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    스트리밍 본문을 청크 단위로 압축 (청크마다 flush하여 클라이언트가 바로 풀 수 있게 함)
+
+    Args:
+        chunks (Iterable[bytes]): 원본 청크 이터러블
+        encoding (str): br 또는 gzip
+        settings (Dict[str, Any]): COMPRESSION 설정
+
+    Returns:
+        Iterator[bytes]: 압축된 청크
+    """
+    compressor = _compressor(encoding, settings)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if not chunk:
+                continue
+            if encoding == 'br':
+                data = compressor.process(chunk) + compressor.flush()
+            else:
+                data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.finish() if encoding == 'br' else compressor.flush()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+def _negotiate(settings: Dict[str, Any]) -> Optional[str]:
+    available = ['gzip']
+    if brotli is not None and settings.get('brotli', True):
+        available.insert(0, 'br')
+    return request.accept_encodings.best_match(available)
+
+
+def _weaken_etag(response) -> None:
+    # 압축 표현은 원본과 바이트가 다르므로 강한 ETag를 약한 ETag로 변경 (If-None-Match는 약한 비교)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def init_compression(app) -> None:
+    """
+    응답 압축 after_request 훅 등록 (설정: COMPRESSION)
+
+    Args:
+        app: Flask 앱
+    """
+    settings = app.config.get('COMPRESSION', {})
+    if not settings.get('enabled', True):
+        return
+
+    min_size = settings.get('min_size', 1024)
+    mimetypes = set(settings.get('mimetypes', DEFAULT_MIMETYPES))
+    cache = CompressedBodyCache(settings.get('cache_max_bytes', 32 * 1024 * 1024))
+    app.extensions['compression_cache'] = cache
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in mimetypes
+                or 'no-transform' in response.headers.get('Cache-Control', '')):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = _negotiate(settings)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.response, encoding, settings)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+
+            # 데이터 버전 기반 약한 ETag는 버전에 넣지 않은 테이블의 변경을 반영하지 못하므로 본문 해시를 키로 사용
+            key = (encoding, hashlib.blake2b(data, digest_size=16).hexdigest())
+            body = cache.get(key)
+            if body is None:
+                body = compress_bytes(data, encoding, settings)
+                cache.put(key, body)
+            response.set_data(body)
+
+        response.headers['Content-Encoding'] = encoding
+        _weaken_etag(response)
+        return response
+
+    logger.info(f"응답 압축 활성화: {'br, gzip' if brotli is not None and settings.get('brotli', True) else 'gzip'} (최소 {min_size} bytes)")
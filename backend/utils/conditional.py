@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+조건부 응답(ETag / If-None-Match) 유틸리티
+데이터 버전(DataVersionService)으로 약한 ETag를 만들어, 클라이언트가 가진 버전과 같으면
+조회 쿼리를 실행하지 않고 304 Not Modified를 반환합니다.
+"""
+import functools
+import logging
+from typing import Callable, Iterable, Optional
+
+from flask import current_app, request
+
+from backend.services.data_version import DataVersionService
+
+logger = logging.getLogger(__name__)
+
+
+def versioned_etag(
+    table_name: str,
+    scope: Optional[Callable[..., Optional[str]]] = None,
+    extra_tables: Iterable[str] = ()
+) -> Callable:
+    """
+    데이터 버전 기반 조건부 응답 데코레이터 (read_only_transaction 안쪽에 적용)
+
+    버전은 조회 전에 읽으므로, 조회 도중 데이터가 바뀌면 새 데이터에 이전 ETag가 붙습니다.
+    이 경우 다음 요청에서 버전이 달라 다시 조회하게 되므로 오래된 응답이 고정되지는 않습니다.
+
+    Args:
+        table_name (str): 버전을 확인할 테이블명 (DataVersionService.STOCK_LIST / TRADING)
+        scope (Optional[Callable]): 뷰 인자를 받아 종목 코드를 반환하는 함수 (None을 반환하면 테이블 전체 버전)
+        extra_tables (Iterable[str]): 응답에 함께 반영되는 다른 테이블 (테이블 전체 버전을 ETag에 추가)
+
+    Returns:
+        Callable: 데코레이터
+    """
+    extra_tables = tuple(extra_tables)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stock_code = scope(**kwargs) if scope else None
+            try:
+                version = DataVersionService.get_version(table_name, stock_code)
+                extra_versions = [DataVersionService.get_version(extra) for extra in extra_tables]
+            except Exception as e:
+                logger.warning(f"데이터 버전 조회 실패, 조건부 응답 생략: {func.__name__} - {e}")
+                return func(*args, **kwargs)
+
+            etag = f'{table_name}:{stock_code or "*"}:{version}'
+            for extra, extra_version in zip(extra_tables, extra_versions):
+                etag += f'+{extra}:{extra_version}'
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            # 캐시는 보관하되 매번 재검증 (304는 쿼리 없이 응답)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+
+        return wrapper
+    return decorator
+
+
+def query_stock_code(**_kwargs) -> Optional[str]:
+    """stock_code 쿼리 파라미터를 버전 범위로 사용 (없으면 테이블 전체)"""
+    return request.args.get('stock_code', '').strip() or None
+
+
+def path_stock_code(stock_code: str = None, **_kwargs) -> Optional[str]:
+    """URL 경로의 stock_code를 버전 범위로 사용"""
+    return (stock_code or '').strip() or None
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 로깅 유틸리티
+backend 패키지 로거의 레코드를 QueueHandler로 받아 별도 리스너 스레드에서
+system_log 테이블에 일괄 저장합니다.
+
+로깅 호출 스레드는 큐에 넣기만 하므로 수집 루프 등 호출 경로에 DB 지연이 더해지지 않습니다.
+WARNING 이상은 모두, INFO는 샘플링 비율만큼 저장하며 카테고리별 분당 저장 건수를 제한합니다.
+"""
+import atexit
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 로거 이름 접두사 -> system_log 카테고리 (먼저 일치하는 항목 사용)
+CATEGORY_PREFIXES = (
+    ('backend.services.data_collector', 'COLLECTOR'),
+    ('backend.services.gap_analyzer', 'COLLECTOR'),
+    ('backend.services.trading_spool', 'COLLECTOR'),
+    ('backend.services.investor_flow_importer', 'COLLECTOR'),
+    ('backend.views.data_collector', 'COLLECTOR'),
+    ('backend.utils.transaction', 'DATABASE'),
+    ('backend.services.digest_service', 'DATABASE'),
+    ('backend.views', 'API'),
+    ('backend.services', 'SERVICE'),
+)
+DEFAULT_CATEGORY = 'SYSTEM'
+
+# 자기 자신의 저장 경로에서 발생하는 로그는 다시 저장하지 않음 (재귀 방지)
+EXCLUDED_LOGGERS = ('backend.utils.db_logging', 'backend.services.audit_writer')
+
+
+class DatabaseLogHandler(logging.Handler):
+    """
+    로그 레코드를 system_log 행으로 변환하여 감사 로그 기록기에 전달하는 핸들러
+
+    QueueListener 스레드에서 호출되며, 실제 INSERT는 AuditWriter가 다중 행으로 묶어 수행합니다.
+    AuditWriter가 비활성화되어 있으면 리스너 스레드에서 직접(동기) 저장합니다.
+    """
+
+    def __init__(
+        self,
+        info_sample_rate: float = 0.0,
+        rate_limits: Optional[Dict[str, int]] = None,
+        default_rate_limit: int = 60,
+        app=None
+    ):
+        super().__init__(level=logging.INFO)
+        self.app = app
+        self.info_sample_rate = info_sample_rate
+        self.rate_limits = rate_limits or {}
+        self.default_rate_limit = default_rate_limit
+
+        # 카테고리별 [윈도우 시작 시각, 저장 건수, 생략 건수]
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def category_for(logger_name: str) -> str:
+        """로거 이름으로 system_log 카테고리 결정"""
+        for prefix, category in CATEGORY_PREFIXES:
+            if logger_name == prefix or logger_name.startswith(prefix + '.'):
+                return category
+        return DEFAULT_CATEGORY
+
+    def _allow(self, category: str) -> Optional[int]:
+        """
+        분당 저장 건수 제한 확인 (고정 윈도우)
+
+        Returns:
+            Optional[int]: 허용 시 직전 윈도우에서 생략된 건수 (0 이상), 제한 초과 시 None
+        """
+        limit = self.rate_limits.get(category, self.default_rate_limit)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(category)
+            if window is None or now - window[0] >= 60:
+                suppressed = window[2] if window else 0
+                self._windows[category] = [now, 1, 0]
+                return suppressed
+            if window[1] >= limit:
+                window[2] += 1
+                return None
+            window[1] += 1
+            return 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.name.startswith(EXCLUDED_LOGGERS):
+            return
+        if record.levelno < logging.WARNING:
+            if self.info_sample_rate <= 0 or random.random() >= self.info_sample_rate:
+                return
+
+        category = self.category_for(record.name)
+        suppressed = self._allow(category)
+        if suppressed is None:
+            return
+
+        try:
+            rows = []
+            if suppressed:
+                rows.append(self._values(
+                    'WARNING', category,
+                    f'로그 저장 건수 제한으로 직전 1분간 {suppressed}건의 로그를 생략했습니다.',
+                    None
+                ))
+
+            details = json.dumps({
+                'logger': record.name,
+                'module': record.module,
+                'function': record.funcName,
+                'line': record.lineno,
+                'sampled': record.levelno < logging.WARNING
+            }, ensure_ascii=False)
+            rows.append(self._values(record.levelname, category, record.getMessage(), details))
+            self._store(rows)
+        except Exception:
+            self.handleError(record)
+
+    def _store(self, rows: List[Dict[str, Any]]) -> None:
+        """감사 로그 기록기에 전달 (비활성화 상태면 리스너 스레드의 세션으로 직접 저장)"""
+        from backend.extensions import db
+        from backend.models.history import SystemLog
+        from backend.services.audit_writer import audit_writer
+        from backend.services.history_rollup import HistoryRollupService
+
+        if audit_writer.enabled:
+            for values in rows:
+                audit_writer.submit(SystemLog, values)
+            return
+        if self.app is None:
+            return
+
+        with self.app.app_context():
+            try:
+                db.session.execute(SystemLog.__table__.insert(), rows)
+                HistoryRollupService.increment(HistoryRollupService.count_batch([(SystemLog, values) for values in rows]))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+    @staticmethod
+    def _values(level: str, category: str, message: str, details: Optional[str]) -> Dict[str, Any]:
+        """system_log 행 값 생성"""
+        return {
+            'level': level,
+            'category': category,
+            'message': message,
+            'details': details,
+            'user_id': None,
+            'ip_address': None,
+            'created_at': datetime.utcnow()
+        }
+
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_database_logging(app) -> Optional[QueueListener]:
+    """
+    backend 로거에 QueueHandler를 연결하고 system_log 저장 리스너를 시작
+
+    Args:
+        app: Flask 애플리케이션 객체 (설정 DB_LOGGING 사용)
+
+    Returns:
+        Optional[QueueListener]: 시작된 리스너 (비활성화 시 None)
+    """
+    global _listener
+
+    settings = app.config.get('DB_LOGGING', {})
+    if not settings.get('enabled', True) or _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(maxsize=settings.get('queue_size', 10000))
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    db_handler = DatabaseLogHandler(
+        info_sample_rate=settings.get('info_sample_rate', 0.0),
+        rate_limits=settings.get('rate_limits', {}),
+        default_rate_limit=settings.get('default_rate_limit', 60),
+        app=app
+    )
+
+    base_logger = logging.getLogger('backend')
+    min_level = logging.INFO if db_handler.info_sample_rate > 0 else logging.WARNING
+    queue_handler.setLevel(min_level)
+    if base_logger.level == logging.NOTSET or base_logger.level > min_level:
+        base_logger.setLevel(min_level)
+    base_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, db_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logger.info("데이터베이스 로깅 시작")
+    return _listener
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 레코드를 버리는 QueueHandler (호출 스레드를 막지 않음)"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+시계열 다운샘플링 유틸리티
+긴 기간의 차트 데이터를 max_points개 이하로 줄이기 위한 LTTB(Largest-Triangle-Three-Buckets) 구현입니다.
+평균을 내는 대신 실제 데이터 점을 골라내므로 고점/저점 같은 시각적 특징이 유지됩니다.
+"""
+from datetime import date
+from typing import List, Optional, Sequence
+
+
+def date_axis(trade_dates: Sequence[str]) -> List[int]:
+    """
+    'YYYY-MM-DD' 날짜 목록을 LTTB용 숫자 x축(일 단위 서수)으로 변환
+
+    Args:
+        trade_dates (Sequence[str]): 거래 날짜 목록
+
+    Returns:
+        List[int]: date.toordinal() 값 목록
+    """
+    return [date.fromisoformat(trade_date).toordinal() for trade_date in trade_dates]
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[Optional[float]], threshold: int) -> List[int]:
+    """
+    LTTB로 남길 점의 인덱스 선택
+
+    첫 점과 마지막 점은 항상 포함하고, 나머지 구간마다 이전 선택 점·다음 구간 평균점과
+    이루는 삼각형 넓이가 가장 큰 점을 하나씩 고릅니다.
+
+    Args:
+        xs (Sequence[float]): x 값 (오름차순)
+        ys (Sequence[Optional[float]]): y 값 (None은 직전 값으로 대체)
+        threshold (int): 남길 점의 수
+
+    Returns:
+        List[int]: 선택된 인덱스 (오름차순, 점 수가 threshold 이하이면 전체)
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    filled = []
+    previous = 0.0
+    for y in ys:
+        previous = float(y) if y is not None else previous
+        filled.append(previous)
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / span
+        avg_y = sum(filled[avg_start:avg_end]) / span
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax, ay = xs[a], filled[a]
+        best, best_area = range_start, -1.0
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (filled[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
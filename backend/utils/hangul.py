@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+한글 검색 유틸리티
+검색어 / 주식명 정규화, 초성 추출, 트라이그램 생성 함수를 제공합니다.
+"""
+from typing import Set
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 초성 19자 (호환용 자모)
+CHOSUNG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+)
+CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+def normalize(text: str) -> str:
+    """
+    검색용 정규화 (소문자 변환, 공백 제거)
+
+    Args:
+        text (str): 원본 문자열
+
+    Returns:
+        str: 정규화된 문자열 (예: 'SK 하이닉스' -> 'sk하이닉스')
+    """
+    return ''.join((text or '').lower().split())
+
+
+def chosung(text: str) -> str:
+    """
+    완성형 한글을 초성으로 변환 (한글이 아닌 문자는 그대로 유지)
+
+    Args:
+        text (str): 정규화된 문자열
+
+    Returns:
+        str: 초성 문자열 (예: '삼성전자' -> 'ㅅㅅㅈㅈ')
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSUNG[(code - HANGUL_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def is_chosung_query(text: str) -> bool:
+    """검색어에 초성(자음만 입력한 글자)이 포함되어 있는지 여부"""
+    return any(char in CHOSUNG_SET for char in text)
+
+
+def trigrams(text: str, padded: bool = True) -> Set[str]:
+    """
+    트라이그램 집합 (pg_trgm과 같이 앞 2칸, 뒤 1칸 공백으로 채워 짧은 문자열도 비교 가능)
+
+    Args:
+        text (str): 정규화된 문자열
+        padded (bool): 앞뒤 공백 채움 여부 (부분 문자열 후보 검색에는 False)
+
+    Returns:
+        Set[str]: 트라이그램 집합
+    """
+    if padded:
+        text = f'  {text} '
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+def similarity(left: Set[str], right: Set[str]) -> float:
+    """두 트라이그램 집합의 유사도 (자카드 계수, 0~1)"""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+고성능 JSON 프로바이더
+jsonify / request.get_json이 사용하는 Flask JSON 프로바이더를 교체합니다.
+orjson 패키지가 설치되어 있으면 orjson으로, 없으면 표준 json 모듈로 인코딩합니다 (선택 의존성).
+
+기본 프로바이더와의 차이:
+    - 키 정렬을 하지 않음 (sort_keys=False, 딕셔너리 순서 유지)
+    - 비 ASCII 문자를 이스케이프하지 않고 UTF-8 그대로 출력
+    - datetime / date는 ISO 8601 문자열 (모델 to_dict()와 같은 형식)
+    - SQLAlchemy Row 튜플은 딕셔너리 변환 없이 바로 객체로 인코딩
+"""
+import dataclasses
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from flask.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+JSON_BACKENDS = ('auto', 'orjson', 'json')
+
+
+def _default(o: Any) -> Any:
+    """기본 인코더가 처리하지 못하는 객체 변환"""
+    mapping = getattr(o, '_mapping', None)
+    if mapping is not None:
+        # SQLAlchemy Row (sparse fieldset 등 with_entities 결과)
+        return dict(mapping)
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, UUID):
+        return str(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if hasattr(o, 'to_dict'):
+        return o.to_dict()
+    if hasattr(o, 'item'):
+        # numpy / pandas 스칼라
+        return o.item()
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj: Any, indent: bool = False) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    if indent:
+        return json.dumps(obj, default=_default, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_bytes(obj: Any, backend: str = 'auto', indent: bool = False) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 인코딩 (Flask 앱 컨텍스트 없이도 사용 가능)
+
+    Args:
+        obj (Any): 인코딩할 객체
+        backend (str): auto (orjson이 있으면 사용), orjson, json
+        indent (bool): 들여쓰기 여부
+
+    Returns:
+        bytes: JSON 바이트
+    """
+    if orjson is not None and backend != 'json':
+        return _orjson_dumps(obj, indent)
+    return _json_dumps(obj, indent)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON 프로바이더 (orjson이 없으면 표준 json 사용)"""
+
+    sort_keys = False
+    ensure_ascii = False
+    backend = 'auto'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # json.dumps 인자를 직접 지정한 호출은 표준 동작 유지
+            kwargs.setdefault('default', _default)
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj, self.backend).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if orjson is not None and self.backend != 'json' and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # 문자열을 거치지 않고 바이트를 바로 응답 본문으로 사용
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(dumps_bytes(obj, self.backend, indent) + b'\n', mimetype=self.mimetype)
+
+
+def init_json_provider(app) -> None:
+    """
+    설정(JSON_PROVIDER)에 따라 앱의 JSON 프로바이더 교체
+
+    Args:
+        app: Flask 앱
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+        ImportError: orjson을 지정했지만 설치되지 않은 경우
+    """
+    backend = app.config.get('JSON_PROVIDER', 'auto')
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"지원하지 않는 JSON 프로바이더입니다: {backend} ({', '.join(JSON_BACKENDS)})")
+    if backend == 'orjson' and orjson is None:
+        raise ImportError("JSON_PROVIDER=orjson을 사용하려면 orjson 패키지가 필요합니다. (pip install orjson)")
+
+    provider = FastJSONProvider(app)
+    provider.backend = backend
+    app.json = provider
+    logger.info(f"JSON 프로바이더: {'orjson' if orjson is not None and backend != 'json' else 'json'}")
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+키셋(커서) 페이지네이션 유틸리티
+OFFSET 대신 정렬 키 값을 기준으로 다음/이전 페이지를 조회합니다.
+깊은 페이지도 인덱스 범위 검색으로 일정한 시간에 조회되며, 조회 중 새 행이 추가되어도
+페이지 경계가 밀리지 않습니다.
+
+커서는 정렬 키 값과 방향을 담은 JSON을 URL-safe base64로 인코딩한 불투명 토큰입니다.
+"""
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+logger = logging.getLogger(__name__)
+
+NEXT = 'next'
+PREV = 'prev'
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], direction: str = NEXT) -> str:
+    """
+    정렬 키 값과 방향을 커서 토큰으로 인코딩
+
+    Args:
+        values (Sequence[Any]): 정렬 키 값 (정렬 컬럼 순서)
+        direction (str): next 또는 prev
+
+    Returns:
+        str: 커서 토큰
+    """
+    payload = json.dumps({'k': [_encode_value(v) for v in values], 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str, key_count: int) -> Tuple[List[Any], str]:
+    """
+    커서 토큰 디코딩
+
+    Args:
+        token (str): 커서 토큰
+        key_count (int): 정렬 키 개수
+
+    Returns:
+        Tuple[List[Any], str]: (정렬 키 값, 방향)
+
+    Raises:
+        ValueError: 잘못된 커서인 경우
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        values = [_decode_value(v) for v in payload['k']]
+        direction = payload.get('d', NEXT)
+    except Exception as e:
+        raise ValueError(f'잘못된 커서입니다: {token}') from e
+
+    if len(values) != key_count or direction not in (NEXT, PREV):
+        raise ValueError(f'잘못된 커서입니다: {token}')
+    return values, direction
+
+
+def estimate_row_count(query) -> Optional[int]:
+    """
+    PostgreSQL 실행 계획의 예상 행 수로 전체 건수 추정 (COUNT(*) 없이 통계 기반으로 즉시 계산)
+
+    Args:
+        query: 필터가 적용된 SQLAlchemy 쿼리
+
+    Returns:
+        Optional[int]: 예상 행 수 (추정 실패 시 None)
+    """
+    session = query.session
+    try:
+        sql = str(query.statement.compile(dialect=session.get_bind().dialect, compile_kwargs={'literal_binds': True}))
+        # 추정 실패가 호출자의 트랜잭션을 중단시키지 않도록 세이브포인트 안에서 실행
+        with session.begin_nested():
+            plan = session.connection().exec_driver_sql(f'EXPLAIN (FORMAT JSON) {sql}').scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception as e:
+        logger.warning(f"예상 행 수 조회 실패: {e}")
+        return None
+
+
+@dataclass
+class KeysetPage:
+    """키셋 페이지 조회 결과"""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
+
+
+class KeysetPaginator:
+    """
+    정렬 컬럼 목록 기준 키셋 페이지네이터
+
+    모든 정렬 컬럼은 같은 방향(descending)으로 정렬하며, 마지막 컬럼은 고유해야 합니다 (예: id).
+    """
+
+    def __init__(self, columns: Sequence, descending: bool = True):
+        self.columns = list(columns)
+        self.descending = descending
+
+    def _key_of(self, item) -> List[Any]:
+        return [getattr(item, column.key) for column in self.columns]
+
+    def _order(self, reverse: bool):
+        descending = self.descending != reverse
+        return [column.desc() if descending else column.asc() for column in self.columns]
+
+    def _fetch_descending(self, direction: str) -> bool:
+        """해당 방향으로 조회할 때 내림차순 정렬 여부"""
+        return self.descending == (direction == NEXT)
+
+    def page(self, query, cursor: Optional[str], limit: int,
+             supplement: Optional[Callable[[Optional[List[Any]], str, bool, int], List[Any]]] = None) -> KeysetPage:
+        """
+        한 페이지 조회
+
+        Args:
+            query: 필터가 적용된 SQLAlchemy 쿼리 (정렬 없이)
+            cursor (Optional[str]): 커서 토큰 (없으면 첫 페이지)
+            limit (int): 페이지 크기
+            supplement (Optional[Callable]): DB 밖(예: 아카이브)의 추가 후보 항목을 돌려주는 함수.
+                (커서 키 값, 방향, DB 조회만으로 limit을 넘었는지, 필요한 항목 수)를 받으며, 반환된 항목은
+                커서 조건으로 걸러진 뒤 DB 결과와 정렬 병합됩니다.
+
+        Returns:
+            KeysetPage: 항목 목록과 다음/이전 페이지 커서
+
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        direction = NEXT
+        values = None
+        if cursor:
+            values, direction = decode_cursor(cursor, len(self.columns))
+            key = tuple_(*self.columns)
+            # next: 정렬 방향으로 커서 다음 행, prev: 반대 방향으로 커서 이전 행
+            query = query.filter(key < tuple(values) if self._fetch_descending(direction) else key > tuple(values))
+
+        descending = self._fetch_descending(direction)
+        rows = query.order_by(*self._order(reverse=direction == PREV)).limit(limit + 1).all()
+        if supplement is not None:
+            extra = supplement(values, direction, len(rows) > limit, limit + 1)
+            if extra:
+                if values is not None:
+                    extra = [item for item in extra
+                             if (self._key_of(item) < values if descending else self._key_of(item) > values)]
+                rows = sorted(rows + extra, key=self._key_of, reverse=descending)[:limit + 1]
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == PREV:
+            rows.reverse()
+
+        result = KeysetPage(items=rows)
+        if not rows:
+            return result
+
+        if direction == NEXT:
+            if has_more:
+                result.next_cursor = encode_cursor(self._key_of(rows[-1]), NEXT)
+            if cursor:
+                result.prev_cursor = encode_cursor(self._key_of(rows[0]), PREV)
+        else:
+            result.next_cursor = encode_cursor(self._key_of(rows[-1]), NEXT)
+            if has_more:
+                result.prev_cursor = encode_cursor(self._key_of(rows[0]), PREV)
+        return result
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+희소 필드셋(sparse fieldset) 유틸리티
+요청의 fields 파라미터(fields=trade_date,close_price)를 SQL 프로젝션으로 내려보내고,
+ORM 객체 대신 Row 튜플을 그대로 직렬화합니다.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def parse_fields(raw: Optional[str], model) -> Optional[List[str]]:
+    """
+    fields 파라미터 파싱 및 검증
+
+    Args:
+        raw (Optional[str]): 콤마로 구분된 필드명 (없거나 빈 값이면 전체 필드)
+        model: 대상 SQLAlchemy 모델 클래스
+
+    Returns:
+        Optional[List[str]]: 요청 순서를 유지한 필드명 목록 (전체 필드면 None)
+
+    Raises:
+        ValueError: 모델에 없는 필드가 포함된 경우
+    """
+    if not raw or not raw.strip():
+        return None
+
+    names = list(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+    available = [column.name for column in model.__table__.columns]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(available)})")
+    return names or None
+
+
+def project(query, model, fields: Optional[Sequence[str]], required: Sequence[str] = ()):
+    """
+    쿼리에 필드 프로젝션 적용 (fields가 없으면 그대로 반환)
+
+    Args:
+        query: SQLAlchemy 쿼리
+        model: 대상 모델 클래스
+        fields (Optional[Sequence[str]]): 선택할 필드명
+        required (Sequence[str]): 정렬·페이지 커서 등 내부적으로 필요한 추가 필드명
+
+    Returns:
+        쿼리 (fields가 있으면 Row 튜플을 반환하는 쿼리)
+    """
+    if not fields:
+        return query
+    names = list(dict.fromkeys([*fields, *required]))
+    return query.with_entities(*[getattr(model, name) for name in names])
+
+
+def serialize(item: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    ORM 객체 또는 Row 튜플을 딕셔너리로 변환
+
+    Args:
+        item: 모델 인스턴스, Row 또는 딕셔너리 (결과 캐시에서 읽은 행)
+        fields (Optional[Sequence[str]]): 응답에 포함할 필드명 (없으면 전체)
+
+    Returns:
+        Dict[str, Any]: 응답용 딕셔너리
+    """
+    if isinstance(item, dict):
+        return {name: item.get(name) for name in fields} if fields else item
+    if fields:
+        return {name: getattr(item, name) for name in fields}
+    if hasattr(item, 'to_dict'):
+        return item.to_dict()
+    return dict(item._mapping)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+동일 조회 합치기(single-flight) 유틸리티
+같은 인자로 동시에 들어온 조회는 먼저 들어온 요청(리더) 하나만 DB를 조회하고,
+나머지 요청(대기자)은 그 결과를 함께 사용합니다. 수집 완료 직후 대시보드가 한꺼번에
+새로고침할 때 같은 쿼리가 연결 풀(기본 5 + 10)을 모두 차지하는 것을 막습니다.
+
+    - 결과는 스레드 간에 공유되므로 ORM 객체 / Row 대신 딕셔너리 목록으로 바꿔 반환합니다. (읽기 전용으로 사용)
+    - 리더에서 예외가 나면 대기자에게도 같은 예외를 전달합니다.
+    - 대기자는 read_only_transaction 안이면 기다리기 전에 세션 연결을 풀에 반납합니다.
+    - wait_timeout 안에 리더가 끝나지 않으면 대기자가 직접 조회합니다.
+"""
+import functools
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from flask import current_app, has_app_context
+
+from backend.extensions import db
+from backend.utils.projection import serialize
+from backend.utils.transaction import READ_ONLY_KEY
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """
+    함수 인자를 이름 기준 딕셔너리로 정규화 (기본값 채움, 문자열 앞뒤 공백 제거)
+
+    Args:
+        signature (inspect.Signature): 함수 시그니처
+        args (tuple): 위치 인자
+        kwargs (dict): 키워드 인자
+
+    Returns:
+        Dict[str, Any]: 인자명 -> 정규화된 값
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return {name: _normalize(value) for name, value in bound.arguments.items()}
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def to_plain(result: Any) -> Any:
+    """ORM 객체 / Row 목록을 세션과 무관한 딕셔너리 목록으로 변환 (목록이 아니면 그대로 반환)"""
+    if isinstance(result, list):
+        return [item if isinstance(item, dict) else serialize(item) for item in result]
+    return result
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    return value
+
+
+class _Call:
+    """진행 중인 조회 하나 (리더가 결과 또는 예외를 채우고 done을 설정)"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별로 동시에 진행 중인 조회를 하나로 합치는 실행기 (스레드 안전)"""
+
+    DEFAULT_WAIT_TIMEOUT = 30
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {'leaders': 0, 'shared': 0, 'timeouts': 0}
+
+    @staticmethod
+    def _settings() -> Dict[str, Any]:
+        if has_app_context():
+            return current_app.config.get('SINGLE_FLIGHT', {})
+        return {}
+
+    def do(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        같은 키로 진행 중인 조회가 있으면 그 결과를 기다리고, 없으면 직접 조회
+
+        Args:
+            key (Hashable): 조회 키 (함수와 정규화된 인자)
+            loader (Callable): 조회 함수 (결과는 여러 스레드에서 함께 읽으므로 세션과 무관한 값이어야 함)
+
+        Returns:
+            Any: 조회 결과
+        """
+        settings = self._settings()
+        if not settings.get('enabled', True):
+            return loader()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['leaders'] += 1
+            else:
+                call.waiters += 1
+
+        if leader:
+            try:
+                call.result = loader()
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+                if call.waiters:
+                    logger.debug(f"동일 조회 {call.waiters}건 합침: {key[0] if isinstance(key, tuple) else key}")
+            return call.result
+
+        self._release_connection()
+        if not call.done.wait(settings.get('wait_timeout', self.DEFAULT_WAIT_TIMEOUT)):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            logger.warning(f"동일 조회 대기 시간 초과, 직접 조회: {key[0] if isinstance(key, tuple) else key}")
+            return loader()
+
+        with self._lock:
+            self._stats['shared'] += 1
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    @staticmethod
+    def _release_connection() -> None:
+        # 읽기 전용 요청은 기다리는 동안 연결을 잡고 있을 필요가 없음 (다음 쿼리에서 다시 가져옴)
+        if has_app_context() and db.session.info.get(READ_ONLY_KEY):
+            db.session.rollback()
+
+    def coalesce(self, func: Callable) -> Callable:
+        """
+        조회 함수 데코레이터 (@staticmethod 아래에 적용, 결과는 딕셔너리 목록으로 반환)
+
+        Args:
+            func (Callable): 조회 함수
+
+        Returns:
+            Callable: 같은 인자의 동시 호출을 합치는 함수
+        """
+        signature = inspect.signature(func)
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, _freeze(normalize_arguments(signature, args, kwargs)))
+            return self.do(key, lambda: to_plain(func(*args, **kwargs)))
+
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        조회 합치기 지표 (프로세스 기준)
+
+        Returns:
+            Dict[str, Any]: 진행 중 조회 수, 리더 / 결과 공유 / 대기 시간 초과 횟수
+        """
+        with self._lock:
+            return {'in_flight': len(self._calls), **self._stats}
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 JSON 응답 유틸리티
+대용량 조회 결과를 한 번에 직렬화하지 않고, 행 단위로 인코딩하여 청크 전송합니다.
+서버 측 커서(yield_per)와 함께 사용하면 결과 크기와 무관하게 워커 메모리가 일정하게 유지됩니다.
+
+지원 형식:
+    json: 청크 단위로 전송되는 JSON 배열 ([{...},{...}])
+    ndjson: 한 줄에 하나의 JSON 객체 (application/x-ndjson)
+"""
+import logging
+from typing import Any, Dict, Iterable, Iterator
+
+from flask import Response, stream_with_context
+
+from backend.utils.json_provider import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMATS = ('json', 'ndjson')
+CHUNK_SIZE = 64 * 1024  # 전송 청크 크기 (바이트)
+
+_MIMETYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _json_array(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    yield b'['
+    first = True
+    for row in rows:
+        yield dumps_bytes(row) if first else b',' + dumps_bytes(row)
+        first = False
+    yield b']'
+
+
+def _ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    for row in rows:
+        yield dumps_bytes(row) + b'\n'
+
+
+def _chunked(pieces: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """작은 조각들을 chunk_size 바이트 단위로 묶어 전송 횟수 줄이기"""
+    buffer = []
+    size = 0
+    for data in pieces:
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def stream_response(rows: Iterable[Dict[str, Any]], fmt: str = 'json', chunk_size: int = CHUNK_SIZE) -> Response:
+    """
+    행 이터러블을 스트리밍 응답으로 변환
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): 응답할 행 (딕셔너리) 이터러블
+        fmt (str): json 또는 ndjson
+        chunk_size (int): 전송 청크 크기 (바이트)
+
+    Returns:
+        Response: 청크 전송 응답 (요청 컨텍스트를 유지하므로 DB 세션이 스트리밍 종료까지 열려 있음)
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"지원하지 않는 스트리밍 형식입니다: {fmt} ({', '.join(STREAM_FORMATS)})")
+
+    pieces = _json_array(rows) if fmt == 'json' else _ndjson(rows)
+
+    def generate():
+        try:
+            yield from _chunked(pieces, chunk_size)
+        except Exception as e:
+            # 헤더가 이미 전송되어 상태 코드를 바꿀 수 없으므로 로그를 남기고 응답을 끊음
+            logger.error(f"스트리밍 응답 중 오류: {e}")
+            raise
+
+    response = Response(stream_with_context(generate()), mimetype=_MIMETYPES[fmt])
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
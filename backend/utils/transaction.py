@@ -14,6 +14,9 @@ from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
+# read_only_transaction 안에서 실행 중임을 표시하는 세션 info 키 (연결을 먼저 반납해도 되는지 판단용)
+READ_ONLY_KEY = 'read_only'
+
 def transactional(func: Callable) -> Callable:
     """
     트랜잭션을 관리하는 데코레이터
@@ -156,7 +159,11 @@ def read_only_transaction(func: Callable) -> Callable:
                     db.session.remove()
                     time.sleep(1)
                 
-                result = func(*args, **kwargs)
+                db.session.info[READ_ONLY_KEY] = True
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    db.session.info.pop(READ_ONLY_KEY, None)
                 return result
                 
             except OperationalError as e:
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+워크로드 격리 유틸리티
+무거운 조회 엔드포인트에 리소스 클래스(Config.RESOURCE_CLASSES)를 지정해 연결 풀과 DB 시간을 나눠 씁니다.
+
+리소스 클래스마다:
+    - statement_timeout_ms: 요청 트랜잭션의 PostgreSQL statement_timeout (SET LOCAL, 초과 시 503)
+      요청 중 새로 시작되는 트랜잭션(조회 합치기의 연결 반납, read_only_transaction 등)에도 다시 적용
+    - max_concurrent: 동시에 실행할 수 있는 요청 수 (워커 프로세스 기준)
+    - max_queue: 실행 자리를 기다릴 수 있는 요청 수 (가득 차면 기다리지 않고 바로 503)
+    - queue_timeout: 대기 최대 시간 (초, 초과 시 503)
+    - retry_after: 503 응답의 Retry-After 값 (초)
+
+지정하지 않은 엔드포인트와 수집기의 쓰기는 제한을 받지 않으므로, 무거운 조회가 몰려도
+나머지 요청과 수집 저장이 쓸 연결이 남습니다.
+"""
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict
+
+from flask import current_app, g, has_request_context, jsonify
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.extensions import db
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL query_canceled (statement_timeout 초과)
+QUERY_CANCELED = '57014'
+
+# 요청 컨텍스트(g)에 리소스 클래스의 statement_timeout을 기록하는 속성명
+TIMEOUT_ATTR = 'resource_statement_timeout_ms'
+
+
+class _Gate:
+    """동시 실행 수와 대기열 길이를 제한하는 입장 제어 (스레드 안전)"""
+
+    def __init__(self, max_concurrent: int, max_queue: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.running = 0
+        self.waiting = 0
+        self.stats = {'admitted': 0, 'queued': 0, 'rejected': 0, 'timeouts': 0, 'statement_timeouts': 0}
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: float) -> bool:
+        with self._condition:
+            if self.running < self.max_concurrent:
+                self.running += 1
+                self.stats['admitted'] += 1
+                return True
+            if self.waiting >= self.max_queue:
+                self.stats['rejected'] += 1
+                return False
+
+            self.waiting += 1
+            self.stats['queued'] += 1
+            try:
+                admitted = self._condition.wait_for(lambda: self.running < self.max_concurrent, timeout)
+            finally:
+                self.waiting -= 1
+            if not admitted:
+                self.stats['timeouts'] += 1
+                return False
+            self.running += 1
+            self.stats['admitted'] += 1
+            return True
+
+    def release(self) -> None:
+        with self._condition:
+            self.running -= 1
+            self._condition.notify()
+
+    def count(self, name: str) -> None:
+        with self._condition:
+            self.stats[name] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._condition:
+            return {'running': self.running, 'waiting': self.waiting, **self.stats}
+
+
+class WorkloadManager:
+    """리소스 클래스별 입장 제어기 관리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._gates: Dict[str, _Gate] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Flask 앱 설정(RESOURCE_CLASSES) 검증 및 statement_timeout 감지 등록
+
+        Args:
+            app: Flask 애플리케이션 객체
+
+        Raises:
+            ValueError: 리소스 클래스 설정이 올바르지 않은 경우
+        """
+        for name, settings in app.config.get('RESOURCE_CLASSES', {}).items():
+            if settings.get('max_concurrent', 1) < 1 or settings.get('max_queue', 0) < 0:
+                raise ValueError(f"리소스 클래스 설정이 올바르지 않습니다: {name} (max_concurrent >= 1, max_queue >= 0)")
+        if not event.contains(Engine, 'handle_error', _on_db_error):
+            event.listen(Engine, 'handle_error', _on_db_error)
+        if not event.contains(Session, 'after_begin', _on_begin):
+            event.listen(Session, 'after_begin', _on_begin)
+        app.extensions['workload'] = self
+
+    def _gate(self, name: str, settings: Dict[str, Any]) -> _Gate:
+        with self._lock:
+            gate = self._gates.get(name)
+            if gate is None:
+                gate = self._gates[name] = _Gate(settings.get('max_concurrent', 1), settings.get('max_queue', 0))
+            return gate
+
+    def resource_class(self, name: str) -> Callable:
+        """
+        엔드포인트 리소스 클래스 지정 데코레이터 (route 바로 아래, 트랜잭션 데코레이터 바깥에 적용)
+
+        Args:
+            name (str): Config.RESOURCE_CLASSES의 클래스명
+
+        Returns:
+            Callable: 데코레이터
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                classes = current_app.config.get('RESOURCE_CLASSES', {})
+                if name not in classes:
+                    logger.warning(f"정의되지 않은 리소스 클래스, 제한 없이 실행: {name}")
+                    return func(*args, **kwargs)
+
+                settings = classes[name]
+                gate = self._gate(name, settings)
+                if not gate.acquire(settings.get('queue_timeout', 0)):
+                    logger.warning(f"요청 과다로 거절 ({name}): 실행 {gate.running}, 대기 {gate.waiting}")
+                    return _overloaded(name, settings, '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.', 'overloaded')
+
+                released = False
+                try:
+                    timeout_ms = settings.get('statement_timeout_ms')
+                    if timeout_ms:
+                        # 트랜잭션 단위로 적용되므로(커밋/롤백 시 복원) 이후 시작되는 트랜잭션은 after_begin에서 다시 적용
+                        setattr(g, TIMEOUT_ATTR, int(timeout_ms))
+                        if db.session.in_transaction():
+                            _apply_timeout(db.session.connection(), int(timeout_ms))
+
+                    response = current_app.make_response(func(*args, **kwargs))
+                    if response.status_code == 500 and g.pop('statement_timeout', False):
+                        gate.count('statement_timeouts')
+                        logger.warning(f"statement_timeout 초과 ({name}, {timeout_ms}ms)")
+                        return _overloaded(name, settings, '조회 시간이 제한을 초과했습니다. 조회 범위를 줄이거나 잠시 후 다시 시도해주세요.', 'statement_timeout')
+
+                    if response.is_streamed:
+                        # 스트리밍 응답은 전송이 끝날 때 자리를 반납
+                        response.call_on_close(gate.release)
+                        released = True
+                    return response
+                finally:
+                    if not released:
+                        g.pop(TIMEOUT_ATTR, None)
+                        gate.release()
+
+            return wrapper
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        리소스 클래스별 상태 (워커 프로세스 기준)
+
+        Returns:
+            Dict[str, Any]: 클래스명 -> 실행 / 대기 수, 입장 / 대기 / 거절 / 대기 시간 초과 / statement_timeout 횟수
+        """
+        with self._lock:
+            gates = dict(self._gates)
+        return {name: gate.snapshot() for name, gate in gates.items()}
+
+
+def _overloaded(name: str, settings: Dict[str, Any], message: str, error_type: str):
+    return jsonify({
+        'error': message,
+        'type': error_type,
+        'resource_class': name
+    }), 503, {'Retry-After': str(settings.get('retry_after', 1))}
+
+
+def _apply_timeout(connection, timeout_ms: int) -> None:
+    connection.execute(text("SELECT set_config('statement_timeout', :value, true)"), {'value': f'{timeout_ms}ms'})
+
+
+def _on_begin(session, transaction, connection) -> None:
+    # 리소스 클래스가 지정된 요청에서 시작되는 모든 트랜잭션에 statement_timeout 적용
+    if has_request_context():
+        timeout_ms = g.get(TIMEOUT_ATTR)
+        if timeout_ms:
+            _apply_timeout(connection, timeout_ms)
+
+
+def _on_db_error(context) -> None:
+    # 뷰가 예외를 500 응답으로 바꾸므로, statement_timeout 초과 여부를 요청 컨텍스트에 기록해 둠
+    if getattr(context.original_exception, 'pgcode', None) == QUERY_CANCELED and has_request_context():
+        g.statement_timeout = True
+
+
+workload = WorkloadManager()
@@ -67,6 +67,7 @@ def restore_backup():
         from backend.models.sample import Sample
         from backend.models.trading import StockInvestorTrading
         from backend.models.user import User
+        from backend.services.digest_service import DigestService
         
         if not test_session_state['backup_data']:
             logger.warning("복원할 백업 데이터가 없습니다.")
@@ -76,6 +77,7 @@ def restore_backup():
         
         # 현재 데이터 삭제
         StockInvestorTrading.query.delete()
+        DigestService.delete_digests()
         StockList.query.delete()
         Sample.query.delete()
         User.query.delete()
@@ -97,7 +99,12 @@ def restore_backup():
             user = User(**user_data)
             db.session.add(user)
         
+        from backend.services.data_version import DataVersionService
+        from backend.services.stock_cache import stock_cache
+        DataVersionService.bump_all_stocks(DataVersionService.TRADING)
+        DataVersionService.bump_all_stocks(DataVersionService.STOCK_LIST)
         db.session.commit()
+        stock_cache.invalidate()
         
         # 테스트 모드 해제
         test_session_state['is_test_mode'] = False
@@ -522,17 +529,24 @@ def reset_database():
         from backend.models.sample import Sample
         from backend.models.trading import StockInvestorTrading
         from backend.models.user import User
+        from backend.services.digest_service import DigestService
         
         # 삭제 전 거래 데이터 개수 확인
         trading_count = StockInvestorTrading.query.count()
         
         # 모든 데이터 삭제
         StockInvestorTrading.query.delete()
+        DigestService.delete_digests()
         StockList.query.delete()
         Sample.query.delete()
         User.query.delete()
         
+        from backend.services.data_version import DataVersionService
+        from backend.services.stock_cache import stock_cache
+        DataVersionService.bump_all_stocks(DataVersionService.TRADING)
+        DataVersionService.bump_all_stocks(DataVersionService.STOCK_LIST)
         db.session.commit()
+        stock_cache.invalidate()
         
         # 히스토리 로깅 (거래 데이터가 있었던 경우에만)
         if trading_count > 0:
@@ -9,9 +9,13 @@ import logging
 import time
 from backend.extensions import executor
 from backend.services.data_collector import DataCollectorService
+from backend.services.gap_analyzer import GapAnalyzer
+from backend.services.digest_service import DigestService
+from backend.services.trading_spool import get_spool
 from backend.models.stock import StockList
 from backend.services.stock_service import StockService
 from backend.utils.transaction import safe_transaction, read_only_transaction
+from backend.utils.cancellation import CancellationToken, OperationCancelled
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -37,9 +41,14 @@ collection_status = {
     'batches_processed': 0,
     'memory_cleanups': 0,
     'current_batch': 0,
-    'total_batches': 0
+    'total_batches': 0,
+    'gap_fill_results': [],  # 누락 구간 보충 종목별 결과
+    'cancelled_stock': None  # 중단 시 처리 중이던 종목 (실패로 집계하지 않음)
 }
 
+# 진행 중인 수집 작업의 취소 토큰
+collection_token = None
+
 def update_progress(phase, current_stock='', progress=0, success=0, failed=0, error_msg='', failed_stock=None):
     """진행률 업데이트 헬퍼 함수"""
     global collection_status
@@ -68,9 +77,10 @@ def update_progress(phase, current_stock='', progress=0, success=0, failed=0, er
     logger.info(f"진행률 업데이트: {phase} - {current_stock} ({progress}%)")
 
 @executor.job
-def collect_data_background(years: int = 3, max_pages: int = 10):
+def collect_data_background(years: int = 3, max_pages: int = 10, cancel_token: CancellationToken = None):
     """Flask-Executor를 사용한 백그라운드 데이터 수집"""
-    global collection_status
+    global collection_status, collection_token
+    cancel_token = cancel_token or CancellationToken()
     
     try:
         collection_status['is_running'] = True
@@ -104,7 +114,7 @@ def collect_data_background(years: int = 3, max_pages: int = 10):
         progress = 0  # 초기값 설정
         
         for i, stock in enumerate(stocks):
-            if not collection_status['is_running']:  # 중단 요청 확인
+            if not collection_status['is_running'] or cancel_token.is_cancelled:  # 중단 요청 확인
                 logger.info("데이터 수집이 사용자에 의해 중단되었습니다")
                 break
             
@@ -115,7 +125,7 @@ def collect_data_background(years: int = 3, max_pages: int = 10):
                               progress, success_count, failed_count)
                 
                 success = DataCollectorService.collect_and_save_trading_data(
-                    stock.stock_code, stock.stock_name, years, max_pages
+                    stock.stock_code, stock.stock_name, years, max_pages, cancel_token
                 )
                 
                 if success:
@@ -126,8 +136,15 @@ def collect_data_background(years: int = 3, max_pages: int = 10):
                                   progress, success_count, failed_count, 
                                   failed_stock=f"{stock.stock_code} {stock.stock_name}")
                 
-                # 요청 간 대기
-                time.sleep(DataCollectorService.REQUEST_DELAY)
+                # 요청 간 대기 (중단 요청 시 즉시 깨어남)
+                cancel_token.wait(DataCollectorService.REQUEST_DELAY)
+                
+            except OperationCancelled:
+                # 처리 중이던 종목은 실패가 아닌 취소로 보고 (폐기 정책이면 저장하지 않음)
+                logger.info(f"데이터 수집이 {stock.stock_code} 처리 중 중단되었습니다 (정책: {cancel_token.policy})")
+                collection_status['cancelled_stock'] = f"{stock.stock_code} {stock.stock_name}"
+                collection_status['is_running'] = False
+                break
                 
             except Exception as e:
                 failed_count += 1
@@ -160,6 +177,83 @@ def collect_data_background(years: int = 3, max_pages: int = 10):
     finally:
         collection_status['is_running'] = False
         collection_status['task_id'] = None
+        if collection_token is cancel_token:
+            collection_token = None
+
+@executor.job
+def fill_gaps_background(stock_codes, mode: str = 'market', max_pages: int = 50, cancel_token: CancellationToken = None):
+    """Flask-Executor를 사용한 백그라운드 누락 구간 보충 (진행 상황은 /status로 확인)"""
+    global collection_status, collection_token
+    cancel_token = cancel_token or CancellationToken()
+    
+    try:
+        logger.info(f"백그라운드 누락 구간 보충 시작: {len(stock_codes)}개 종목")
+        success_count = 0
+        failed_count = 0
+        filled = 0
+        spooled = 0
+        progress = 0
+        
+        for i, stock_code in enumerate(stock_codes):
+            if not collection_status['is_running'] or cancel_token.is_cancelled:
+                logger.info("누락 구간 보충이 사용자에 의해 중단되었습니다")
+                break
+            
+            progress = int((i / len(stock_codes)) * 100)
+            stock = StockService.get_stock_by_code(str(stock_code))
+            if not stock:
+                failed_count += 1
+                update_progress('gap_filling', str(stock_code), progress, success_count, failed_count,
+                              failed_stock=f"{stock_code}: 등록되지 않은 주식 코드입니다.")
+                continue
+            
+            update_progress('gap_filling', f"{stock.stock_code} {stock.stock_name}",
+                          progress, success_count, failed_count)
+            try:
+                result = DataCollectorService.fill_gaps(
+                    stock.stock_code, stock.stock_name, mode, max_pages, cancel_token
+                )
+            except OperationCancelled:
+                # 처리 중이던 종목은 실패가 아닌 취소로 보고 (폐기 정책이면 저장하지 않음)
+                logger.info(f"누락 구간 보충이 {stock.stock_code} 처리 중 중단되었습니다 (정책: {cancel_token.policy})")
+                collection_status['cancelled_stock'] = f"{stock.stock_code} {stock.stock_name}"
+                break
+            collection_status['gap_fill_results'].append(result)
+            if result['success']:
+                success_count += 1
+                filled += result['filled_days']
+                spooled += result['spooled_days']
+            else:
+                failed_count += 1
+                update_progress('gap_filling', f"{stock.stock_code} {stock.stock_name}",
+                              progress, success_count, failed_count,
+                              failed_stock=f"{stock.stock_code} {stock.stock_name}: {result.get('error', '')}")
+            
+            # 요청 간 대기 (중단 요청 시 즉시 깨어남)
+            cancel_token.wait(DataCollectorService.REQUEST_DELAY)
+        
+        collection_status['end_time'] = datetime.now().isoformat()
+        if collection_status['is_running'] and not cancel_token.is_cancelled:
+            update_progress('completed', f'누락 구간 보충 완료: {filled}일 보충', 100, success_count, failed_count)
+            logger.info(f"누락 구간 보충 완료: 성공 {success_count}개, 실패 {failed_count}개, {filled}일 보충, {spooled}일 스풀 기록")
+            return {'status': 'completed', 'success_count': success_count, 'failed_count': failed_count,
+                    'filled_days': filled, 'spooled_days': spooled}
+        
+        update_progress('cancelled', '누락 구간 보충 중단됨', progress, success_count, failed_count)
+        return {'status': 'cancelled', 'success_count': success_count, 'failed_count': failed_count,
+                'filled_days': filled, 'spooled_days': spooled}
+        
+    except Exception as e:
+        collection_status['end_time'] = datetime.now().isoformat()
+        update_progress('error', '', 0, 0, 0, f'누락 구간 보충 중 오류: {str(e)}')
+        logger.error(f"누락 구간 보충 중 치명적 오류: {e}")
+        return {'status': 'error', 'message': str(e)}
+    
+    finally:
+        collection_status['is_running'] = False
+        collection_status['task_id'] = None
+        if collection_token is cancel_token:
+            collection_token = None
 
 @collector_bp.route('/status', methods=['GET'])
 @read_only_transaction
@@ -183,8 +277,13 @@ def get_collection_status():
 def start_collection():
     """
     데이터 수집 시작
+    
+    Request Body:
+        years (int, optional): 수집 기간 (1-10년, 기본값: 3)
+        max_pages (int, optional): 최대 페이지 수 (1-50, 기본값: 10)
+        cancel_policy (str, optional): 중단 시 이미 파싱된 데이터 처리 방식 (flush: 저장, discard: 폐기, 기본값: flush)
     """
-    global collection_status
+    global collection_status, collection_token
     
     try:
         if collection_status['is_running']:
@@ -223,6 +322,14 @@ def start_collection():
                 'timestamp': datetime.now().isoformat()
             }), 400
         
+        cancel_policy = data.get('cancel_policy', CancellationToken.FLUSH)
+        if cancel_policy not in CancellationToken.POLICIES:
+            return jsonify({
+                'status': 'error',
+                'error': f"cancel_policy는 {', '.join(CancellationToken.POLICIES)} 중 하나여야 합니다 (입력값: {cancel_policy})",
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
         # 상태 초기화
         collection_status.update({
             'is_running': True,
@@ -233,13 +340,15 @@ def start_collection():
             'success_count': 0,
             'failed_count': 0,
             'failed_stocks': [],
+            'cancelled_stock': None,
             'start_time': datetime.now().isoformat(),
             'end_time': None,
             'error_message': ''
         })
         
         # Flask-Executor로 백그라운드 작업 시작
-        future = collect_data_background.submit(years, max_pages)
+        collection_token = CancellationToken(cancel_policy)
+        future = collect_data_background.submit(years, max_pages, collection_token)
         collection_status['task_id'] = str(id(future))
         
         logger.info(f"데이터 수집 시작: {years}년, {max_pages}페이지, 작업 ID: {collection_status['task_id']}")
@@ -274,8 +383,10 @@ def stop_collection():
                 'timestamp': datetime.now().isoformat()
             }), 400
         
-        # 수집 중단 플래그 설정
+        # 수집 중단 플래그 설정 및 진행 중인 요청 취소
         collection_status['is_running'] = False
+        if collection_token is not None:
+            collection_token.cancel('사용자 중단 요청')
         
         logger.info("데이터 수집 중단 요청")
         
@@ -320,7 +431,9 @@ def reset_collection():
             'end_time': None,
             'error_message': '',
             'task_id': None,
-            'elapsed_time': None
+            'elapsed_time': None,
+            'gap_fill_results': [],
+            'cancelled_stock': None
         }
         
         logger.info("데이터 수집 상태 초기화")
@@ -681,6 +794,303 @@ def get_batch_monitoring():
         }), 500
 
 
+
+@collector_bp.route('/gaps', methods=['GET'])
+@read_only_transaction
+def get_data_gaps():
+    """
+    거래 데이터 누락 구간 조회
+    
+    Query Parameters:
+        stock_code (str, optional): 주식 코드 (없으면 전체 종목)
+        start_date (str, optional): 분석 시작 날짜 (YYYY-MM-DD)
+        end_date (str, optional): 분석 종료 날짜 (YYYY-MM-DD)
+        calendar (str, optional): 거래일 캘린더 모드 (market, weekday, 기본값: market)
+        only_with_gaps (bool, optional): 전체 종목 조회 시 누락이 있는 종목만 반환 (기본값: true)
+        
+    Returns:
+        JSON: 종목별 누락 구간 목록
+    """
+    try:
+        stock_code = request.args.get('stock_code', '').strip()
+        start_date = request.args.get('start_date', '').strip() or None
+        end_date = request.args.get('end_date', '').strip() or None
+        mode = request.args.get('calendar', 'market').strip()
+        only_with_gaps = request.args.get('only_with_gaps', 'true').lower() == 'true'
+        
+        if mode not in GapAnalyzer.CALENDAR_MODES:
+            return jsonify({
+                'status': 'error',
+                'error': f'calendar는 {", ".join(GapAnalyzer.CALENDAR_MODES)} 중 하나여야 합니다.',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        if stock_code:
+            gaps = [GapAnalyzer.analyze_stock(stock_code, start_date, end_date, mode)]
+        else:
+            gaps = GapAnalyzer.analyze_all(start_date, end_date, mode, only_with_gaps)
+        
+        return jsonify({
+            'gaps': gaps,
+            'total_count': len(gaps),
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 404
+    except Exception as e:
+        logger.error(f"누락 구간 조회 실패: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
+@collector_bp.route('/gap-fill', methods=['POST'])
+@safe_transaction
+def fill_data_gaps():
+    """
+    누락 구간 보충 수집 시작 (누락 날짜를 포함하는 페이지만 백그라운드에서 크롤링)
+    
+    Request Body:
+        stock_codes (List[str]): 보충할 주식 코드 목록 (필수)
+        calendar (str): 거래일 캘린더 모드 (선택, 기본값: market)
+        max_pages (int): 수집할 최대 페이지 번호 (선택, 기본값: 50)
+        cancel_policy (str): 중단 시 이미 파싱된 데이터 처리 방식 (선택, flush: 저장, discard: 폐기, 기본값: flush)
+        
+    Returns:
+        JSON: 작업 ID (진행 상황과 종목별 보충 결과는 /status의 gap_fill_results로 확인)
+    """
+    global collection_status, collection_token
+    
+    try:
+        if collection_status['is_running']:
+            return jsonify({
+                'status': 'error',
+                'error': '데이터 수집이 이미 진행 중입니다',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        data = request.get_json() or {}
+        stock_codes = data.get('stock_codes')
+        mode = data.get('calendar', 'market')
+        
+        if not isinstance(stock_codes, list) or len(stock_codes) == 0:
+            return jsonify({
+                'status': 'error',
+                'error': 'stock_codes는 비어있지 않은 배열이어야 합니다.',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        if mode not in GapAnalyzer.CALENDAR_MODES:
+            return jsonify({
+                'status': 'error',
+                'error': f'calendar는 {", ".join(GapAnalyzer.CALENDAR_MODES)} 중 하나여야 합니다.',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        try:
+            max_pages = int(data.get('max_pages', 50))
+        except (ValueError, TypeError):
+            return jsonify({
+                'status': 'error',
+                'error': '페이지 수는 숫자여야 합니다',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        if max_pages < 1 or max_pages > 500:
+            return jsonify({
+                'status': 'error',
+                'error': f'페이지 수는 1-500 사이여야 합니다 (입력값: {max_pages}페이지)',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        cancel_policy = data.get('cancel_policy', CancellationToken.FLUSH)
+        if cancel_policy not in CancellationToken.POLICIES:
+            return jsonify({
+                'status': 'error',
+                'error': f"cancel_policy는 {', '.join(CancellationToken.POLICIES)} 중 하나여야 합니다 (입력값: {cancel_policy})",
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        collection_status.update({
+            'is_running': True,
+            'current_phase': 'gap_filling',
+            'current_stock': '',
+            'progress': 0,
+            'total_stocks': len(stock_codes),
+            'success_count': 0,
+            'failed_count': 0,
+            'failed_stocks': [],
+            'gap_fill_results': [],
+            'cancelled_stock': None,
+            'start_time': datetime.now().isoformat(),
+            'end_time': None,
+            'error_message': ''
+        })
+        
+        # 크롤링은 요청 트랜잭션 밖에서 실행 (중단은 /stop)
+        collection_token = CancellationToken(cancel_policy)
+        future = fill_gaps_background.submit(stock_codes, mode, max_pages, collection_token)
+        collection_status['task_id'] = str(id(future))
+        
+        logger.info(f"누락 구간 보충 시작: {len(stock_codes)}개 종목, 작업 ID: {collection_status['task_id']}")
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'누락 구간 보충이 시작되었습니다: {len(stock_codes)}개 종목',
+            'task_id': collection_status['task_id'],
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"누락 구간 보충 시작 실패: {str(e)}")
+        collection_status['is_running'] = False
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
+
+@collector_bp.route('/digests/mismatches', methods=['GET'])
+@read_only_transaction
+def get_digest_mismatches():
+    """
+    다이제스트가 실제 거래 데이터와 일치하지 않는 종목-월 목록 조회 (종목 코드 순 페이지 단위)
+    
+    Query Parameters:
+        stock_code (str, optional): 주식 코드 (지정하면 해당 종목만)
+        after (str, optional): 이 종목 코드 다음 종목부터 조회 (이전 응답의 next_after)
+        stock_limit (int, optional): 한 번에 비교할 종목 수 (1-500, 기본값: 50)
+        include_missing (bool, optional): 다이제스트가 없는 월도 포함 (기본값: false)
+        
+    Returns:
+        JSON: 불일치 종목-월 목록 (reason: missing_digest, missing_data, changed)과 다음 페이지 시작 종목 코드
+    """
+    try:
+        stock_code = request.args.get('stock_code', '').strip() or None
+        after = request.args.get('after', '').strip() or None
+        stock_limit = request.args.get('stock_limit', 50, type=int)
+        if stock_limit <= 0 or stock_limit > 500:
+            stock_limit = 50
+        include_missing = request.args.get('include_missing', 'false').lower() == 'true'
+        
+        page = DigestService.find_mismatches(stock_code, after, stock_limit, include_missing)
+        
+        return jsonify({
+            'mismatches': page['mismatches'],
+            'total_count': len(page['mismatches']),
+            'stocks_checked': page['stocks_checked'],
+            'next_after': page['next_after'],
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"다이제스트 불일치 조회 실패: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
+@collector_bp.route('/digests/rebuild/<stock_code>', methods=['POST'])
+@safe_transaction
+def rebuild_digests(stock_code):
+    """
+    특정 종목의 월별 다이제스트를 저장된 거래 데이터로부터 다시 계산
+    
+    Args:
+        stock_code (str): 주식 코드
+        
+    Returns:
+        JSON: 재계산 결과
+    """
+    try:
+        if not stock_code or not stock_code.strip():
+            return jsonify({
+                'status': 'error',
+                'error': '주식 코드는 필수입니다.',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        
+        months = DigestService.rebuild(stock_code.strip())
+        
+        return jsonify({
+            'status': 'success',
+            'message': f'{stock_code} 종목의 다이제스트 {months}개월을 다시 계산했습니다.',
+            'stock_code': stock_code,
+            'months': months,
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"다이제스트 재계산 실패: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'stock_code': stock_code,
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
+@collector_bp.route('/spool', methods=['GET'])
+def get_spool_status():
+    """
+    로컬 스풀 상태 조회 (DB 장애 중 기록된 미저장 데이터)
+    
+    Returns:
+        JSON: 세그먼트 수, 대기 중인 바이트 수, DB 장애 상태, 재생 스레드 실행 여부
+    """
+    try:
+        stats = get_spool().stats()
+        stats['timestamp'] = datetime.now().isoformat()
+        return jsonify(stats), 200
+        
+    except Exception as e:
+        logger.error(f"스풀 상태 조회 실패: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
+@collector_bp.route('/spool/replay', methods=['POST'])
+def replay_spool():
+    """
+    로컬 스풀에 기록된 데이터를 즉시 DB에 저장
+    
+    Returns:
+        JSON: 재생 결과 (처리한 세그먼트 수, 저장된 건수, 영향받은 종목)
+    """
+    try:
+        results = get_spool().replay()
+        get_spool().clear_degraded()
+        
+        return jsonify({
+            'status': 'success',
+            'message': f"스풀 세그먼트 {results['segments']}개에서 {results['inserted_rows']}건을 저장했습니다.",
+            'results': results,
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"스풀 재생 실패: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
 # 에러 핸들러
 @collector_bp.errorhandler(404)
 def not_found(error):
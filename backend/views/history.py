@@ -3,11 +3,15 @@
 히스토리 관리 REST API 뷰
 데이터 변경 히스토리와 시스템 로그를 관리하는 API 엔드포인트를 제공합니다.
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from backend.services.history_service import HistoryService
+from backend.services.audit_writer import audit_writer
+from backend.services.history_partition import HistoryPartitionService
+from backend.services.history_archive import HistoryArchiveService
+from backend.services.history_rollup import HistoryRollupService
 from backend.extensions import db
-from backend.models.history import DataHistory, SystemLog
 from backend.utils.transaction import safe_transaction, read_only_transaction
+from backend.utils.projection import serialize
 from datetime import datetime, timedelta
 import logging
 
@@ -18,6 +22,16 @@ logger = logging.getLogger(__name__)
 history_bp = Blueprint('history', __name__, url_prefix='/history')
 
 
+def _page_response(page, limit):
+    """키셋 페이지 응답 본문"""
+    return {
+        'items': [item.to_dict() for item in page.items],
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+        'limit': limit
+    }
+
+
 @history_bp.route('/data', methods=['GET'])
 @read_only_transaction
 def get_data_history():
@@ -32,9 +46,10 @@ def get_data_history():
         end_date (str, optional): 종료 날짜 (YYYY-MM-DD)
         limit (int, optional): 조회 개수 제한 (기본값: 100)
         offset (int, optional): 오프셋 (기본값: 0)
+        cursor (str, optional): 키셋 페이지 커서 (빈 값이면 첫 페이지, 지정 시 offset 무시)
         
     Returns:
-        JSON: 히스토리 목록
+        JSON: 히스토리 목록 (cursor 지정 시 items, next_cursor, prev_cursor)
     """
     try:
         # 쿼리 파라미터 파싱
@@ -66,6 +81,23 @@ def get_data_history():
                     'error': '잘못된 종료 날짜 형식입니다. (YYYY-MM-DD 형식 사용)'
                 }), 400
         
+        # 커서 파라미터가 있으면 키셋 페이지네이션 (빈 값은 첫 페이지)
+        if 'cursor' in request.args:
+            try:
+                page = HistoryService.get_data_history_page(
+                    table_name=table_name,
+                    record_id=record_id,
+                    action=action,
+                    start_date=start_date,
+                    end_date=end_date,
+                    cursor=request.args.get('cursor') or None,
+                    limit=limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            return jsonify(_page_response(page, limit)), 200
+        
         # 히스토리 조회
         history_list = HistoryService.get_data_history(
             table_name=table_name,
@@ -77,7 +109,7 @@ def get_data_history():
             offset=offset
         )
         
-        return jsonify([history.to_dict() for history in history_list]), 200
+        return jsonify([serialize(history) for history in history_list]), 200
         
     except Exception as e:
         logger.error(f"데이터 히스토리 조회 실패: {str(e)}")
@@ -100,9 +132,10 @@ def get_system_logs():
         end_date (str, optional): 종료 날짜 (YYYY-MM-DD)
         limit (int, optional): 조회 개수 제한 (기본값: 100)
         offset (int, optional): 오프셋 (기본값: 0)
+        cursor (str, optional): 키셋 페이지 커서 (빈 값이면 첫 페이지, 지정 시 offset 무시)
         
     Returns:
-        JSON: 시스템 로그 목록
+        JSON: 시스템 로그 목록 (cursor 지정 시 items, next_cursor, prev_cursor)
     """
     try:
         # 쿼리 파라미터 파싱
@@ -133,6 +166,22 @@ def get_system_logs():
                     'error': '잘못된 종료 날짜 형식입니다. (YYYY-MM-DD 형식 사용)'
                 }), 400
         
+        # 커서 파라미터가 있으면 키셋 페이지네이션 (빈 값은 첫 페이지)
+        if 'cursor' in request.args:
+            try:
+                page = HistoryService.get_system_logs_page(
+                    level=level,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    cursor=request.args.get('cursor') or None,
+                    limit=limit
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            return jsonify(_page_response(page, limit)), 200
+        
         # 시스템 로그 조회
         logs = HistoryService.get_system_logs(
             level=level,
@@ -143,7 +192,7 @@ def get_system_logs():
             offset=offset
         )
         
-        return jsonify([log.to_dict() for log in logs]), 200
+        return jsonify([serialize(log) for log in logs]), 200
         
     except Exception as e:
         logger.error(f"시스템 로그 조회 실패: {str(e)}")
@@ -176,7 +225,7 @@ def get_latest_activity():
             limit=limit
         )
         
-        return jsonify([activity.to_dict() for activity in activities]), 200
+        return jsonify([serialize(activity) for activity in activities]), 200
         
     except Exception as e:
         logger.error(f"최근 활동 조회 실패: {str(e)}")
@@ -218,51 +267,13 @@ def get_activity_summary():
 @read_only_transaction
 def get_history_stats():
     """
-    히스토리 통계 조회
+    히스토리 통계 조회 (시간별 집계 테이블 사용, 짧은 TTL 캐시)
     
     Returns:
         JSON: 히스토리 통계 정보
     """
     try:
-        # 전체 통계
-        total_data_history = DataHistory.query.count()
-        total_system_logs = SystemLog.query.count()
-        
-        # 오늘 통계
-        today = datetime.utcnow().date()
-        today_start = datetime.combine(today, datetime.min.time())
-        today_end = datetime.combine(today, datetime.max.time())
-        
-        today_data_history = DataHistory.query.filter(
-            DataHistory.created_at >= today_start,
-            DataHistory.created_at <= today_end
-        ).count()
-        
-        today_system_logs = SystemLog.query.filter(
-            SystemLog.created_at >= today_start,
-            SystemLog.created_at <= today_end
-        ).count()
-        
-        # 작업별 통계
-        action_stats = db.session.query(
-            DataHistory.action,
-            db.func.count(DataHistory.id).label('count')
-        ).group_by(DataHistory.action).all()
-        
-        # 로그 레벨별 통계
-        level_stats = db.session.query(
-            SystemLog.level,
-            db.func.count(SystemLog.id).label('count')
-        ).group_by(SystemLog.level).all()
-        
-        stats = {
-            'total_data_history': total_data_history,
-            'total_system_logs': total_system_logs,
-            'today_data_history': today_data_history,
-            'today_system_logs': today_system_logs,
-            'action_stats': {action: count for action, count in action_stats},
-            'level_stats': {level: count for level, count in level_stats}
-        }
+        stats = HistoryRollupService.get_stats()
         
         return jsonify(stats), 200
         
@@ -280,6 +291,9 @@ def clear_old_history():
     """
     오래된 히스토리 삭제
     
+    월별 파티션 테이블이면 보존 기간 이전 파티션을 통째로 제거하고,
+    경계 달의 남은 행만 청크 단위로 삭제합니다.
+    
     Query Parameters:
         days (int, optional): 삭제할 일수 (기본값: 30)
         type (str, optional): 삭제할 타입 (data, system, all)
@@ -294,26 +308,23 @@ def clear_old_history():
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
         deleted_count = 0
+        dropped_partitions = []
         
+        tables = []
         if clear_type in ['data', 'all']:
-            # 오래된 데이터 히스토리 삭제
-            data_deleted = DataHistory.query.filter(
-                DataHistory.created_at < cutoff_date
-            ).delete()
-            deleted_count += data_deleted
-        
+            tables.append('data_history')
         if clear_type in ['system', 'all']:
-            # 오래된 시스템 로그 삭제
-            system_deleted = SystemLog.query.filter(
-                SystemLog.created_at < cutoff_date
-            ).delete()
-            deleted_count += system_deleted
+            tables.append('system_log')
         
-        db.session.commit()
+        for table in tables:
+            result = HistoryPartitionService.apply_retention(table, cutoff_date)
+            deleted_count += result['deleted_rows']
+            dropped_partitions.extend(result['dropped_partitions'])
         
         return jsonify({
             'message': f'{days}일 이전의 히스토리가 삭제되었습니다.',
             'deleted_count': deleted_count,
+            'dropped_partitions': dropped_partitions,
             'cutoff_date': cutoff_date.isoformat()
         }), 200
         
@@ -326,6 +337,122 @@ def clear_old_history():
         }), 500
 
 
+@history_bp.route('/archive', methods=['GET'])
+@read_only_transaction
+def get_history_archives():
+    """
+    히스토리 아카이브 목록 조회
+    
+    Query Parameters:
+        table_name (str, optional): 원본 테이블명 필터 (data_history, system_log)
+        
+    Returns:
+        JSON: 아카이브 매니페스트 목록
+    """
+    try:
+        archives = HistoryArchiveService.list_archives(request.args.get('table_name'))
+        return jsonify([archive.to_dict() for archive in archives]), 200
+        
+    except Exception as e:
+        logger.error(f"히스토리 아카이브 목록 조회 실패: {str(e)}")
+        return jsonify({
+            'error': '히스토리 아카이브 목록을 조회하는데 실패했습니다.',
+            'message': str(e)
+        }), 500
+
+
+@history_bp.route('/archive', methods=['POST'])
+def archive_old_history():
+    """
+    오래된 히스토리를 압축 파일로 아카이브 (월별 파일, 월마다 커밋)
+    
+    Query Parameters:
+        days (int, optional): 이 일수가 지난 행을 아카이브 (기본값: HISTORY_ARCHIVE['archive_after_days'])
+        type (str, optional): 아카이브할 타입 (data, system, all)
+        
+    Returns:
+        JSON: 아카이브 결과
+    """
+    try:
+        default_days = current_app.config.get('HISTORY_ARCHIVE', {}).get('archive_after_days', 90)
+        days = request.args.get('days', default_days, type=int)
+        archive_type = request.args.get('type', 'all')
+        
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        
+        tables = []
+        if archive_type in ['data', 'all']:
+            tables.append('data_history')
+        if archive_type in ['system', 'all']:
+            tables.append('system_log')
+        
+        archives = []
+        archived_rows = 0
+        for table in tables:
+            result = HistoryArchiveService.archive(table, cutoff_date)
+            archives.extend(result['archives'])
+            archived_rows += result['archived_rows']
+        
+        return jsonify({
+            'message': f'{days}일 이전의 히스토리가 아카이브되었습니다.',
+            'archived_rows': archived_rows,
+            'archives': archives,
+            'cutoff_date': cutoff_date.isoformat()
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"히스토리 아카이브 실패: {str(e)}")
+        return jsonify({
+            'error': '히스토리 아카이브에 실패했습니다.',
+            'message': str(e)
+        }), 500
+
+
+@history_bp.route('/rollup/rebuild', methods=['POST'])
+@safe_transaction
+def rebuild_history_rollup():
+    """
+    시간별 집계를 히스토리 테이블로부터 다시 계산 (최초 적용 또는 수동 수정 후)
+    
+    Query Parameters:
+        days (int, optional): 최근 N일만 다시 계산 (없으면 전체)
+        
+    Returns:
+        JSON: 생성된 집계 행 수
+    """
+    try:
+        days = request.args.get('days', type=int)
+        start = datetime.utcnow() - timedelta(days=days) if days else None
+        
+        rows = HistoryRollupService.rebuild(start)
+        db.session.commit()
+        
+        return jsonify({
+            'message': '히스토리 집계를 다시 계산했습니다.',
+            'rollup_rows': rows
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"히스토리 집계 재계산 실패: {str(e)}")
+        return jsonify({
+            'error': '히스토리 집계 재계산에 실패했습니다.',
+            'message': str(e)
+        }), 500
+
+
+@history_bp.route('/writer', methods=['GET'])
+def get_audit_writer_stats():
+    """
+    감사 로그 비동기 기록기 상태 조회
+    
+    Returns:
+        JSON: 큐 크기, 저장/버림/실패 건수
+    """
+    return jsonify(audit_writer.stats()), 200
+
+
 # 에러 핸들러
 @history_bp.errorhandler(404)
 def not_found(error):
@@ -7,6 +7,11 @@ from flask import Blueprint, jsonify, request
 from backend.services.stock_service import StockService
 from backend.services.stock_list_collector import StockListCollectorService
 from backend.utils.transaction import safe_transaction, read_only_transaction
+from backend.utils.conditional import versioned_etag, path_stock_code
+from backend.services.data_version import DataVersionService
+from backend.services.stock_cache import stock_cache
+from backend.utils.projection import parse_fields, serialize
+from backend.models.stock import StockList
 import logging
 from datetime import datetime
 from backend.extensions import db
@@ -21,12 +26,33 @@ logger = logging.getLogger(__name__)
 stock_bp = Blueprint('stock', __name__, url_prefix='/stocks')
 
 
+def _request_fields():
+    """
+    fields 쿼리 파라미터 파싱 (예: fields=stock_code,stock_name)
+    
+    Raises:
+        ValueError: 알 수 없는 필드가 포함된 경우
+    """
+    return parse_fields(request.args.get('fields'), StockList)
+
+
+def _validation_error(e):
+    return jsonify({
+        'error': str(e),
+        'type': 'validation_error'
+    }), 400
+
+
 @stock_bp.route('/', methods=['GET'])
 @read_only_transaction
+@versioned_etag(DataVersionService.STOCK_LIST)
 def list_stocks():
     """
     주식 목록 조회
     
+    Query Parameters:
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: stock_code,stock_name). 지정한 컬럼만 SELECT
+    
     Returns:
         JSON: 주식 목록 배열
         
@@ -35,8 +61,12 @@ def list_stocks():
         Response: [{"id": 1, "stock_code": "005930", "stock_name": "삼성전자", "init_date": "2024-01-01", "institution_accum_init": 0, "foreigner_accum_init": 0}]
     """
     try:
-        stocks = StockService.get_all_stocks()
-        return jsonify([stock.to_dict() for stock in stocks]), 200
+        fields = _request_fields()
+        stocks = StockService.get_all_stocks(fields)
+        return jsonify([serialize(stock, fields) for stock in stocks]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"주식 목록 조회 실패: {str(e)}")
@@ -48,6 +78,7 @@ def list_stocks():
 
 @stock_bp.route('/<int:stock_id>', methods=['GET'])
 @read_only_transaction
+@versioned_etag(DataVersionService.STOCK_LIST)
 def get_stock(stock_id):
     """
     특정 주식 조회
@@ -55,6 +86,9 @@ def get_stock(stock_id):
     Args:
         stock_id (int): 주식 ID
         
+    Query Parameters:
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: stock_code,stock_name)
+        
     Returns:
         JSON: 주식 정보 또는 에러 메시지
         
@@ -78,7 +112,10 @@ def get_stock(stock_id):
                 'stock_id': stock_id
             }), 404
             
-        return jsonify(stock.to_dict()), 200
+        return jsonify(serialize(stock, _request_fields())), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"주식 조회 실패 (ID: {stock_id}): {str(e)}")
@@ -90,6 +127,7 @@ def get_stock(stock_id):
 
 @stock_bp.route('/code/<string:stock_code>', methods=['GET'])
 @read_only_transaction
+@versioned_etag(DataVersionService.STOCK_LIST, path_stock_code)
 def get_stock_by_code(stock_code):
     """
     주식 코드로 주식 조회
@@ -97,6 +135,9 @@ def get_stock_by_code(stock_code):
     Args:
         stock_code (str): 주식 코드
         
+    Query Parameters:
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: stock_code,stock_name)
+        
     Returns:
         JSON: 주식 정보 또는 에러 메시지
         
@@ -120,7 +161,10 @@ def get_stock_by_code(stock_code):
                 'stock_code': stock_code
             }), 404
             
-        return jsonify(stock.to_dict()), 200
+        return jsonify(serialize(stock, _request_fields())), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"주식 조회 실패 (Code: {stock_code}): {str(e)}")
@@ -408,13 +452,15 @@ def delete_stock_api(stock_id):
 
 @stock_bp.route('/search', methods=['GET'])
 @read_only_transaction
+@versioned_etag(DataVersionService.STOCK_LIST)
 def search_stocks():
     """
     주식 검색
     
     Query Parameters:
-        name (str): 검색할 주식명 (부분 일치)
+        name (str): 검색할 주식명 (부분 일치, 초성 가능. 예: ㅅㅅㅈㅈ. 일치 순위 순)
         code (str): 검색할 주식 코드 (부분 일치)
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: stock_code,stock_name). 지정한 컬럼만 SELECT
         
     Returns:
         JSON: 검색된 주식 목록
@@ -434,16 +480,21 @@ def search_stocks():
                 'parameters': ['name', 'code']
             }), 400
         
+        fields = _request_fields()
+        
         stocks = []
         if name:
-            stocks.extend(StockService.search_stocks_by_name(name))
+            stocks.extend(StockService.search_stocks_by_name(name, fields))
         if code:
-            code_stocks = StockService.search_stocks_by_code(code)
+            code_stocks = StockService.search_stocks_by_code(code, fields)
             # 중복 제거
             existing_ids = {stock.id for stock in stocks}
             stocks.extend([stock for stock in code_stocks if stock.id not in existing_ids])
         
-        return jsonify([stock.to_dict() for stock in stocks]), 200
+        return jsonify([serialize(stock, fields) for stock in stocks]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"주식 검색 실패 (name: {name}, code: {code}): {str(e)}")
@@ -1029,7 +1080,7 @@ def upload_excel_stocks():
                     continue
                 
                 # 기존 주식 확인
-                existing_stock = StockService.get_stock_by_code(stock_code)
+                existing_stock = StockService.get_stock_by_code(stock_code, for_update=True)
                 
                 if existing_stock:
                     # 기존 주식 업데이트
@@ -1113,7 +1164,10 @@ def upload_excel_stocks():
                 })
                 logger.error(f"엑셀 행 처리 실패 (행 {index + 1}): {e}")
         
-        # 트랜잭션 커밋
+        # 트랜잭션 커밋 (생성은 StockService에서 버전 증가, 직접 수정한 종목만 여기서 증가)
+        if results['update_list']:
+            DataVersionService.bump(DataVersionService.STOCK_LIST, [item['stock_code'] for item in results['update_list']])
+            stock_cache.mark_changed()
         db.session.commit()
         
         logger.info(f"엑셀 파일 업로드 완료: 총 {results['total_rows']}행, 성공 {results['success_count']}개, 업데이트 {results['update_count']}개, 생성 {results['create_count']}개, 실패 {results['failed_count']}개")
@@ -3,9 +3,18 @@
 Stock Investor Trading REST API 뷰
 주식 투자자별 거래 데이터에 대한 CRUD API 엔드포인트를 제공합니다.
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from backend.services.trading_service import TradingService
 from backend.utils.transaction import safe_transaction, read_only_transaction
+from backend.utils.conditional import versioned_etag, path_stock_code, query_stock_code
+from backend.services.data_version import DataVersionService
+from backend.services.result_cache import result_cache
+from backend.utils.single_flight import single_flight
+from backend.utils.workload import workload
+from backend.utils.streaming import stream_response
+from backend.utils.columnar import ARROW_MIMETYPE, arrow_stream, to_columnar
+from backend.utils.projection import parse_fields, serialize
+from backend.models.trading import StockInvestorTrading
 import logging
 
 # 로거 설정
@@ -15,22 +24,121 @@ logger = logging.getLogger(__name__)
 trading_bp = Blueprint('trading', __name__, url_prefix='/trading')
 
 
+def _request_fields():
+    """
+    fields 쿼리 파라미터 파싱 (예: fields=trade_date,close_price)
+    
+    Raises:
+        ValueError: 알 수 없는 필드가 포함된 경우
+    """
+    return parse_fields(request.args.get('fields'), StockInvestorTrading)
+
+
+def _cursor_page_response(fields=None, **filters):
+    """
+    키셋 페이지 응답 (cursor 쿼리 파라미터가 있을 때 사용, 빈 값은 첫 페이지)
+    
+    Raises:
+        ValueError: 입력값 또는 커서가 올바르지 않은 경우
+    """
+    page = TradingService.get_trading_data_page(
+        cursor=request.args.get('cursor') or None,
+        limit=request.args.get('limit', type=int),
+        fields=fields,
+        **filters
+    )
+    return jsonify({
+        'items': [serialize(data, fields) for data in page.items],
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+        'total_estimate': page.total_estimate
+    }), 200
+
+
+def _stream_rows_response(fields=None, **filters):
+    """
+    스트리밍 응답 (stream 쿼리 파라미터가 있을 때 사용: json 또는 ndjson)
+    
+    Raises:
+        ValueError: 입력값 또는 스트리밍 형식이 올바르지 않은 경우
+    """
+    fmt = request.args.get('stream', 'json').strip().lower() or 'json'
+    return stream_response(TradingService.iter_trading_rows(fields=fields, **filters), fmt)
+
+
+def _bucketed_response(fields=None, **filters):
+    """
+    차트용 구간 집계 응답 (bucket 쿼리 파라미터가 있을 때 사용: week, month, auto)
+    
+    Raises:
+        ValueError: 입력값 또는 구간 단위가 올바르지 않거나 cursor / stream과 함께 지정한 경우
+    """
+    if 'cursor' in request.args or 'stream' in request.args:
+        raise ValueError("bucket은 cursor 또는 stream과 함께 사용할 수 없습니다.")
+    rows = TradingService.get_trading_data_bucketed(
+        bucket=request.args.get('bucket', '').strip().lower(),
+        max_points=request.args.get('max_points', type=int),
+        **filters
+    )
+    if fields:
+        rows = [{name: row[name] for name in fields if name in row} for row in rows]
+    return jsonify(rows), 200
+
+
+def _validation_error(e):
+    return jsonify({
+        'error': str(e),
+        'type': 'validation_error'
+    }), 400
+
+
 @trading_bp.route('/', methods=['GET'])
+@workload.resource_class('heavy')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING)
 def list_trading_data():
     """
     거래 데이터 목록 조회
     
+    Query Parameters:
+        cursor (str): 키셋 페이지 커서 (선택, 빈 값이면 첫 페이지). 지정하면 페이지 단위로 응답
+        stream (str): 스트리밍 응답 형식 (선택, json 또는 ndjson). 지정하면 전체 결과를 청크 전송
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price). 지정한 컬럼만 SELECT
+        limit (int): 페이지 크기 (선택, 기본값: 500, 최대 5000)
+    
     Returns:
-        JSON: 거래 데이터 목록 배열
+        JSON: 첫 페이지(최신순 최대 limit건)의 거래 데이터 배열, 다음 페이지 커서는 X-Next-Cursor 헤더
+              (cursor 지정 시 items, next_cursor, prev_cursor, total_estimate / 전체가 필요하면 stream 사용)
         
     Example:
         GET /trading/
         Response: [{"id": 1, "stock_code": "005930", "stock_name": "삼성전자", "trade_date": "2024-01-01", "close_price": 70000, ...}]
+        Headers: X-Next-Cursor: eyJrIjpb...
+        
+        GET /trading/?cursor=&limit=100
+        Response: {"items": [...], "next_cursor": "eyJrIjpb...", "prev_cursor": null, "total_estimate": 735000}
     """
     try:
-        trading_data = TradingService.get_all_trading_data()
-        return jsonify([data.to_dict() for data in trading_data]), 200
+        fields = _request_fields()
+        
+        if 'stream' in request.args:
+            return _stream_rows_response(fields)
+        
+        if 'cursor' in request.args:
+            return _cursor_page_response(fields)
+        
+        # 전체 테이블을 한 번에 읽지 않도록 첫 키셋 페이지만 배열로 응답 (기존 응답 형식 유지)
+        page = TradingService.get_trading_data_page(
+            cursor=None,
+            limit=request.args.get('limit', type=int),
+            include_total=False,
+            fields=fields
+        )
+        headers = {'X-Next-Cursor': page.next_cursor} if page.next_cursor else {}
+        return jsonify([serialize(data, fields) for data in page.items]), 200, headers
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"거래 데이터 목록 조회 실패: {str(e)}")
@@ -41,6 +149,7 @@ def list_trading_data():
 
 
 @trading_bp.route('/<int:trading_id>', methods=['GET'])
+@workload.resource_class('interactive')
 @read_only_transaction
 def get_trading_data(trading_id):
     """
@@ -49,6 +158,9 @@ def get_trading_data(trading_id):
     Args:
         trading_id (int): 거래 데이터 ID
         
+    Query Parameters:
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price)
+        
     Returns:
         JSON: 거래 데이터 정보 또는 에러 메시지
         
@@ -72,7 +184,10 @@ def get_trading_data(trading_id):
                 'trading_id': trading_id
             }), 404
             
-        return jsonify(trading_data.to_dict()), 200
+        return jsonify(serialize(trading_data, _request_fields())), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"거래 데이터 조회 실패 (ID: {trading_id}): {str(e)}")
@@ -83,7 +198,9 @@ def get_trading_data(trading_id):
 
 
 @trading_bp.route('/stock/<string:stock_code>', methods=['GET'])
+@workload.resource_class('interactive')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING, path_stock_code)
 def get_trading_data_by_stock_code(stock_code):
     """
     주식 코드로 거래 데이터 조회
@@ -91,8 +208,14 @@ def get_trading_data_by_stock_code(stock_code):
     Args:
         stock_code (str): 주식 코드
         
+    Query Parameters:
+        cursor (str): 키셋 페이지 커서 (선택, 빈 값이면 첫 페이지). 지정하면 페이지 단위로 응답
+        stream (str): 스트리밍 응답 형식 (선택, json 또는 ndjson). 지정하면 전체 결과를 청크 전송
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price). 지정한 컬럼만 SELECT
+        limit (int): 페이지 크기 (선택, cursor 지정 시, 기본값: 500, 최대 5000)
+        
     Returns:
-        JSON: 거래 데이터 목록 또는 에러 메시지
+        JSON: 거래 데이터 목록 또는 에러 메시지 (cursor 지정 시 items, next_cursor, prev_cursor, total_estimate)
         
     Example:
         GET /trading/stock/005930
@@ -106,9 +229,20 @@ def get_trading_data_by_stock_code(stock_code):
                 'stock_code': stock_code
             }), 400
         
-        trading_data = TradingService.get_trading_data_by_stock_code(stock_code.strip())
+        fields = _request_fields()
+        
+        if 'stream' in request.args:
+            return _stream_rows_response(fields, stock_code=stock_code.strip())
+        
+        if 'cursor' in request.args:
+            return _cursor_page_response(fields, stock_code=stock_code.strip())
+        
+        trading_data = TradingService.get_trading_data_by_stock_code(stock_code.strip(), fields)
         
-        return jsonify([data.to_dict() for data in trading_data]), 200
+        return jsonify([serialize(data, fields) for data in trading_data]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"거래 데이터 조회 실패 (Code: {stock_code}): {str(e)}")
@@ -119,7 +253,9 @@ def get_trading_data_by_stock_code(stock_code):
 
 
 @trading_bp.route('/date-range', methods=['GET'])
+@workload.resource_class('heavy')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING, query_stock_code)
 def get_trading_data_by_date_range():
     """
     날짜 범위로 거래 데이터 조회 (인덱스 최적화)
@@ -128,13 +264,22 @@ def get_trading_data_by_date_range():
         start_date (str): 시작 날짜 (YYYY-MM-DD, 필수)
         end_date (str): 종료 날짜 (YYYY-MM-DD, 필수)
         stock_code (str): 주식 코드 (선택)
+        cursor (str): 키셋 페이지 커서 (선택, 빈 값이면 첫 페이지). 지정하면 페이지 단위로 응답
+        stream (str): 스트리밍 응답 형식 (선택, json 또는 ndjson). 지정하면 전체 결과를 청크 전송
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price). 지정한 컬럼만 SELECT
+        limit (int): 페이지 크기 (선택, cursor 지정 시, 기본값: 500, 최대 5000)
+        bucket (str): 차트용 구간 집계 (선택, week, month, auto). 종가·누적은 구간 마지막 값, 순매수는 합계
+        max_points (int): bucket=auto일 때 종목당 최대 점 수 (선택, 기본값: 500, 최대 5000)
         
     Returns:
-        JSON: 거래 데이터 목록
+        JSON: 거래 데이터 목록 (cursor 지정 시 items, next_cursor, prev_cursor, total_estimate)
         
     Example:
         GET /trading/date-range?start_date=2024-01-01&end_date=2024-01-31&stock_code=005930
         Response: [{"id": 1, "stock_code": "005930", "trade_date": "2024-01-01", ...}]
+        
+        GET /trading/date-range?start_date=2015-01-01&end_date=2024-12-31&stock_code=005930&bucket=auto&max_points=300
+        Response: [{"bucket": "2024-12-20", "trade_date": "2024-12-30", "close_price": 53000, "institution_net_buy": 1200, "row_count": 7, ...}]
     """
     try:
         start_date = request.args.get('start_date', '').strip()
@@ -148,11 +293,25 @@ def get_trading_data_by_date_range():
                 'format': 'YYYY-MM-DD'
             }), 400
         
+        fields = _request_fields()
+        
+        if 'bucket' in request.args:
+            return _bucketed_response(fields, stock_code=stock_code, start_date=start_date, end_date=end_date)
+        
+        if 'stream' in request.args:
+            return _stream_rows_response(fields, stock_code=stock_code, start_date=start_date, end_date=end_date)
+        
+        if 'cursor' in request.args:
+            return _cursor_page_response(fields, stock_code=stock_code, start_date=start_date, end_date=end_date)
+        
         trading_data = TradingService.get_trading_data_by_date_range(
-            start_date, end_date, stock_code
+            start_date, end_date, stock_code, fields
         )
         
-        return jsonify([data.to_dict() for data in trading_data]), 200
+        return jsonify([serialize(data, fields) for data in trading_data]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"날짜 범위 거래 데이터 조회 실패: {str(e)}")
@@ -162,7 +321,9 @@ def get_trading_data_by_date_range():
         }), 500
 
 @trading_bp.route('/stock-date-range', methods=['GET'])
+@workload.resource_class('interactive')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING, query_stock_code)
 def get_trading_data_by_stock_date_range():
     """
     특정 종목의 날짜 범위 거래 데이터 조회 (고성능)
@@ -174,9 +335,16 @@ def get_trading_data_by_stock_date_range():
         include_price (bool): 종가 포함 여부 (기본값: true)
         include_institution (bool): 기관 데이터 포함 여부 (기본값: true)
         include_foreigner (bool): 외국인 데이터 포함 여부 (기본값: true)
+        format (str): 응답 형식 (선택, 기본값: json)
+            json: 행 객체 배열
+            columnar: 필드별 배열 ({"stock_code", "stock_name", "count", "columns": {"trade_date": [...], ...}})
+            arrow: Arrow IPC 스트림 (application/vnd.apache.arrow.stream, pyarrow 필요)
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 지정 시 include_* 대신 사용)
+        bucket (str): 차트용 구간 집계 (선택, week, month, auto, format=json에서만 사용)
+        max_points (int): bucket=auto일 때 최대 점 수 (선택, 기본값: 500, 최대 5000)
         
     Returns:
-        JSON: 거래 데이터 목록
+        JSON: 거래 데이터 목록 (format에 따라 컬럼형 JSON 또는 Arrow IPC 스트림)
         
     Example:
         GET /trading/stock-date-range?stock_code=005930&start_date=2024-01-01&end_date=2024-01-31&include_price=true&include_institution=true&include_foreigner=false
@@ -205,11 +373,50 @@ def get_trading_data_by_stock_date_range():
                 'format': 'YYYY-MM-DD'
             }), 400
         
+        response_format = request.args.get('format', 'json').strip().lower()
+        if response_format not in ('json', 'columnar', 'arrow'):
+            return jsonify({
+                'error': f'지원하지 않는 응답 형식입니다: {response_format}',
+                'supported_formats': ['json', 'columnar', 'arrow']
+            }), 400
+        
+        fields = _request_fields()
+        
+        if 'bucket' in request.args:
+            if response_format != 'json':
+                raise ValueError("bucket은 format=json에서만 사용할 수 있습니다.")
+            return _bucketed_response(fields, stock_code=stock_code, start_date=start_date, end_date=end_date)
+        
+        if response_format != 'json':
+            metadata, columns, batches = TradingService.get_stock_date_range_series(
+                stock_code, start_date, end_date, include_price, include_institution, include_foreigner,
+                fields=fields
+            )
+            if response_format == 'arrow':
+                return Response(stream_with_context(arrow_stream(columns, batches, metadata)), mimetype=ARROW_MIMETYPE)
+            
+            data = to_columnar(columns, batches)
+            return jsonify({
+                **metadata,
+                'count': len(next(iter(data.values()), [])),
+                'columns': data
+            }), 200
+        
         trading_data = TradingService.get_trading_data_by_stock_date_range(
-            stock_code, start_date, end_date, include_price, include_institution, include_foreigner
+            stock_code, start_date, end_date, include_price, include_institution, include_foreigner, fields
         )
         
-        return jsonify([data.to_dict() for data in trading_data]), 200
+        # include_* / fields로 컬럼을 좁히면 Row 튜플이 반환되므로 직접 직렬화
+        return jsonify([serialize(data, fields) for data in trading_data]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
+        
+    except ImportError as e:
+        return jsonify({
+            'error': str(e),
+            'type': 'unsupported_format'
+        }), 501
         
     except Exception as e:
         logger.error(f"종목별 날짜 범위 거래 데이터 조회 실패: {str(e)}")
@@ -219,7 +426,9 @@ def get_trading_data_by_stock_date_range():
         }), 500
 
 @trading_bp.route('/date-range-optimized', methods=['GET'])
+@workload.resource_class('heavy')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING)
 def get_trading_data_by_date_range_optimized():
     """
     날짜 범위 거래 데이터 조회 (페이징 지원, 고성능)
@@ -229,13 +438,19 @@ def get_trading_data_by_date_range_optimized():
         end_date (str): 종료 날짜 (YYYY-MM-DD, 필수)
         limit (int): 조회할 레코드 수 제한 (선택, 기본값: 1000)
         offset (int): 건너뛸 레코드 수 (선택, 기본값: 0)
+        cursor (str): 키셋 페이지 커서 (선택, 빈 값이면 첫 페이지). 지정하면 offset 대신 커서 기준으로 조회
+        stream (str): 스트리밍 응답 형식 (선택, json 또는 ndjson). 지정하면 limit/offset 없이 전체 범위를 청크 전송
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price). 지정한 컬럼만 SELECT
         
     Returns:
-        JSON: 거래 데이터 목록
+        JSON: 거래 데이터 목록 (cursor 지정 시 items, next_cursor, prev_cursor, total_estimate)
         
     Example:
         GET /trading/date-range-optimized?start_date=2024-01-01&end_date=2024-01-31&limit=100&offset=0
         Response: [{"id": 1, "stock_code": "005930", "trade_date": "2024-01-01", ...}]
+        
+        GET /trading/date-range-optimized?start_date=2021-01-01&end_date=2024-12-31&limit=1000&cursor=
+        Response: {"items": [...], "next_cursor": "eyJrIjpb...", "prev_cursor": null, "total_estimate": 48000}
     """
     try:
         start_date = request.args.get('start_date', '').strip()
@@ -263,11 +478,22 @@ def get_trading_data_by_date_range_optimized():
                 'format': 'YYYY-MM-DD'
             }), 400
         
+        fields = _request_fields()
+        
+        if 'stream' in request.args:
+            return _stream_rows_response(fields, start_date=start_date, end_date=end_date)
+        
+        if 'cursor' in request.args:
+            return _cursor_page_response(fields, start_date=start_date, end_date=end_date)
+        
         trading_data = TradingService.get_trading_data_by_date_range_optimized(
-            start_date, end_date, limit, offset
+            start_date, end_date, limit, offset, fields
         )
         
-        return jsonify([data.to_dict() for data in trading_data]), 200
+        return jsonify([serialize(data, fields) for data in trading_data]), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"최적화된 날짜 범위 거래 데이터 조회 실패: {str(e)}")
@@ -277,6 +503,98 @@ def get_trading_data_by_date_range_optimized():
         }), 500
 
 
+@trading_bp.route('/batch', methods=['POST'])
+@workload.resource_class('heavy')
+@read_only_transaction
+def get_trading_data_batch():
+    """
+    여러 종목의 날짜 범위 거래 데이터 일괄 조회 (단일 쿼리)
+    
+    Request Body:
+        {
+            "stock_codes": ["005930", "000660"],  // 필수 (최대 100개)
+            "start_date": "2024-01-01",          // 필수
+            "end_date": "2024-12-31",            // 필수
+            "fields": ["trade_date", "close_price"],  // 선택 (배열 또는 콤마 구분 문자열)
+            "align": false                       // 선택, true면 공통 날짜 축에 맞춘 필드별 배열
+        }
+        
+    Returns:
+        JSON: 종목 코드별 거래 데이터 (align이면 dates와 series)
+        
+    Example:
+        POST /trading/batch
+        Response: {"start_date": "2024-01-01", "end_date": "2024-12-31", "count": 490, "stock_names": {"005930": "삼성전자", ...},
+                   "missing": [], "data": {"005930": [{"trade_date": "2024-12-30", "close_price": 53000}, ...], ...}}
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({
+                'error': '요청 데이터가 없습니다.',
+                'required_fields': ['stock_codes', 'start_date', 'end_date']
+            }), 400
+        
+        stock_codes = data.get('stock_codes')
+        start_date = str(data.get('start_date') or '').strip()
+        end_date = str(data.get('end_date') or '').strip()
+        
+        if not isinstance(stock_codes, list) or not stock_codes:
+            return jsonify({
+                'error': '주식 코드 목록(stock_codes)은 필수입니다.',
+                'required_fields': ['stock_codes']
+            }), 400
+        
+        if not start_date or not end_date:
+            return jsonify({
+                'error': '시작 날짜와 종료 날짜는 필수입니다.',
+                'required_fields': ['start_date', 'end_date'],
+                'format': 'YYYY-MM-DD'
+            }), 400
+        
+        raw_fields = data.get('fields')
+        if isinstance(raw_fields, list):
+            raw_fields = ','.join(str(name) for name in raw_fields)
+        fields = parse_fields(raw_fields, StockInvestorTrading)
+        
+        result = TradingService.get_trading_data_batch(
+            [str(code) for code in stock_codes], start_date, end_date, fields, bool(data.get('align', False))
+        )
+        return jsonify(result), 200
+        
+    except ValueError as e:
+        return _validation_error(e)
+        
+    except Exception as e:
+        logger.error(f"다중 종목 거래 데이터 조회 실패: {str(e)}")
+        return jsonify({
+            'error': '거래 데이터를 조회하는데 실패했습니다.',
+            'message': str(e)
+        }), 500
+
+
+@trading_bp.route('/cache/stats', methods=['GET'])
+def get_result_cache_stats():
+    """
+    조회 결과 캐시와 동일 조회 합치기 상태 조회 (이 워커 기준)
+    
+    Returns:
+        JSON: 저장소, 적중/미스/저장/오류/무효화 횟수, 적중률, single_flight (진행 중 / 리더 / 결과 공유 / 대기 시간 초과)
+    """
+    return jsonify({**result_cache.stats(), 'single_flight': single_flight.stats()}), 200
+
+
+@trading_bp.route('/workload', methods=['GET'])
+def get_workload_stats():
+    """
+    리소스 클래스별 동시 실행 / 대기 / 거절 상태 조회 (이 워커 기준)
+    
+    Returns:
+        JSON: 클래스명 -> 실행 / 대기 수, 입장 / 대기 / 거절 / 대기 시간 초과 / statement_timeout 횟수
+    """
+    return jsonify(workload.stats()), 200
+
+
 @trading_bp.route('/', methods=['POST'])
 @safe_transaction
 def create_trading_data_api():
@@ -624,14 +942,18 @@ def delete_trading_data_api(trading_id):
 
 
 @trading_bp.route('/search', methods=['GET'])
+@workload.resource_class('heavy')
 @read_only_transaction
+@versioned_etag(DataVersionService.TRADING, extra_tables=(DataVersionService.STOCK_LIST,))
 def search_trading_data():
     """
     거래 데이터 검색
     
     Query Parameters:
-        query (str): 검색할 주식 코드 또는 주식명 (부분 일치)
+        query (str): 검색할 주식 코드 또는 주식명 (부분 일치, 초성 가능. 예: ㅅㅅㅂㅇ)
         name (str): 검색할 주식명 (부분 일치) - 하위 호환성을 위해 유지
+        fields (str): 응답에 포함할 필드 (선택, 콤마 구분, 예: trade_date,close_price). 지정한 컬럼만 SELECT
+        limit (int): 최대 행 수 (기본값: 1000, 최대 10000)
         
     Returns:
         JSON: 검색된 거래 데이터 목록
@@ -655,13 +977,21 @@ def search_trading_data():
                 'parameters': ['query', 'name']
             }), 400
         
+        fields = _request_fields()
+        limit = request.args.get('limit', type=int)
+        if limit is not None and limit <= 0:
+            raise ValueError("limit은 1 이상이어야 합니다.")
+        
         # query 파라미터가 있으면 코드/이름 모두 검색, name 파라미터면 이름만 검색
         if query:
-            trading_data = TradingService.search_trading_data_by_query(search_term)
+            trading_data = TradingService.search_trading_data_by_query(search_term, fields, limit)
         else:
-            trading_data = TradingService.search_trading_data_by_name(search_term)
+            trading_data = TradingService.search_trading_data_by_name(search_term, fields, limit)
+        
+        return jsonify([serialize(data, fields) for data in trading_data]), 200
         
-        return jsonify([data.to_dict() for data in trading_data]), 200
+    except ValueError as e:
+        return _validation_error(e)
         
     except Exception as e:
         logger.error(f"거래 데이터 검색 실패 (query: {search_term}): {str(e)}")